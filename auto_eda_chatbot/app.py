@@ -9,14 +9,18 @@ import pandas as pd
 import numpy as np
 
 import os
+import itertools
+import uuid
 from datetime import datetime
 import io
 
 # Import custom modules
-from chat.qa_engine import answer_question, load_dataset
+from chat.qa_engine import answer_question, load_dataset, DEFAULT_CHUNKSIZE, SAMPLING_POLICIES
+from utils.dataset_cache import load_bytes_cached, load_path_cached
 from eda.visualizer import show_charts
+from eda.stats import get_dataset_stats
 from auth import init_session, is_authenticated, show_login_page, show_logout_button, get_current_user
-from pdf_generator import generate_pdf_report, get_pdf_bytes
+from report_jobs import FINISHED_STATES, get_report_queue
 
 # ═════════════════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION - MODERN DESIGN
@@ -567,6 +571,68 @@ if not is_authenticated():
     show_login_page()
     st.stop()
 
+# ═════════════════════════════════════════════════════════════════════════════
+# BACKGROUND PDF REPORTS
+# ═════════════════════════════════════════════════════════════════════════════
+
+def get_report_owner():
+    """
+    Owner ID of report jobs: the logged-in account's username, which is unique,
+    unlike display names; without one, this browser session
+    """
+    user = st.session_state.get('user')
+    username = user.get('username') if isinstance(user, dict) else None
+    if username:
+        return f"user:{username}"
+    if 'report_owner' not in st.session_state:
+        st.session_state.report_owner = f"session:{uuid.uuid4().hex}"
+    return st.session_state.report_owner
+
+
+def show_report_jobs(owner):
+    """Progress and downloads of the owner's report jobs; refreshes itself while any job runs"""
+    queue = get_report_queue()
+    jobs = queue.jobs(owner=owner)
+    if not jobs:
+        return
+    running = any(job["state"] not in FINISHED_STATES for job in jobs)
+
+    def report_list():
+        current = queue.jobs(owner=owner)
+        for job in current[:5]:
+            label = f"{job.get('dataset_name', 'Dataset')} · {datetime.fromtimestamp(job['created']).strftime('%H:%M:%S')}"
+            if job["state"] == "done":
+                pdf_bytes = queue.artifact(job["id"])
+                if pdf_bytes is None:
+                    continue
+                st.download_button(
+                    label=f"💾 Download PDF ({label})",
+                    data=pdf_bytes,
+                    file_name=f"EDA_Report_{job.get('dataset_name', 'Dataset')}_{datetime.fromtimestamp(job['created']).strftime('%Y%m%d_%H%M%S')}.pdf",
+                    mime="application/pdf",
+                    key=f"pdf_download_{job['id']}",
+                    use_container_width=True
+                )
+                timings = job.get("timings") or {}
+                st.caption(" · ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))
+            elif job["state"] == "failed":
+                st.error(f"❌ Error generating PDF ({label}): {job.get('message', '')}")
+            else:
+                st.progress(job.get("progress", 0.0), text=f"🔄 {label}: {job.get('message', '')}")
+        # Stop polling once everything has finished
+        if running and all(job["state"] in FINISHED_STATES for job in current):
+            st.rerun()
+
+    # Fragments (st.experimental_fragment before Streamlit 1.37) poll without rerunning the page;
+    # older versions refresh the list with a button instead
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if fragment is not None:
+        fragment(run_every=1.0 if running else None)(report_list)()
+        return
+    report_list()
+    if running:
+        st.button("🔄 Refresh", key="refresh_report_jobs", use_container_width=True)
+
 # ═════════════════════════════════════════════════════════════════════════════
 # HELPER FUNCTION - ROBUST USER INFO GETTER
 # ═════════════════════════════════════════════════════════════════════════════
@@ -662,10 +728,24 @@ with st.sidebar:
 
     uploaded_file = st.file_uploader(
         "Upload Dataset",
-        type=['csv', 'xlsx', 'xls'],
-        help="CSV or Excel files supported"
+        type=['csv', 'xlsx', 'xls', 'parquet', 'pq', 'feather', 'arrow', 'ipc'],
+        help="CSV, Excel, Parquet or Arrow IPC/Feather files supported"
     )
 
+    with st.expander("🗜️ Large File Options"):
+        max_rows = st.number_input(
+            "Row limit (0 = all rows)", min_value=0, value=0, step=100_000,
+            help="Cap the number of rows loaded from very large files"
+        )
+        sampling = st.selectbox(
+            "Sampling policy", SAMPLING_POLICIES,
+            help="head: first N rows · random: uniform sample of N rows from the whole file"
+        )
+        optimize_memory = st.checkbox(
+            "⚡ Optimize column types", value=True,
+            help="Downcast numbers and store repeated strings, dates and yes/no columns compactly"
+        )
+
     use_default = st.checkbox("📋 Use Sample Data", value=True)
 
     st.markdown("---")
@@ -676,6 +756,12 @@ with st.sidebar:
     show_eda = st.checkbox("🔍 Auto EDA Dashboard", value=True)
     show_raw_data = st.checkbox("📊 Show Raw Data", value=False)
     show_statistics = st.checkbox("📈 Show Statistics", value=True)
+    stats_mode = st.selectbox(
+        "🧮 Statistics mode", ["Auto", "Exact", "Approximate"],
+        help="Approximate uses fixed-memory sketches (HyperLogLog, KLL, SpaceSaving) and shows their "
+             "error bounds. Auto switches to it for very large datasets."
+    )
+    approximate_stats = {"Auto": None, "Exact": False, "Approximate": True}[stats_mode]
 
     st.markdown("---")
 
@@ -694,25 +780,30 @@ with st.sidebar:
 # MAIN CONTENT AREA
 # ═════════════════════════════════════════════════════════════════════════════
 
+# Files larger than this are streamed in chunks instead of parsed in one shot
+STREAMING_THRESHOLD_MB = 50
+
 # Load dataset
 df = None
 dataset_name = "Sample Dataset"
 
 if uploaded_file is not None:
     try:
-        # Save uploaded file temporarily to apply load_dataset normalization
-        import tempfile
-
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as tmp:
-            tmp.write(uploaded_file.getbuffer())
-            tmp_path = tmp.name
-
-        try:
-            df = load_dataset(tmp_path)
-            dataset_name = uploaded_file.name.replace('.csv', '').replace('.xlsx', '').replace('.xls', '')
-            st.success(f"✅ Dataset loaded successfully: {uploaded_file.name}")
-        finally:
-            os.unlink(tmp_path)
+        load_options = {"max_rows": int(max_rows) or None, "sampling": sampling, "optimize": optimize_memory}
+        if uploaded_file.size > STREAMING_THRESHOLD_MB * 1024 ** 2:
+            load_options["chunksize"] = DEFAULT_CHUNKSIZE
+
+        progress_slot = st.empty()
+
+        def report_load_progress(fraction, rows_read):
+            progress_slot.progress(fraction, text=f"📥 Reading dataset... {rows_read:,} rows")
+
+        # Content-addressed cache: reruns reuse the already-normalized DataFrame
+        df = load_bytes_cached(uploaded_file.getbuffer(), uploaded_file.name, load_dataset,
+                               progress_callback=report_load_progress, **load_options)
+        progress_slot.empty()
+        dataset_name = os.path.splitext(uploaded_file.name)[0]
+        st.success(f"✅ Dataset loaded successfully: {uploaded_file.name}")
     except Exception as e:
         st.error(f"❌ Error loading file: {str(e)}")
         df = None
@@ -730,7 +821,7 @@ elif use_default:
         df = None
         for path in sample_paths:
             try:
-                df = load_dataset(path)
+                df = load_path_cached(path, load_dataset, optimize=optimize_memory)
                 dataset_name = "Sample Dataset"
                 st.success(f"✅ Loaded sample data from {path}")
                 break
@@ -750,6 +841,9 @@ if df is not None:
 
     st.markdown("## 📋 Dataset Overview")
 
+    # Shared per-dataset statistics (computed once per dataset version)
+    stats = get_dataset_stats(df, approximate=approximate_stats)
+
     # Metrics row
     col1, col2, col3, col4, col5 = st.columns(5)
 
@@ -758,13 +852,13 @@ if df is not None:
     with col2:
         st.metric("🏷️ Total Columns", len(df.columns))
     with col3:
-        numeric_cols = len(df.select_dtypes(include=['float64', 'int64']).columns)
+        numeric_cols = len(stats.numeric_cols)
         st.metric("🔢 Numeric", numeric_cols)
     with col4:
-        cat_cols = len(df.select_dtypes(include=['object']).columns)
+        cat_cols = len(stats.categorical_cols)
         st.metric("📝 Categorical", cat_cols)
     with col5:
-        missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100)
+        missing_pct = stats.missing_pct
         st.metric("❌ Missing %", f"{missing_pct:.1f}%")
 
     st.divider()
@@ -794,7 +888,7 @@ if df is not None:
         if show_eda:
             st.markdown("---")
             try:
-                show_charts(df)
+                show_charts(df, approximate=approximate_stats)
             except Exception as e:
                 st.error(f"❌ Error generating charts: {str(e)}")
         else:
@@ -822,24 +916,34 @@ if df is not None:
             • **Name:** {dataset_name}
             • **Rows:** {len(df):,}
             • **Columns:** {len(df.columns)}
-            • **Memory:** {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB
-            • **Duplicates:** {df.duplicated().sum()} rows
+            • **Memory:** {stats.memory_mb:.2f} MB
+            • **Duplicates:** {stats.duplicate_rows} rows
 
             **Column Types**
 
-            • Numeric: {len(df.select_dtypes(include=['float64', 'int64']).columns)}
-            • Categorical: {len(df.select_dtypes(include=['object']).columns)}
-            • DateTime: {len(df.select_dtypes(include=['datetime64']).columns)}
+            • Numeric: {len(stats.numeric_cols)}
+            • Categorical: {len(stats.categorical_cols)}
+            • DateTime: {len(stats.datetime_cols)}
 
             **Data Quality**
 
-            • Missing Values: {df.isnull().sum().sum()}
-            • Complete Rows: {(~df.isnull().any(axis=1)).sum():,}
-            • Completeness: {((1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100):.1f}%
+            • Missing Values: {stats.total_missing}
+            • Complete Rows: {stats.complete_rows:,}
+            • Completeness: {stats.completeness_pct:.1f}%
             """
 
             st.markdown(info_text)
 
+            if stats.approximate:
+                st.caption(stats.approximation_note())
+
+            dtype_report = df.attrs.get("dtype_report")
+            if dtype_report and dtype_report["saved_bytes"] > 0:
+                st.caption(
+                    f"⚡ Type optimization saved {dtype_report['saved_bytes'] / 1024**2:.2f} MB "
+                    f"({dtype_report['saved_pct']:.0f}%) across {len(dtype_report['conversions'])} columns"
+                )
+
         st.divider()
 
         # Column details
@@ -858,19 +962,20 @@ if df is not None:
             with col1:
                 st.markdown(f"**{selected_col}**")
                 st.write(f"Type: `{col_data.dtype}`")
-                st.write(f"Non-Null: {col_data.count()} / {len(df)}")
-                st.write(f"Unique: {col_data.nunique()}")
-                st.write(f"Missing: {col_data.isnull().sum()}")
+                st.write(f"Non-Null: {len(df) - stats.missing[selected_col]} / {len(df)}")
+                st.write(f"Unique: {stats.format_nunique(selected_col)}")
+                st.write(f"Missing: {stats.missing[selected_col]}")
 
             with col2:
-                if col_data.dtype in ['float64', 'int64']:
-                    st.write(f"Min: {col_data.min()}")
-                    st.write(f"Max: {col_data.max()}")
-                    st.write(f"Mean: {col_data.mean():.2f}")
-                    st.write(f"Std: {col_data.std():.2f}")
+                if pd.api.types.is_numeric_dtype(col_data) and not pd.api.types.is_bool_dtype(col_data):
+                    summary = stats.numeric_summary(selected_col)
+                    st.write(f"Min: {summary['min']}")
+                    st.write(f"Max: {summary['max']}")
+                    st.write(f"Mean: {summary['mean']:.2f}")
+                    st.write(f"Std: {summary['std']:.2f}")
                 else:
                     st.write(f"Top 5 Values:")
-                    st.bar_chart(col_data.value_counts().head(5))
+                    st.bar_chart(stats.top_values(selected_col, 5))
 
     # ─────────────────────────────────────────────────────────────────────────
     # TAB 3: CHAT ANALYSIS
@@ -899,15 +1004,22 @@ if df is not None:
 
             # Get response
             with st.chat_message("assistant"):
-                with st.spinner("🤖 Analyzing..."):
-                    try:
-                        response = answer_question(df, prompt)
+                try:
+                    with st.spinner("🤖 Analyzing..."):
+                        response = answer_question(df, prompt, stream=True, approximate=approximate_stats)
+                        if not isinstance(response, str):
+                            # The spinner covers the wait for the first token only
+                            response = itertools.chain([next(response, "")], response)
+                    if isinstance(response, str):
                         st.markdown(response)
-                        st.session_state.messages.append({"role": "assistant", "content": response})
-                    except Exception as e:
-                        error_msg = f"❌ Error: {str(e)}"
-                        st.error(error_msg)
-                        st.session_state.messages.append({"role": "assistant", "content": error_msg})
+                    else:
+                        # LLM answers render token by token as they arrive
+                        response = st.write_stream(response)
+                    st.session_state.messages.append({"role": "assistant", "content": response})
+                except Exception as e:
+                    error_msg = f"❌ Error: {str(e)}"
+                    st.error(error_msg)
+                    st.session_state.messages.append({"role": "assistant", "content": error_msg})
 
     # ─────────────────────────────────────────────────────────────────────────
     # TAB 4: PDF REPORT
@@ -922,27 +1034,17 @@ if df is not None:
             col1, col2 = st.columns([1, 3])
 
             with col1:
+                username = get_user_info().get('name', 'User')
+                owner = get_report_owner()
                 if st.button("📥 Generate PDF", use_container_width=True):
-                    with st.spinner("🔄 Generating PDF report..."):
-                        try:
-                            # Generate PDF
-                            username = get_user_info().get('name', 'User')
-                            pdf = generate_pdf_report(df, username=username, dataset_name=dataset_name)
-                            pdf_bytes = get_pdf_bytes(pdf)
-
-                            # Create download button
-                            st.download_button(
-                                label="💾 Download PDF",
-                                data=pdf_bytes,
-                                file_name=f"EDA_Report_{dataset_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-                                mime="application/pdf",
-                                key="pdf_download",
-                                use_container_width=True
-                            )
-
-                            st.success("✅ PDF generated successfully!")
-                        except Exception as e:
-                            st.error(f"❌ Error generating PDF: {str(e)}")
+                    # Generated in the background; the page stays usable while the report builds
+                    try:
+                        get_report_queue().submit(df, username=username, dataset_name=dataset_name,
+                                                  owner=owner, approximate=approximate_stats)
+                    except Exception as e:
+                        st.error(f"❌ Error generating PDF: {str(e)}")
+
+                show_report_jobs(owner)
 
             with col2:
                 st.info("""
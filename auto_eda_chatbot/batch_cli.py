@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Batch EDA Reports
+Headless command-line profiling of many datasets
+
+Generates a PDF report, an HTML report and/or a JSON/Parquet profile for
+every dataset matching the given files, directories or glob patterns, one
+file per process-pool task. A manifest in the output directory records the
+content hash of each input, so unchanged files are skipped on the next run.
+
+When a changed input already has a profile from an earlier run (or one in
+--baseline-dir), only its changed columns are profiled again and a drift
+report ``<name>.diff.json`` is written next to the outputs.
+
+Usage:
+    python batch_cli.py data/extracts/ --out reports/
+    python batch_cli.py "extracts/**/*.parquet" --formats json,html --workers 8
+    python batch_cli.py today/ --out reports/today --formats parquet --baseline-dir reports/yesterday
+"""
+
+import argparse
+import base64
+import glob
+import hashlib
+import html
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from chat.qa_engine import SUPPORTED_EXTENSIONS
+from eda.render_pool import render_workers_per_process
+
+OUTPUT_FORMATS = ("pdf", "html", "json", "parquet")
+
+# Formats holding a machine-readable profile (usable as a diff baseline)
+PROFILE_FORMATS = ("json", "parquet")
+
+MANIFEST_NAME = "manifest.json"
+
+# Bump when report contents change, so every input is regenerated once
+OUTPUT_VERSION = 1
+
+
+def _is_within(path: str, directory: str) -> bool:
+    return os.path.commonpath([path, directory]) == directory
+
+
+def find_inputs(patterns, exclude=()) -> list:
+    """
+    Supported dataset files named by paths, directories (searched recursively)
+    or glob patterns, except files below the directories in exclude (e.g. the
+    output directory, whose Parquet profiles would otherwise be profiled too)
+    """
+    excluded = [os.path.realpath(directory) for directory in exclude if directory]
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = glob.glob(os.path.join(pattern, "**", "*"), recursive=True)
+        else:
+            candidates = glob.glob(pattern, recursive=True) or [pattern]
+        for path in candidates:
+            if not (os.path.isfile(path) and path.lower().endswith(SUPPORTED_EXTENSIONS)):
+                continue
+            if any(_is_within(os.path.realpath(path), directory) for directory in excluded):
+                continue
+            paths.add(os.path.abspath(path))
+    return sorted(paths)
+
+
+def content_hash(path: str, **options) -> str:
+    """Hash of a file's bytes plus the options that change its outputs"""
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(block)
+    hasher.update(repr(sorted(dict(options, version=OUTPUT_VERSION).items())).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def load_manifest(out_dir: str) -> dict:
+    try:
+        with open(os.path.join(out_dir, MANIFEST_NAME), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"version": OUTPUT_VERSION, "files": {}}
+
+
+def save_manifest(out_dir: str, manifest: dict):
+    path = os.path.join(out_dir, MANIFEST_NAME)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def report_html(data, images, dataset_name: str) -> str:
+    """Self-contained HTML report from the PDF pipeline's statistics and chart images"""
+    sections = [
+        f"<h1>Auto EDA Report: {html.escape(dataset_name)}</h1>",
+        f"<p>Generated {time.strftime('%Y-%m-%d %H:%M:%S')} · {data['rows']:,} rows · {data['cols']} columns"
+        f" · {data['memory_mb']:.2f} MB</p>",
+        "<h2>Key Insights</h2><ul>" + "".join(f"<li>{html.escape(text)}</li>" for text in data["insights"]) + "</ul>",
+        "<h2>Data Quality</h2>" + data["dtype_summary"].to_html(index=False, border=0),
+    ]
+    if "numeric_stats" in data:
+        sections.append("<h2>Numeric Column Summary</h2>" + data["numeric_stats"].to_html(index=False, border=0))
+    if data["categorical_info"]:
+        sections.append("<h2>Categorical Column Summary</h2><ul>"
+                        + "".join(f"<li>{html.escape(text[2:])}</li>" for text in data["categorical_info"]) + "</ul>")
+    charts = [png for png in images.values() if png]
+    if charts:
+        sections.append("<h2>Visualizations</h2>" + "".join(
+            f'<img src="data:image/png;base64,{base64.b64encode(png).decode("ascii")}">' for png in charts))
+    return ("<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+            f"<title>EDA Report - {html.escape(dataset_name)}</title><style>"
+            "body{font-family:sans-serif;margin:2em auto;max-width:60em;background:#0a0e27;color:#e2e8f0}"
+            "h1,h2{color:#00d9ff}table{border-collapse:collapse;margin:1em 0}"
+            "td,th{padding:.3em .8em;border-bottom:1px solid #1a1f3a;text-align:left}"
+            "img{max-width:100%;display:block;margin:1em 0}</style></head><body>"
+            + "".join(sections) + "</body></html>")
+
+
+def _init_worker(render_workers: int):
+    import matplotlib
+    matplotlib.use("Agg")
+    # Files are already spread over processes; share the CPUs between their render pools
+    os.environ["EDA_RENDER_WORKERS"] = str(render_workers)
+
+
+def process_file(path: str, targets: dict, max_rows=None, baseline=None, diff_target=None) -> dict:
+    """
+    Process-pool worker: load one dataset and write the requested outputs.
+
+    targets maps each output format to its file path. With a baseline profile
+    path, unchanged columns reuse their baseline profile and the drift report
+    is written to diff_target. Returns a manifest entry (status, outputs, rows,
+    columns, seconds, changed columns and the error when it failed).
+    """
+    from chat.qa_engine import load_dataset
+    from eda.profile_export import build_profile, diff_profiles, load_profile, save_profile
+    from pdf_generator import assemble_pdf, compute_report_data, get_pdf_bytes, render_report_images
+
+    start = time.perf_counter()
+    try:
+        df = load_dataset(path, max_rows=max_rows)
+        name = os.path.basename(path)
+        outputs = dict(targets)
+        payloads = {}
+        changed = None
+        if any(fmt in targets for fmt in PROFILE_FORMATS):
+            # Built first: it seeds the column statistics the reports below use
+            baseline_profile = load_profile(baseline) if baseline else None
+            profile = build_profile(df, baseline=baseline_profile)
+            for fmt in PROFILE_FORMATS:
+                if fmt in targets:
+                    os.makedirs(os.path.dirname(targets[fmt]), exist_ok=True)
+                    save_profile(profile, targets[fmt])
+            if baseline_profile is not None and diff_target:
+                diff = diff_profiles(baseline_profile, profile)
+                changed = sorted(diff["added"] + diff["removed"] + list(diff["changed"]))
+                payloads["diff"] = json.dumps(diff, indent=2).encode("utf-8")
+                outputs["diff"] = diff_target
+        if "pdf" in targets or "html" in targets:
+            data = compute_report_data(df)
+            images = render_report_images(df, data)
+            if "pdf" in targets:
+                payloads["pdf"] = get_pdf_bytes(assemble_pdf(data, images, username="Batch", dataset_name=name))
+            if "html" in targets:
+                payloads["html"] = report_html(data, images, name).encode("utf-8")
+
+        for fmt, payload in payloads.items():
+            os.makedirs(os.path.dirname(outputs[fmt]), exist_ok=True)
+            with open(outputs[fmt], "wb") as f:
+                f.write(payload)
+        entry = {"status": "ok", "outputs": outputs, "rows": len(df), "columns": len(df.columns),
+                 "seconds": round(time.perf_counter() - start, 3)}
+        if changed is not None:
+            entry["changed_columns"] = changed
+        return entry
+    except Exception as e:
+        return {"status": "failed", "outputs": {}, "error": f"{type(e).__name__}: {e}",
+                "seconds": round(time.perf_counter() - start, 3)}
+
+
+def output_targets(path: str, root: str, out_dir: str, formats) -> dict:
+    """Output file per format, mirroring the input's location below root (e.g. out/daily/a.csv.pdf)"""
+    relative = os.path.relpath(path, root)
+    return {fmt: os.path.join(out_dir, f"{relative}.{fmt}") for fmt in formats}
+
+
+def find_baseline(path: str, root: str, baseline_dir: str):
+    """Stored profile of the same input below baseline_dir (JSON preferred), or None"""
+    for fmt in PROFILE_FORMATS:
+        candidate = output_targets(path, root, baseline_dir, [fmt])[fmt]
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def run_batch(patterns, out_dir: str, formats=("pdf", "html", "json"), max_workers=None, force: bool = False,
+              max_rows=None, baseline_dir=None) -> dict:
+    """
+    Profile every matching dataset and return the updated manifest.
+
+    Inputs whose content hash and options match the manifest, and whose outputs
+    still exist, are skipped unless force is set. Profiles of changed inputs are
+    built incrementally against their previous profile in baseline_dir
+    (default: out_dir) when one exists. Files below out_dir and baseline_dir
+    are never inputs.
+    """
+    paths = find_inputs(patterns, exclude=(out_dir, baseline_dir))
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = load_manifest(out_dir)
+    entries = manifest.setdefault("files", {})
+    if not paths:
+        print("[BATCH] No supported datasets found")
+        return manifest
+
+    root = os.path.commonpath([os.path.dirname(path) for path in paths])
+    pending = {}
+    for path in paths:
+        digest = content_hash(path, formats=sorted(formats), max_rows=max_rows)
+        targets = output_targets(path, root, os.path.abspath(out_dir), formats)
+        entry = entries.get(path, {})
+        unchanged = (entry.get("hash") == digest and entry.get("status") == "ok"
+                     and all(os.path.exists(target) for target in targets.values()))
+        if unchanged and not force:
+            continue
+        baseline = None
+        if any(fmt in formats for fmt in PROFILE_FORMATS):
+            baseline = find_baseline(path, root, os.path.abspath(baseline_dir or out_dir))
+        pending[path] = (digest, targets, baseline)
+    print(f"[BATCH] {len(paths)} datasets, {len(paths) - len(pending)} unchanged, {len(pending)} to process")
+    if not pending:
+        return manifest
+
+    if max_workers is None:
+        max_workers = int(os.getenv("EDA_BATCH_WORKERS", os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"),
+                             initializer=_init_worker, initargs=(render_workers_per_process(max_workers),)) as pool:
+        futures = {pool.submit(process_file, path, targets, max_rows, baseline,
+                               output_targets(path, root, os.path.abspath(out_dir), ["diff.json"])["diff.json"]): path
+                   for path, (_, targets, baseline) in pending.items()}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. out of memory)
+                entry = {"status": "failed", "outputs": {}, "error": f"{type(e).__name__}: {e}"}
+            entry.update(hash=pending[path][0], generated=time.strftime("%Y-%m-%dT%H:%M:%S"))
+            entries[path] = entry
+            # Saved after every file, so an interrupted run keeps its progress
+            save_manifest(out_dir, manifest)
+            detail = f"{entry['seconds']:.1f}s" if entry["status"] == "ok" else entry["error"]
+            if "changed_columns" in entry:
+                detail += f", {len(entry['changed_columns'])} columns changed"
+            print(f"[BATCH] {entry['status']:>6}  {path}  ({detail})")
+    return manifest
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate EDA reports for many datasets without the web app.")
+    parser.add_argument("inputs", nargs="+", help="dataset files, directories or glob patterns (quote globs)")
+    parser.add_argument("-o", "--out", default="eda_reports", help="output directory (default: eda_reports)")
+    parser.add_argument("-f", "--formats", default="pdf,html,json",
+                        help=f"comma-separated output formats from {', '.join(OUTPUT_FORMATS)} (default: pdf,html,json)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: EDA_BATCH_WORKERS or the CPU count)")
+    parser.add_argument("--max-rows", type=int, default=None, help="read at most this many rows per dataset")
+    parser.add_argument("--force", action="store_true", help="regenerate outputs of unchanged inputs too")
+    parser.add_argument("--baseline-dir", default=None,
+                        help="earlier output directory to diff profiles against (default: the output directory)")
+    args = parser.parse_args(argv)
+
+    formats = [fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip()]
+    unknown = sorted(set(formats) - set(OUTPUT_FORMATS))
+    if unknown or not formats:
+        parser.error(f"unknown output format(s): {', '.join(unknown) or '(none)'}")
+
+    manifest = run_batch(args.inputs, args.out, formats=formats, max_workers=args.workers, force=args.force,
+                         max_rows=args.max_rows, baseline_dir=args.baseline_dir)
+    failed = [path for path in find_inputs(args.inputs, exclude=(args.out, args.baseline_dir))
+              if manifest["files"].get(path, {}).get("status") != "ok"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
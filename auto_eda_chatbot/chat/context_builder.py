@@ -0,0 +1,263 @@
+"""
+Context Builder Module
+======================
+Token-budgeted dataset context for LLM prompts.
+
+The summary of every column is formatted once per dataset version and kept as
+a text snippet; a prompt context is then assembled with ``''.join`` from the
+snippets of the columns relevant to the question, so asking another question
+costs a ranking and a join instead of re-formatting every column.
+
+Columns are ranked by relevance to the question: columns named in it come
+first (whole words and simple plurals, as in chat.question_context), then
+columns with a name word similar to a question word (character trigram
+overlap, so "revenues" finds monthly_revenue), taking the best match of each
+question word in turn, then the rest in dataset order. Columns named in the
+question are always listed, with their statistics cut short if even they do
+not fit; the other snippets are added in ranking order until the estimated
+token budget (EDA_LLM_CONTEXT_TOKENS) is used up, so a 500-column table
+yields a prompt of bounded size instead of overflowing the model's context
+window. Narrow tables still fit entirely.
+"""
+
+import os
+import re
+import sys
+from itertools import zip_longest
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.dataset_cache import dataset_memo
+from eda.stats import get_dataset_stats
+from .question_context import get_question_context
+
+# Token budget of the dataset context in a prompt (override with EDA_LLM_CONTEXT_TOKENS)
+DEFAULT_CONTEXT_TOKENS = 3000
+
+# Rough characters per token of English text and numbers
+CHARS_PER_TOKEN = 4
+
+# Name and question words at least this similar (Dice coefficient of trigrams) count as related
+MIN_WORD_SIMILARITY = 0.5
+
+# Question words too common to say anything about a column
+STOP_WORDS = frozenset({
+    "the", "and", "for", "with", "what", "which", "who", "how", "why", "are", "was", "were", "this", "that",
+    "these", "those", "there", "data", "dataset", "column", "columns", "show", "tell", "about", "does", "from",
+    "into", "between", "explain", "analyze", "analyse", "give", "please",
+})
+
+NUMERIC_HEADER = "📈 NUMERIC COLUMNS (Statistical Summary):\n"
+CATEGORICAL_HEADER = "🏷️ CATEGORICAL COLUMNS:\n"
+MISSING_HEADER = "⚠️ MISSING DATA:\n"
+
+
+def context_tokens() -> int:
+    """Token budget of the dataset context (EDA_LLM_CONTEXT_TOKENS)"""
+    return int(os.getenv("EDA_LLM_CONTEXT_TOKENS", DEFAULT_CONTEXT_TOKENS))
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a prompt text"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _words(text) -> list:
+    """Lowercase words of a name or question; underscores separate words"""
+    return [word for word in re.split(r"[\W_]+", str(text).lower()) if word]
+
+
+def _trigrams(word: str) -> frozenset:
+    padded = f" {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def _similarity(a: frozenset, b: frozenset) -> float:
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+class DataContextBuilder:
+    """Precomputed context snippets of one dataset version"""
+
+    def __init__(self, df: pd.DataFrame, approximate=None):
+        stats = get_dataset_stats(df, approximate=approximate)
+        self.n_rows = len(df)
+        self.columns = tuple(df.columns)
+        self._question_context = get_question_context(df)
+        numeric = set(stats.numeric_cols)
+        categorical = set(stats.categorical_cols)
+
+        self._numeric = {}
+        self._categorical = {}
+        self._missing = {}
+        missing = stats.missing
+        for col in self.columns:
+            if col in numeric:
+                self._numeric[col] = self._numeric_snippet(stats, col)
+            elif col in categorical:
+                self._categorical[col] = self._categorical_snippet(stats, col)
+            if missing[col] > 0:
+                pct = (missing[col] / self.n_rows) * 100
+                self._missing[col] = f"  • {col}: {missing[col]} missing ({pct:.1f}%)\n"
+
+        self._cost = {col: len(self._numeric.get(col, "")) + len(self._categorical.get(col, ""))
+                      + len(self._missing.get(col, "")) for col in self.columns}
+        # Columns by name word, to compare question words with each distinct word once
+        self._word_columns = {}
+        for col in self.columns:
+            for word in set(_words(col)):
+                self._word_columns.setdefault(word, []).append(col)
+        self._word_trigrams = {word: _trigrams(word) for word in self._word_columns}
+
+        quality = "✅ DATA QUALITY:\n"
+        quality += f"  • Total cells: {stats.total_cells:,}\n"
+        quality += f"  • Complete cells: {stats.total_cells - stats.total_missing:,}\n"
+        quality += f"  • Completeness: {stats.completeness_pct:.1f}%\n"
+        if stats.approximate:
+            quality += f"  • {stats.approximation_note()}\n"
+        self._quality = quality
+
+    @staticmethod
+    def _numeric_snippet(stats, col) -> str:
+        try:
+            summary = stats.numeric_summary(col)
+        except Exception:
+            return ""
+        if summary['count'] == 0:
+            return ""
+        return "".join((
+            f"  • {str(col).upper()}:\n",
+            f"      - Count: {summary['count']:,} values\n",
+            f"      - Min: {summary['min']:.2f}\n",
+            f"      - Q1 (25%): {summary['25%']:.2f}\n",
+            f"      - Median: {summary['50%']:.2f}\n",
+            f"      - Q3 (75%): {summary['75%']:.2f}\n",
+            f"      - Max: {summary['max']:.2f}\n",
+            f"      - Mean: {summary['mean']:.2f}\n",
+            f"      - Std Dev: {summary['std']:.2f}\n",
+        ))
+
+    def _categorical_snippet(self, stats, col) -> str:
+        parts = [f"  • {str(col).upper()}: {stats.format_nunique(col)} unique values\n"]
+        # Top 5 categories
+        for idx, (val, count) in enumerate(stats.top_values(col, 5).items(), 1):
+            pct = (count / self.n_rows) * 100
+            parts.append(f"      {idx}. {val}: {count} ({pct:.1f}%)\n")
+        return "".join(parts)
+
+    def rank_columns(self, question=None) -> list:
+        """All columns, most relevant to the question first"""
+        if not question:
+            return list(self.columns)
+        ranked = self._question_context.find_columns(question)
+        seen = set(ranked)
+
+        # Columns related to each question word, most similar first
+        per_word = []
+        for word in dict.fromkeys(_words(question)):
+            if len(word) < 3 or word in STOP_WORDS:
+                continue
+            trigrams = _trigrams(word)
+            scored = [(score, name_word) for name_word, name_trigrams in self._word_trigrams.items()
+                      if (score := _similarity(trigrams, name_trigrams)) >= MIN_WORD_SIMILARITY]
+            columns = [col for _, name_word in sorted(scored, key=lambda item: -item[0])
+                       for col in self._word_columns[name_word]]
+            if columns:
+                per_word.append(columns)
+
+        # Take the next best column of every question word in turn, so no word crowds out the others
+        for candidates in zip_longest(*per_word):
+            for col in candidates:
+                if col is not None and col not in seen:
+                    ranked.append(col)
+                    seen.add(col)
+        return ranked + [col for col in self.columns if col not in seen]
+
+    def _select(self, question=None, max_tokens=None) -> tuple:
+        """
+        (columns, {column: character limit}) fitting the token budget, most
+        relevant first; columns in the dict have their snippets cut short
+        """
+        if max_tokens is None:
+            max_tokens = context_tokens()
+        budget = max_tokens * CHARS_PER_TOKEN - 200 - len(self._quality)  # Overview and section headers
+        if sum(self._cost.values()) <= budget:
+            return list(self.columns), {}
+
+        # Columns named in the question always go in; if they do not all fit, they share the budget
+        named = self._question_context.find_columns(question) if question else []
+        limits = {}
+        remaining = max(budget, 0)
+        for index, col in enumerate(sorted(named, key=self._cost.get)):
+            share = remaining // (len(named) - index)
+            if self._cost[col] > share:
+                limits[col] = share
+            remaining -= min(self._cost[col], share)
+        budget -= sum(limits.get(col, self._cost[col]) for col in named)
+
+        selected = list(named)
+        seen = set(named)
+        for col in self.rank_columns(question):
+            if col not in seen and self._cost[col] <= budget:
+                selected.append(col)
+                budget -= self._cost[col]
+        return selected, limits
+
+    def select_columns(self, question=None, max_tokens=None) -> list:
+        """Columns listed in the context for question, most relevant first"""
+        return self._select(question, max_tokens)[0]
+
+    def _sections(self) -> tuple:
+        return (NUMERIC_HEADER, self._numeric), (CATEGORICAL_HEADER, self._categorical), (MISSING_HEADER, self._missing)
+
+    def _cut_snippets(self, col, limit: int) -> tuple:
+        """Snippets of col per section within limit characters, keeping whole lines and at least its name"""
+        cut = []
+        has_name = False
+        for _, snippets in self._sections():
+            kept = []
+            for line in snippets.get(col, "").splitlines(keepends=True):
+                if len(line) > limit and has_name:
+                    break
+                kept.append(line)
+                limit -= len(line)
+                has_name = True
+            cut.append("".join(kept))
+        return tuple(cut)
+
+    def build(self, question=None, max_tokens=None) -> str:
+        """Dataset context for a prompt about question, within max_tokens (estimated)"""
+        columns, limits = self._select(question, max_tokens)
+        selected = set(columns)
+        # Sections list the selected columns in dataset order
+        ordered = [col for col in self.columns if col in selected]
+        cut = {col: self._cut_snippets(col, limit) for col, limit in limits.items()}
+
+        parts = [f"📊 Dataset Overview: {self.n_rows:,} rows, {len(self.columns)} columns\n"]
+        omitted = len(self.columns) - len(ordered)
+        if omitted:
+            parts.append(f"  • Showing the {len(ordered)} columns most relevant to the question; "
+                         f"{omitted} more are not listed (ask about them by name)\n")
+        if cut:
+            parts.append(f"  • Statistics of {len(cut)} columns named in the question are shortened to fit\n")
+        parts.append("\n")
+        for index, (header, snippets) in enumerate(self._sections()):
+            section = [cut[col][index] if col in cut else snippets.get(col) for col in ordered]
+            section = [snippet for snippet in section if snippet]
+            if section:
+                parts.append(header)
+                parts.extend(section)
+                parts.append("\n")
+        parts.append(self._quality)
+        return "".join(parts)
+
+
+def get_context_builder(df: pd.DataFrame, approximate=None) -> DataContextBuilder:
+    """Context builder for df, built once per dataset version and statistics mode (see get_dataset_stats)"""
+    approximate = get_dataset_stats(df, approximate=approximate).approximate
+    name = "data_context:approximate" if approximate else "data_context"
+    return dataset_memo(df, name, lambda: DataContextBuilder(df, approximate))
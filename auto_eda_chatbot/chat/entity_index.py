@@ -0,0 +1,149 @@
+"""
+Entity Index Module
+===================
+Per-dataset lookup structures for person/entity names used by the Q&A engine.
+
+Instead of scanning every row of the ``name`` column for each question, the
+index maps each lowercase name to its row positions and looks up every word
+n-gram of the question in a phrase table, so a lookup costs O(question length)
+rather than O(rows).
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.dataset_cache import dataset_memo
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pandas string methods are the (slower) fallback
+    pa = None
+
+TOKEN_PATTERN = re.compile(r"\w+")
+NON_WORD_PATTERN = r"\W+"
+
+
+def tokenize(text):
+    """Lowercase word tokens; names and questions are split the same way"""
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+def lowercase_strings(values) -> pd.Index:
+    """Vectorized ``str(v).lower()`` over an array of values"""
+    values = pd.Index(values).astype(str)
+    if pa is not None:
+        return pd.Index(pc.utf8_lower(pa.array(values, type=pa.string())).to_numpy(zero_copy_only=False))
+    return values.str.lower()
+
+
+def phrase_keys(values) -> pd.Index:
+    """Vectorized ``" ".join(tokenize(v))`` for an array of strings"""
+    values = lowercase_strings(values)
+    if pa is not None:
+        keys = pc.replace_substring_regex(pa.array(values, type=pa.string()), NON_WORD_PATTERN, " ")
+        return pd.Index(pc.utf8_trim(keys, " ").to_numpy(zero_copy_only=False))
+    return values.str.replace(NON_WORD_PATTERN, " ", regex=True).str.strip()
+
+
+def first_tokens(keys: pd.Index) -> pd.Index:
+    """First word of every phrase key"""
+    if pa is not None:
+        parts = pc.split_pattern(pa.array(keys, type=pa.string()), " ", max_splits=1)
+        return pd.Index(pc.list_element(parts, 0).to_numpy(zero_copy_only=False))
+    return keys.str.split(" ", n=1).str[0]
+
+
+class PhraseIndex:
+    """
+    Exact multi-word phrase lookup.
+
+    Phrases are stored under their space-joined token key. ``find_all`` looks up
+    every n-gram of the text up to the longest phrase length, so the cost
+    depends on the text length only, not on how many phrases are registered.
+    Values sharing a key are kept in a CSR layout so building the index stays
+    vectorized even when one key (e.g. a common first name) has many values.
+    """
+
+    def __init__(self, keys, values):
+        keys = pd.Index(keys, dtype=object)
+        values = np.asarray(values)
+        key_codes, unique_keys = pd.factorize(keys)
+
+        self._lookup = dict(zip(unique_keys, range(len(unique_keys))))
+        self._lookup.pop("", None)
+        self._values = values[np.argsort(key_codes, kind="stable")]
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(key_codes, minlength=len(unique_keys)))])
+        self.max_tokens = int(unique_keys.str.count(" ").max()) + 1 if len(unique_keys) else 0
+
+    def find_all(self, text):
+        """Values of every phrase occurring in text, in order of occurrence"""
+        tokens = tokenize(text)
+        found = []
+        for start in range(len(tokens)):
+            for end in range(start + 1, min(start + self.max_tokens, len(tokens)) + 1):
+                code = self._lookup.get(" ".join(tokens[start:end]))
+                if code is not None:
+                    found.extend(self._values[self._offsets[code]:self._offsets[code + 1]].tolist())
+        return found
+
+
+class EntityIndex:
+    """Lowercase name -> row positions map plus phrase lookups over the names"""
+
+    def __init__(self, names: pd.Series):
+        present = names.notna().to_numpy()
+        positions = np.flatnonzero(present)
+        lowered = lowercase_strings(names[present])
+
+        # Codes follow first appearance, so a smaller code means an earlier record
+        codes, uniques = pd.factorize(lowered)
+        self.names = pd.Index(uniques, dtype=object)
+        self._codes = dict(zip(self.names, range(len(self.names))))
+
+        # CSR layout: rows of name code c are _rows[_offsets[c]:_offsets[c + 1]]
+        self._rows = positions[np.argsort(codes, kind="stable")]
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(codes, minlength=len(uniques)))])
+        self._first_rows = positions[np.unique(codes, return_index=True)[1]] if len(codes) else positions
+        self._source = names
+
+        keys = phrase_keys(self.names)
+        code_values = np.arange(len(self.names))
+        self._full_names = PhraseIndex(keys, code_values)
+        self._first_names = PhraseIndex(first_tokens(keys), code_values)
+
+    def rows_for(self, name) -> np.ndarray:
+        """Row positions (for ``df.iloc``) of every record with this name"""
+        code = self._codes.get(str(name).lower())
+        if code is None:
+            return np.empty(0, dtype=np.intp)
+        return self._rows[self._offsets[code]:self._offsets[code + 1]]
+
+    def display_name(self, name):
+        """Original value of the first record with this name"""
+        code = self._codes.get(str(name).lower())
+        return name if code is None else self._source.iloc[self._first_rows[code]]
+
+    def _names_for(self, codes):
+        """De-duplicate matches and order them by first appearance in the dataset"""
+        return [self.names[code] for code in sorted(set(codes))]
+
+    def find_names(self, question):
+        """Every full name mentioned in the question, in dataset order"""
+        return self._names_for(self._full_names.find_all(question))
+
+    def find_names_by_first_name(self, question):
+        """Names whose first word is mentioned in the question, in dataset order"""
+        return self._names_for(self._first_names.find_all(question))
+
+
+def get_entity_index(df: pd.DataFrame) -> EntityIndex:
+    """Entity index over df['name'], built once per dataset version"""
+    return dataset_memo(df, "entity_index", lambda: EntityIndex(df["name"]))
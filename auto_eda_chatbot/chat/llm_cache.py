@@ -0,0 +1,187 @@
+"""
+LLM Cache Module
+================
+Cache of LLM answers keyed by dataset, question and model.
+
+The LLM path sends only dataset summaries, so the answer to a question
+depends on the dataset version, the question and the model. Answers are
+cached under a hash of the dataset fingerprint, the normalized question text
+(case, spacing, punctuation and filler words ignored) and the model name, so
+a question repeated by any analyst returns without a network round trip.
+
+Entries expire after a TTL (EDA_LLM_CACHE_TTL seconds) and are evicted
+least-recently-used beyond EDA_LLM_CACHE_ENTRIES. Setting EDA_LLM_CACHE_DB to
+a file path adds a SQLite tier that survives restarts and is shared between
+app processes.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.dataset_cache import dataset_fingerprint
+
+# Answers expire after this many seconds (override with EDA_LLM_CACHE_TTL)
+DEFAULT_LLM_CACHE_TTL = 24 * 3600
+
+# Answers kept in memory (override with EDA_LLM_CACHE_ENTRIES)
+DEFAULT_LLM_CACHE_ENTRIES = 1000
+
+# Answers kept in the SQLite tier (override with EDA_LLM_CACHE_DB_ENTRIES)
+DEFAULT_LLM_CACHE_DB_ENTRIES = 100_000
+
+# Bump when the prompts or normalize_question change, so answers under the old keys are not reused
+PROMPT_VERSION = 3
+
+# Operators kept in normalized questions ("!" only as part of "!=")
+OPERATOR_PATTERN = re.compile(r"[<>!=]=|[<>=#/*^]")
+
+# Words that do not change what a question asks
+FILLER_WORDS = frozenset({"please", "pls", "kindly", "thanks"})
+
+
+def normalize_question(question: str) -> str:
+    """
+    Canonical form of a question: casefolded, punctuation and filler words
+    removed, single spaces. Operators (< > = != <= >= # / * ^) are kept.
+    """
+    text = unicodedata.normalize("NFKC", question).casefold()
+    # Comparison and arithmetic operators change what is asked: keep them, spaced so "age>30" == "age > 30"
+    text = OPERATOR_PATTERN.sub(lambda match: f" {match.group(0)} ", text)
+    # Keep decimal points and signs inside numbers, drop other punctuation
+    text = re.sub(r"(?<!\d)[.,]|[.,](?!\d)|[^\w\s.,%+\-<>=!#/*^]|!(?!=)", " ", text)
+    return " ".join(word for word in text.split() if word not in FILLER_WORDS)
+
+
+def llm_cache_key(df, question: str, model: str, context: str = "") -> str:
+    """
+    Cache key of an answer about a dataset version.
+
+    context identifies how the prompt's dataset context was built (e.g. the
+    statistics mode and token budget), so answers to differently built
+    prompts are kept apart.
+    """
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(f"{dataset_fingerprint(df)}|{model}|v{PROMPT_VERSION}|{context}|".encode("utf-8"))
+    hasher.update(normalize_question(question).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+class LLMResponseCache:
+    """Thread-safe TTL + LRU cache of LLM answers with an optional SQLite tier"""
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None, db_path: Optional[str] = None):
+        self.ttl = float(os.getenv("EDA_LLM_CACHE_TTL", DEFAULT_LLM_CACHE_TTL)) if ttl is None else ttl
+        if max_entries is None:
+            max_entries = int(os.getenv("EDA_LLM_CACHE_ENTRIES", DEFAULT_LLM_CACHE_ENTRIES))
+        self.max_entries = max_entries
+        self.db_path = db_path if db_path is not None else os.getenv("EDA_LLM_CACHE_DB") or None
+        self._entries = OrderedDict()  # key -> (created, answer)
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached answer for key, or None if absent or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now - entry[0] <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            entry = self._read_db(key, now)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._put_memory(key, entry)
+            return entry[1]
+
+    def put(self, key: str, answer: str, model: str = ""):
+        with self._lock:
+            entry = (time.time(), answer)
+            self._put_memory(key, entry)
+            self._write_db(key, model, entry)
+
+    def _put_memory(self, key: str, entry: tuple):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _connect(self):
+        if self._db is None:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS answers (key TEXT PRIMARY KEY, model TEXT, answer TEXT, "
+                             "created REAL, accessed REAL)")
+        return self._db
+
+    def _read_db(self, key: str, now: float) -> Optional[tuple]:
+        """Best-effort read; a locked or broken database only disables the tier"""
+        if not self.db_path:
+            return None
+        try:
+            db = self._connect()
+            row = db.execute("SELECT created, answer FROM answers WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row[0] > self.ttl:
+                return None
+            with db:
+                db.execute("UPDATE answers SET accessed = ? WHERE key = ?", (now, key))
+            return row
+        except sqlite3.Error as e:
+            print(f"[LLM CACHE] SQLite read failed: {e}")
+            return None
+
+    def _write_db(self, key: str, model: str, entry: tuple):
+        if not self.db_path:
+            return
+        created, answer = entry
+        max_rows = int(os.getenv("EDA_LLM_CACHE_DB_ENTRIES", DEFAULT_LLM_CACHE_DB_ENTRIES))
+        try:
+            db = self._connect()
+            with db:
+                db.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)", (key, model, answer, created, created))
+                # Drop expired answers, then the least recently used beyond the row budget
+                db.execute("DELETE FROM answers WHERE created < ?", (created - self.ttl,))
+                db.execute("DELETE FROM answers WHERE key IN (SELECT key FROM answers ORDER BY accessed DESC "
+                           "LIMIT -1 OFFSET ?)", (max_rows,))
+        except sqlite3.Error as e:
+            print(f"[LLM CACHE] SQLite write failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+# Process-wide cache shared by every Streamlit session
+_llm_cache = LLMResponseCache()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    return _llm_cache
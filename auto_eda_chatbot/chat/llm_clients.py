@@ -0,0 +1,166 @@
+"""
+LLM Clients Module
+==================
+Process-wide registry of LLM API clients.
+
+Building an OpenAI client, or configuring Gemini, for every question throws
+away the HTTP keep-alive connections and TLS sessions of the previous one.
+The registry creates each client lazily on first use and then shares it
+between questions and Streamlit sessions, so requests go over warm
+connections from the client's pool.
+
+Clients are keyed by their settings (API key and base URL), so changing
+OPENAI_API_KEY or OPENAI_BASE_URL, e.g. to point at chat/llm_stub_server.py
+in tests, builds a new client instead of reusing a stale one. Each client
+also tracks its health: after EDA_LLM_CLIENT_MAX_ERRORS consecutive failed
+requests it is closed and rebuilt on next use, dropping connections that may
+have gone bad.
+
+The async OpenAI client is bound to the event loop it first runs on, so it
+must only be used from the shared loop of chat.llm_providers.
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+# Consecutive failures after which a client is rebuilt (override with EDA_LLM_CLIENT_MAX_ERRORS)
+DEFAULT_CLIENT_MAX_ERRORS = 3
+
+
+class ClientHealth:
+    """Request counters of one pooled client"""
+
+    def __init__(self):
+        self.created = time.time()
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.last_used = None
+
+    def as_dict(self) -> dict:
+        return {"created": self.created, "requests": self.requests, "failures": self.failures,
+                "consecutive_failures": self.consecutive_failures, "last_error": self.last_error,
+                "last_used": self.last_used}
+
+
+class LLMClientRegistry:
+    """
+    Lazily built, shared LLM clients: ``openai()``, ``async_openai()`` and
+    ``gemini_model(name)``.
+
+    base_url/api keys default to the OPENAI_BASE_URL, OPENAI_API_KEY and
+    GEMINI_API_KEY environment variables, read on every lookup.
+    """
+
+    def __init__(self, openai_base_url: Optional[str] = None, max_errors: Optional[int] = None):
+        self.openai_base_url = openai_base_url
+        if max_errors is None:
+            max_errors = int(os.getenv("EDA_LLM_CLIENT_MAX_ERRORS", DEFAULT_CLIENT_MAX_ERRORS))
+        self.max_errors = max_errors
+        self._clients = {}  # name -> (settings, client)
+        self._health = {}  # name -> ClientHealth
+        self._lock = threading.Lock()
+
+    def _get(self, name: str, settings: tuple, build):
+        with self._lock:
+            entry = self._clients.get(name)
+            if entry is not None and entry[0] == settings:
+                return entry[1]
+            if entry is not None:
+                self._close(name, entry[1])
+            print(f"[LLM CLIENTS] Creating {name} client")
+            client = build()
+            self._clients[name] = (settings, client)
+            self._health[name] = ClientHealth()
+            return client
+
+    @staticmethod
+    def _close(name: str, client):
+        """Close a sync client; async clients are left to the garbage collector (their loop may be busy)"""
+        if name == "openai":
+            try:
+                client.close()
+            except Exception as e:
+                print(f"[LLM CLIENTS] Closing {name} client failed: {e}")
+
+    def _openai_settings(self) -> tuple:
+        return os.getenv("OPENAI_API_KEY"), self.openai_base_url or os.getenv("OPENAI_BASE_URL")
+
+    def openai(self):
+        """Shared blocking OpenAI client (thread-safe)"""
+        api_key, base_url = settings = self._openai_settings()
+
+        def build():
+            from openai import OpenAI
+            return OpenAI(api_key=api_key, base_url=base_url)
+        return self._get("openai", settings, build)
+
+    def async_openai(self):
+        """Shared AsyncOpenAI client; use it only on chat.llm_providers.get_event_loop()"""
+        api_key, base_url = settings = self._openai_settings()
+
+        def build():
+            from openai import AsyncOpenAI
+            return AsyncOpenAI(api_key=api_key, base_url=base_url)
+        return self._get("async_openai", settings, build)
+
+    def gemini_model(self, model: str):
+        """Shared Gemini GenerativeModel; genai is configured once per API key"""
+        api_key = os.getenv("GEMINI_API_KEY")
+
+        def build():
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            return genai.GenerativeModel(model)
+        return self._get(f"gemini:{model}", (api_key,), build)
+
+    # ------------------------------------------------------------------
+    # Health tracking
+    # ------------------------------------------------------------------
+    def record_success(self, name: str):
+        with self._lock:
+            health = self._health.get(name)
+            if health is not None:
+                health.requests += 1
+                health.consecutive_failures = 0
+                health.last_used = time.time()
+
+    def record_failure(self, name: str, error: Exception):
+        """Count a failed request; a client failing max_errors times in a row is dropped"""
+        with self._lock:
+            health = self._health.get(name)
+            if health is None:
+                return
+            health.requests += 1
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_error = f"{type(error).__name__}: {error}"
+            health.last_used = time.time()
+            if health.consecutive_failures >= self.max_errors and name in self._clients:
+                print(f"[LLM CLIENTS] Dropping {name} client after {health.consecutive_failures} failures")
+                self._close(name, self._clients.pop(name)[1])
+
+    def health(self) -> dict:
+        """{client name: request counters} of the clients built so far"""
+        with self._lock:
+            return {name: {"active": name in self._clients, **health.as_dict()}
+                    for name, health in self._health.items()}
+
+    def reset(self):
+        """Close and forget every client"""
+        with self._lock:
+            for name, (_, client) in self._clients.items():
+                self._close(name, client)
+            self._clients.clear()
+            self._health.clear()
+
+
+# Process-wide registry shared by every Streamlit session
+_llm_clients = LLMClientRegistry()
+
+
+def get_llm_clients() -> LLMClientRegistry:
+    return _llm_clients
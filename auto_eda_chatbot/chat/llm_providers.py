@@ -0,0 +1,326 @@
+"""
+LLM Providers Module
+====================
+Concurrent, hedged calls to several LLM providers.
+
+Trying providers strictly one after another makes a slow or hanging primary
+cost its full timeout before the fallback starts. ``race_providers`` (whole
+answers) and ``race_streams`` (streamed answers) instead run the calls as
+asyncio tasks:
+
+- The first provider starts at once. If it has not answered by its hedge
+  delay, a percentile (EDA_LLM_HEDGE_PERCENTILE, default p95) of its recent
+  latencies, the next provider starts alongside it. A failed call starts the
+  next provider immediately. Streams are hedged on the time to first token.
+- The first good answer, or the first stream to produce a token, wins and
+  the other calls are cancelled.
+- A circuit breaker per provider skips providers that failed several times in
+  a row (EDA_LLM_BREAKER_FAILURES) until a cooldown (EDA_LLM_BREAKER_COOLDOWN
+  seconds) has passed; then one trial call decides whether it closes again.
+
+Coroutines run on one long-lived event loop in a background thread, so the
+blocking callers (Streamlit script threads) can share async clients. Callers
+build prompts before handing work to the loop: anything CPU-bound on the loop
+would stall the hedge timers and every other session's requests.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+import numpy as np
+
+# Hedge after this percentile of a provider's recent latencies (override with EDA_LLM_HEDGE_PERCENTILE)
+DEFAULT_HEDGE_PERCENTILE = 95
+
+# Hedge delay in seconds until a provider has MIN_LATENCY_SAMPLES latencies (override with EDA_LLM_HEDGE_DELAY)
+DEFAULT_HEDGE_DELAY = 8.0
+
+# Latencies needed before the percentile is trusted
+MIN_LATENCY_SAMPLES = 5
+
+# Recent latencies kept per provider
+LATENCY_WINDOW = 200
+
+# Consecutive failures that open a provider's circuit (override with EDA_LLM_BREAKER_FAILURES)
+DEFAULT_BREAKER_FAILURES = 3
+
+# Seconds an open circuit waits before a trial call (override with EDA_LLM_BREAKER_COOLDOWN)
+DEFAULT_BREAKER_COOLDOWN = 60.0
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies"""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """p-th percentile of the recent latencies, or None with too few samples"""
+        with self._lock:
+            samples = list(self._samples)
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+        return float(np.percentile(samples, p))
+
+    def summary(self) -> dict:
+        """Sample count and p50/p95/p99 latencies in seconds (None when unknown)"""
+        with self._lock:
+            samples = list(self._samples)
+        if not samples:
+            return {"count": 0, "p50": None, "p95": None, "p99": None}
+        p50, p95, p99 = np.percentile(samples, [50, 95, 99]).tolist()
+        return {"count": len(samples), "p50": p50, "p95": p95, "p99": p99}
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open trial after a cooldown"""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        if failure_threshold is None:
+            failure_threshold = int(os.getenv("EDA_LLM_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURES))
+        if cooldown is None:
+            cooldown = float(os.getenv("EDA_LLM_BREAKER_COOLDOWN", DEFAULT_BREAKER_COOLDOWN))
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a call may be made now (an open circuit admits one trial after the cooldown)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+    def release(self):
+        """End a call that neither succeeded nor failed (e.g. cancelled) without changing the state"""
+        with self._lock:
+            self._trial_running = False
+
+
+class LLMProvider:
+    """
+    One LLM backend: ``call(question, context)`` is a coroutine returning the
+    answer text (None or an exception counts as a failure); the optional
+    ``stream(question, context)`` is an async generator yielding the answer in
+    chunks instead. context is the prebuilt dataset context of the prompt.
+    Providers whose api_key_env variable is unset are skipped without counting
+    a failure.
+    """
+
+    def __init__(self, name: str, model: str, call: Callable[..., Awaitable[Optional[str]]],
+                 api_key_env: Optional[str] = None, stream: Optional[Callable[..., AsyncIterator[str]]] = None):
+        self.name = name
+        self.model = model
+        self.call = call
+        self.stream = stream
+        self.api_key_env = api_key_env
+        self.latency = LatencyTracker()  # Whole answers
+        self.first_token = LatencyTracker()  # Time to the first streamed chunk
+        self.breaker = CircuitBreaker()
+
+    def configured(self) -> bool:
+        return not self.api_key_env or bool(os.getenv(self.api_key_env))
+
+    def hedge_delay(self, streaming: bool = False) -> float:
+        """Seconds to wait for this provider's answer (or first token) before starting the next one"""
+        percentile = float(os.getenv("EDA_LLM_HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE))
+        delay = (self.first_token if streaming else self.latency).percentile(percentile)
+        return float(os.getenv("EDA_LLM_HEDGE_DELAY", DEFAULT_HEDGE_DELAY)) if delay is None else delay
+
+    def stats(self) -> dict:
+        first_token = {f"first_token_{key}": value for key, value in self.first_token.summary().items()}
+        return {"provider": self.name, "model": self.model, "circuit": self.breaker.state,
+                **self.latency.summary(), **first_token}
+
+
+async def _attempt(provider: LLMProvider, question, context) -> Optional[str]:
+    """One provider call with latency and breaker bookkeeping"""
+    start = time.perf_counter()
+    try:
+        answer = await provider.call(question, context)
+    except asyncio.CancelledError:
+        provider.breaker.release()
+        raise
+    except Exception as e:
+        print(f"❌ {provider.name} Error: {type(e).__name__}: {str(e)}")
+        answer = None
+    if answer:
+        provider.latency.record(time.perf_counter() - start)
+        provider.breaker.record_success()
+        return answer
+    provider.breaker.record_failure()
+    return None
+
+
+async def _attempt_stream(provider: LLMProvider, question, context):
+    """(first chunk, rest of the stream) of one provider stream, or None; with latency and breaker bookkeeping"""
+    start = time.perf_counter()
+    chunks = provider.stream(question, context)
+    try:
+        async for first in chunks:
+            if first:
+                break
+        else:
+            raise RuntimeError("stream ended before the first token")
+    except asyncio.CancelledError:
+        provider.breaker.release()
+        await chunks.aclose()
+        raise
+    except Exception as e:
+        print(f"❌ {provider.name} Stream Error: {type(e).__name__}: {str(e)}")
+        await chunks.aclose()
+        provider.breaker.record_failure()
+        return None
+    provider.first_token.record(time.perf_counter() - start)
+    provider.breaker.record_success()
+    return first, chunks
+
+
+async def _race(providers, attempt, streaming: bool, discard=None):
+    """
+    (provider, result) of the first attempt to return a result, or (None, None).
+
+    Providers are started in order: each one after the previous has run for its
+    hedge delay or failed. Providers that are not configured or whose circuit
+    is open are skipped. Attempts still running when a result arrives are
+    cancelled; results of attempts finishing in the same step as the winner are
+    passed to discard.
+    """
+    waiting = [provider for provider in providers if provider.configured()]
+    running = {}  # task -> provider
+
+    def start_next() -> Optional[LLMProvider]:
+        while waiting:
+            provider = waiting.pop(0)
+            if provider.breaker.allow():
+                print(f"🔄 Calling {provider.name} ({provider.model})...")
+                running[asyncio.ensure_future(attempt(provider))] = provider
+                return provider
+            print(f"⏭️ Skipping {provider.name}: circuit {provider.breaker.state}")
+        return None
+
+    newest = start_next()
+    try:
+        while running:
+            timeout = newest.hedge_delay(streaming) if waiting and newest is not None else None
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                print(f"⏱️ {newest.name} slower than {timeout:.1f}s, hedging")
+                newest = start_next() or newest
+                continue
+            winner = None
+            for task in done:
+                provider = running.pop(task)
+                result = task.result()
+                if result and winner is None:
+                    winner = provider, result
+                elif result and discard is not None:
+                    await discard(result)
+            if winner is not None:
+                return winner
+            # Every finished call failed: do not wait for the hedge delay
+            if waiting:
+                newest = start_next() or newest
+        return None, None
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+async def race_providers(providers, question, context):
+    """(provider, answer) from the first provider to answer well, or (None, None)"""
+    return await _race(providers, lambda provider: _attempt(provider, question, context), streaming=False)
+
+
+async def race_streams(providers, question, context):
+    """
+    (provider, (first chunk, rest of the stream)) from the first provider to
+    produce a token, or (None, None). The losing streams are closed; the
+    caller owns the winning one (see iterate_stream).
+    """
+    async def discard(result):
+        await result[1].aclose()
+
+    streaming = [provider for provider in providers if provider.stream is not None]
+    return await _race(streaming, lambda provider: _attempt_stream(provider, question, context),
+                       streaming=True, discard=discard)
+
+
+# ----------------------------------------------------------------------
+# Background event loop shared by all callers
+# ----------------------------------------------------------------------
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """The long-lived event loop running in a daemon thread (started on first use)"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-event-loop", daemon=True).start()
+        return _loop
+
+
+def run_coroutine(coro):
+    """Run a coroutine on the shared loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop()).result()
+
+
+_END = object()
+
+
+async def _next_chunk(chunks):
+    try:
+        return await chunks.__anext__()
+    except StopAsyncIteration:
+        return _END
+
+
+def iterate_stream(chunks):
+    """Blocking iterator over an async generator on the shared loop; closing it closes the stream"""
+    try:
+        while True:
+            chunk = run_coroutine(_next_chunk(chunks))
+            if chunk is _END:
+                return
+            yield chunk
+    finally:
+        run_coroutine(chunks.aclose())
@@ -0,0 +1,153 @@
+"""
+LLM Stub Server
+===============
+Local stand-in for the OpenAI chat completions API.
+
+Serves ``POST /v1/chat/completions`` with a canned answer, either as one JSON
+response or, with ``"stream": true``, as server-sent events carrying one
+token per chunk. Latency is configurable (delay before the first token and
+between tokens), as is an HTTP error status, so the streaming path can be
+exercised without network access or API keys:
+
+    python chat/llm_stub_server.py --port 8765 --token-delay 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=stub streamlit run app.py
+
+In tests, ``start_stub_server()`` runs it on a free port in a background thread.
+JSON responses keep the connection alive, and ``server.connections`` counts
+the TCP connections accepted, so tests can check that clients are reused.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_ANSWER = ("## Analysis\n\nThis is a **stub answer** from the local LLM stub server. "
+                  "It streams one token at a time so the chat shows text as it arrives.")
+
+
+class StubLLMServer(ThreadingHTTPServer):
+    """HTTP server holding the stub settings and the requests it received"""
+
+    daemon_threads = True
+
+    def __init__(self, address, answer=DEFAULT_ANSWER, first_token_delay=0.0, token_delay=0.0, status=200):
+        super().__init__(address, _StubHandler)
+        self.answer = answer
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.status = status
+        self.requests = []  # Parsed JSON bodies, in arrival order
+        self.connections = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def _tokens(text: str) -> list:
+    """Split text into word-sized tokens that join back to the original"""
+    return re.findall(r"\s*\S+|\s+", text)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    server: StubLLMServer
+    protocol_version = "HTTP/1.1"  # Keep-alive between requests
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass  # Keep test output quiet
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}", "type": "invalid_request_error"}})
+            return
+        request = json.loads(body or b"{}")
+        self.server.requests.append(request)
+
+        if self.server.status != 200:
+            self._send_json(self.server.status, {"error": {"message": "Stub failure", "type": "server_error"}})
+            return
+
+        model = request.get("model", "stub")
+        created = int(time.time())
+        time.sleep(self.server.first_token_delay)
+        if not request.get("stream"):
+            self._send_json(200, {
+                "id": "chatcmpl-stub", "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": self.server.answer}}],
+                "usage": {"prompt_tokens": 0, "completion_tokens": len(_tokens(self.server.answer)), "total_tokens": 0},
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # The event stream has no length, so its end is the end of the connection
+        self.send_header("Connection", "close")
+        self.close_connection = True
+        self.end_headers()
+
+        def send(delta, finish_reason=None):
+            chunk = {"id": "chatcmpl-stub", "object": "chat.completion.chunk", "created": created, "model": model,
+                     "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        send({"role": "assistant", "content": ""})
+        for index, token in enumerate(_tokens(self.server.answer)):
+            if index:
+                time.sleep(self.server.token_delay)
+            send({"content": token})
+        send({}, finish_reason="stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+def start_stub_server(answer=DEFAULT_ANSWER, first_token_delay=0.0, token_delay=0.0, status=200,
+                      host="127.0.0.1", port=0) -> StubLLMServer:
+    """Run a stub server in a daemon thread (port 0: any free port); stop it with ``server.shutdown()``"""
+    server = StubLLMServer((host, port), answer=answer, first_token_delay=first_token_delay,
+                           token_delay=token_delay, status=status)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a stub OpenAI-compatible chat completions API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--answer", default=DEFAULT_ANSWER, help="answer text returned for every request")
+    parser.add_argument("--first-token-delay", type=float, default=0.5, help="seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.05, help="seconds between tokens")
+    parser.add_argument("--status", type=int, default=200, help="HTTP status to answer with (e.g. 503)")
+    args = parser.parse_args(argv)
+
+    server = StubLLMServer((args.host, args.port), answer=args.answer, first_token_delay=args.first_token_delay,
+                           token_delay=args.token_delay, status=args.status)
+    print(f"[LLM STUB] Serving on {server.base_url} (set OPENAI_BASE_URL to this URL)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,239 @@
 import pandas as pd
+import numpy as np
 import re
 import os
-from typing import Optional
+import sys
+import importlib
+import time
+from pathlib import Path
+from typing import Callable, Optional
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def load_dataset(file_path: str) -> pd.DataFrame:
-    """Load dataset from CSV or Excel file with automatic normalization"""
+from utils.data_loader import normalize_strings, optimize_dtypes
+from .entity_index import get_entity_index
+from .question_context import get_question_context
+from .llm_cache import get_llm_cache, llm_cache_key
+from .llm_clients import get_llm_clients
+from .context_builder import context_tokens, get_context_builder
+from .llm_providers import LLMProvider, iterate_stream, race_providers, race_streams, run_coroutine
+from eda.stats import get_dataset_stats
+
+
+# Rows per chunk when streaming CSV/Parquet files
+DEFAULT_CHUNKSIZE = 100_000
+
+# LLM models, in order of preference
+OPENAI_MODEL = "gpt-4-turbo"
+GEMINI_MODEL = "gemini-1.5-flash"
+
+# Sampling settings of OpenAI requests (blocking and streaming)
+OPENAI_PARAMS = {"temperature": 0.7, "max_tokens": 2000, "top_p": 0.95, "timeout": 30.0}
+
+# Row sampling policies applied when max_rows is set
+SAMPLING_POLICIES = ("head", "random")
+
+# Supported file extensions by format family
+CSV_EXTENSIONS = ('.csv',)
+EXCEL_EXTENSIONS = ('.xlsx', '.xls')
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.feather', '.arrow', '.ipc')
+SUPPORTED_EXTENSIONS = CSV_EXTENSIONS + EXCEL_EXTENSIONS + PARQUET_EXTENSIONS + ARROW_EXTENSIONS
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Strip/lowercase column names and string values"""
+    df.columns = df.columns.astype(str).str.strip().str.lower()
+    for col in df.columns:
+        if df[col].dtype == 'object':  # String columns
+            df[col] = normalize_strings(df[col])
+    return df
+
+
+def load_dataset(file_path: str, chunksize: Optional[int] = None, max_rows: Optional[int] = None,
+                 sampling: str = "head", progress_callback: Optional[Callable] = None,
+                 random_state: int = 42, optimize: bool = False) -> pd.DataFrame:
+    """
+    Load dataset from CSV, Excel, Parquet or Arrow IPC/Feather file with automatic normalization.
+
+    Args:
+        file_path: path to a .csv, .xlsx, .xls, .parquet, .pq, .feather, .arrow or .ipc file
+        chunksize: stream CSV/Parquet files in chunks of this many rows, normalizing
+            each chunk as it arrives (bounded memory for very large files)
+        max_rows: optional row cap applied while reading
+        sampling: "head" keeps the first max_rows rows, "random" keeps a uniform
+            random sample of max_rows rows drawn from the whole file
+        progress_callback: called as ``progress_callback(fraction, rows_read)``
+            while streaming
+        random_state: seed for the "random" sampling policy
+        optimize: downcast numerics and infer bool/datetime/category dtypes;
+            the memory report is stored in ``df.attrs["dtype_report"]``. Off
+            by default: optimized columns reject some writes (see
+            utils.data_loader.optimize_dtypes), so only enable it for frames
+            that are analyzed, not edited
+    """
     try:
-        if file_path.endswith('.csv'):
-            df = pd.read_csv(file_path)
-        elif file_path.endswith(('.xlsx', '.xls')):
-            df = pd.read_excel(file_path)
+        if sampling not in SAMPLING_POLICIES:
+            raise ValueError(f"Unknown sampling policy: {sampling}")
+
+        path = file_path.lower()
+        stream = chunksize or (max_rows and sampling == "random")
+
+        if path.endswith(CSV_EXTENSIONS):
+            if stream:
+                df = _read_csv_chunked(file_path, chunksize or DEFAULT_CHUNKSIZE, max_rows,
+                                       sampling, progress_callback, random_state)
+            else:
+                df = _normalize_frame(pd.read_csv(file_path, nrows=max_rows))
+        elif path.endswith(EXCEL_EXTENSIONS):
+            nrows = max_rows if sampling == "head" else None
+            df = _normalize_frame(pd.read_excel(file_path, nrows=nrows))
+            if max_rows and len(df) > max_rows:
+                df = df.sample(n=max_rows, random_state=random_state).sort_index().reset_index(drop=True)
+        elif path.endswith(PARQUET_EXTENSIONS):
+            df = _read_parquet(file_path, chunksize if stream else None, max_rows,
+                               sampling, progress_callback, random_state)
+        elif path.endswith(ARROW_EXTENSIONS):
+            df = _read_arrow_ipc(file_path, max_rows, sampling, random_state)
         else:
             raise ValueError(f"Unsupported file format: {file_path}")
-        
-        # GOLDEN FIX: Normalize all data
-        # Strip whitespace and convert to lowercase for string columns
-        df.columns = df.columns.str.strip().str.lower()
-        for col in df.columns:
-            if df[col].dtype == 'object':  # String columns
-                df[col] = df[col].astype(str).str.strip().str.lower()
-        
+
+        if optimize:
+            df, report = optimize_dtypes(df)
+            df.attrs["dtype_report"] = report
+
+        if progress_callback:
+            progress_callback(1.0, len(df))
         return df
     except Exception as e:
         raise Exception(f"Error loading dataset: {str(e)}")
 
 
+def _read_csv_chunked(file_path, chunksize, max_rows, sampling, progress_callback, random_state):
+    """Stream a CSV file chunk by chunk, reporting progress by bytes consumed"""
+    total_bytes = os.path.getsize(file_path) or 1
+
+    with open(file_path, 'rb') as f:
+        df = _collect_chunks(pd.read_csv(f, chunksize=chunksize), max_rows, sampling,
+                             progress_callback, random_state, lambda rows: f.tell() / total_bytes)
+    if df is None:
+        df = _normalize_frame(pd.read_csv(file_path, nrows=0))
+    return df
+
+
+def _read_parquet(file_path, chunksize, max_rows, sampling, progress_callback, random_state):
+    """Read a Parquet file through a memory map, optionally batch by batch"""
+    pq = _import_pyarrow_module("pyarrow.parquet")
+    parquet_file = pq.ParquetFile(file_path, memory_map=True)
+    total_rows = parquet_file.metadata.num_rows or 1
+
+    if not chunksize and not max_rows:
+        return _normalize_frame(parquet_file.read(use_threads=True).to_pandas(split_blocks=True))
+
+    batches = (batch.to_pandas(split_blocks=True)
+               for batch in parquet_file.iter_batches(batch_size=chunksize or DEFAULT_CHUNKSIZE))
+    df = _collect_chunks(batches, max_rows, sampling, progress_callback, random_state,
+                         lambda rows: rows / total_rows)
+    if df is None:
+        df = _normalize_frame(parquet_file.schema_arrow.empty_table().to_pandas())
+    return df
+
+
+def _read_arrow_ipc(file_path, max_rows, sampling, random_state):
+    """Read an Arrow IPC/Feather file through a memory map; row caps slice without copying"""
+    feather = _import_pyarrow_module("pyarrow.feather")
+    table = feather.read_table(file_path, memory_map=True)
+
+    if max_rows and table.num_rows > max_rows:
+        if sampling == "head":
+            table = table.slice(0, max_rows)
+        else:
+            rng = np.random.default_rng(random_state)
+            table = table.take(np.sort(rng.choice(table.num_rows, size=max_rows, replace=False)))
+    return _normalize_frame(table.to_pandas(split_blocks=True))
+
+
+def _import_pyarrow_module(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ValueError("Parquet/Arrow support requires pyarrow (pip install pyarrow)")
+
+
+def _collect_chunks(chunk_iter, max_rows, sampling, progress_callback, random_state, position):
+    """
+    Normalize chunks as they arrive and apply the row cap / sampling policy.
+
+    With the "random" policy a reservoir of at most max_rows rows is kept by
+    assigning every row a random key and retaining the smallest keys, so memory
+    stays bounded by max_rows + chunksize regardless of file size.
+    Returns None when the source has no rows.
+
+    CSV chunks infer their dtypes independently, so a column can be numeric in
+    one chunk and text in another; such columns are re-inferred after
+    concatenation (see _reconcile_chunk_dtypes).
+    """
+    rng = np.random.default_rng(random_state)
+    chunk_dtypes = {}  # column -> dtypes seen across chunks
+    chunks = []
+    reservoir = None
+    reservoir_keys = None
+    rows_read = 0
+
+    for chunk in chunk_iter:
+        if max_rows and sampling == "head":
+            chunk = chunk.iloc[:max_rows - rows_read]
+        # Global row positions keep the sampled rows in file order
+        chunk.index = pd.RangeIndex(rows_read, rows_read + len(chunk))
+        rows_read += len(chunk)
+        chunk = _normalize_frame(chunk)
+        for col, dtype in chunk.dtypes.items():
+            chunk_dtypes.setdefault(col, set()).add(dtype)
+
+        if max_rows and sampling == "random":
+            keys = rng.random(len(chunk))
+            if reservoir is None:
+                reservoir, reservoir_keys = chunk, keys
+            else:
+                reservoir = pd.concat([reservoir, chunk])
+                reservoir_keys = np.concatenate([reservoir_keys, keys])
+            if len(reservoir) > max_rows:
+                keep = np.argpartition(reservoir_keys, max_rows)[:max_rows]
+                reservoir, reservoir_keys = reservoir.iloc[keep], reservoir_keys[keep]
+        else:
+            chunks.append(chunk)
+
+        if progress_callback:
+            progress_callback(min(position(rows_read), 1.0), rows_read)
+        if max_rows and sampling == "head" and rows_read >= max_rows:
+            break
+
+    if reservoir is not None:
+        df = reservoir.sort_index()
+    elif chunks:
+        df = pd.concat(chunks)
+    else:
+        return None
+    return _reconcile_chunk_dtypes(df.reset_index(drop=True), chunk_dtypes)
+
+
+def _reconcile_chunk_dtypes(df, chunk_dtypes):
+    """
+    Give columns whose dtype differed between chunks the dtype of a one-shot read.
+
+    Numeric chunks of different widths already concatenate to the common
+    numeric dtype. A column that mixes numbers from some chunks with text from
+    others is text in a one-shot read, so its numbers are turned back into
+    normalized strings.
+    """
+    for col, dtypes in chunk_dtypes.items():
+        if len(dtypes) > 1 and df[col].dtype == object:
+            if pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer"):
+                df[col] = normalize_strings(df[col])
+    return df
+
+
 def classify_question(question, df):
     """
     CLASSIFY QUESTION TYPE:
@@ -71,6 +279,11 @@ def retrieve_from_dataset(df, question):
     
     # Normalize question (strip and lowercase)
     q = question.lower().strip()
+
+    # Columns mentioned in the question, resolved once against the dataset's context
+    context = get_question_context(df)
+    mentioned_cols = context.find_columns(q)
+    mentioned_numeric = context.find_numeric_columns(q)
     
     # CHECK FOR MULTIPLE PEOPLE QUERY FIRST (HIGHEST PRIORITY)
     if " and " in q:
@@ -78,18 +291,14 @@ def retrieve_from_dataset(df, question):
         if len(names) >= 2:
             print(f"[RETRIEVE] Multiple people detected: {names}")
             # Find which column they're asking about
-            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-            for col in numeric_cols:
-                col_lower = col.lower()
-                if col_lower in q:
-                    result = retrieve_multiple_people_data(df, question, col)
-                    if result:
-                        return result
+            for col in mentioned_numeric:
+                result = retrieve_multiple_people_data(df, question, col)
+                if result:
+                    return result
             
             # Also check categorical columns
-            for col in df.columns:
-                col_lower = col.lower()
-                if col_lower in q and col != 'name':
+            for col in mentioned_cols:
+                if col != 'name':
                     result = retrieve_multiple_people_data(df, question, col)
                     if result:
                         return result
@@ -119,15 +328,13 @@ def retrieve_from_dataset(df, question):
             return None  # This triggers LLM routing
 
     # Handle "list" queries
-    if "list" in q or ("show" in q and "all" in q):
-        for col in df.columns:
-            col_lower = col.lower()
-            if col_lower in q:
-                values = df[col].unique()
-                if len(values) <= 20:
-                    return f"✓ {col}: {', '.join(str(v) for v in values)}"
-                else:
-                    return f"✓ {col}: {len(values)} unique values"
+    if ("list" in q or ("show" in q and "all" in q)) and mentioned_cols:
+        col = mentioned_cols[0]
+        values = df[col].unique()
+        if len(values) <= 20:
+            return f"✓ {col}: {', '.join(str(v) for v in values)}"
+        else:
+            return f"✓ {col}: {len(values)} unique values"
 
     # SCOPE BINDING: Extract person name FIRST to determine aggregation scope
     extracted_entity = extract_name(question, df)
@@ -135,85 +342,61 @@ def retrieve_from_dataset(df, question):
     
     if extracted_entity:
         # Person found - bind statistics to this person's data, NOT global data
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        person_rows = get_entity_index(df).rows_for(extracted_entity)
         
         # Check if asking for statistics on this person
         if "average" in q or "mean" in q:
-            for col in numeric_cols:
-                col_lower = col.lower()
-                if " " + col_lower + " " in " " + q + " ":
-                    person_data = df[df['name'].str.lower() == extracted_entity.lower()][col]
-                    if len(person_data) > 1:
-                        avg_val = person_data.mean()
-                        return f"✓ {extracted_entity}'s average {col}: {avg_val:.2f}"
-                    elif len(person_data) == 1:
-                        value = person_data.iloc[0]
-                        return f"✓ {extracted_entity} has only one record: {col} = {value}"
-                    else:
-                        return f"❌ No records found for {extracted_entity}"
+            for col in mentioned_numeric:
+                person_data = df[col].iloc[person_rows]
+                if len(person_data) > 1:
+                    avg_val = person_data.mean()
+                    return f"✓ {extracted_entity}'s average {col}: {avg_val:.2f}"
+                elif len(person_data) == 1:
+                    value = person_data.iloc[0]
+                    return f"✓ {extracted_entity} has only one record: {col} = {value}"
+                else:
+                    return f"❌ No records found for {extracted_entity}"
         
         if "max" in q or "maximum" in q or "highest" in q:
-            for col in numeric_cols:
-                col_lower = col.lower()
-                if col_lower in q:
-                    person_data = df[df['name'].str.lower() == extracted_entity.lower()][col]
-                    if len(person_data) > 0:
-                        return f"✓ {extracted_entity}'s max {col}: {person_data.max()}"
+            for col in mentioned_numeric:
+                person_data = df[col].iloc[person_rows]
+                if len(person_data) > 0:
+                    return f"✓ {extracted_entity}'s max {col}: {person_data.max()}"
         
         if "min" in q or "minimum" in q or "lowest" in q:
-            for col in numeric_cols:
-                col_lower = col.lower()
-                if col_lower in q:
-                    person_data = df[df['name'].str.lower() == extracted_entity.lower()][col]
-                    if len(person_data) > 0:
-                        return f"✓ {extracted_entity}'s min {col}: {person_data.min()}"
+            for col in mentioned_numeric:
+                person_data = df[col].iloc[person_rows]
+                if len(person_data) > 0:
+                    return f"✓ {extracted_entity}'s min {col}: {person_data.min()}"
         
         # If no statistics keyword, try to find specific column
-        for col in df.columns:
-            if col != 'name':
-                col_lower = col.lower()
-                q_words = q.split()
-                if col_lower in q_words or col_lower in q:
-                    mask = df['name'].str.lower() == extracted_entity.lower()
-                    if mask.any():
-                        result_value = df.loc[mask, col].values[0]
-                        return f"✓ {extracted_entity}'s {col}: {result_value}"
+        for col in mentioned_cols:
+            if col != 'name' and len(person_rows) > 0:
+                result_value = df[col].iloc[person_rows[0]]
+                return f"✓ {extracted_entity}'s {col}: {result_value}"
         
         # Person found but can't determine what to extract → let LLM handle it
         return None
 
     # NO person name found - compute statistics on ENTIRE dataset (global scope)
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    
-    if "average" in q or "mean" in q:
-        for col in numeric_cols:
-            col_lower = col.lower()
-            if col_lower in q:
-                return f"✓ Average {col}: {df[col].mean():.2f}"
-    
-    if "max" in q or "maximum" in q or "highest" in q:
-        for col in numeric_cols:
-            col_lower = col.lower()
-            if col_lower in q:
-                return f"✓ Max {col}: {df[col].max()}"
-    
-    if "min" in q or "minimum" in q or "lowest" in q:
-        for col in numeric_cols:
-            col_lower = col.lower()
-            if col_lower in q:
-                return f"✓ Min {col}: {df[col].min()}"
-    
-    if "sum" in q or "total" in q:
-        for col in numeric_cols:
-            col_lower = col.lower()
-            if col_lower in q:
-                return f"✓ Sum of {col}: {df[col].sum()}"
-    
-    if "count" in q:
-        for col in df.columns:
-            col_lower = col.lower()
-            if col_lower in q:
-                return f"✓ Count of {col}: {df[col].nunique()} unique values"
+    if mentioned_numeric:
+        col = mentioned_numeric[0]
+
+        if "average" in q or "mean" in q:
+            return f"✓ Average {col}: {df[col].mean():.2f}"
+
+        if "max" in q or "maximum" in q or "highest" in q:
+            return f"✓ Max {col}: {df[col].max()}"
+
+        if "min" in q or "minimum" in q or "lowest" in q:
+            return f"✓ Min {col}: {df[col].min()}"
+
+        if "sum" in q or "total" in q:
+            return f"✓ Sum of {col}: {df[col].sum()}"
+    
+    if "count" in q and mentioned_cols:
+        col = mentioned_cols[0]
+        return f"✓ Count of {col}: {df[col].nunique()} unique values"
 
     # Default: route unmatched questions to LLM for analysis
     print("[RETRIEVE] No specific pattern matched → routing to LLM")
@@ -228,32 +411,16 @@ def extract_multiple_names(question: str, df: pd.DataFrame) -> list:
     if 'name' not in df.columns:
         return []
     
-    q = question.lower()
-    all_names = [name.lower() for name in df['name'].unique()]
-    found_names = []
-    
+    index = get_entity_index(df)
+
     # Try exact matches first
-    for name in all_names:
-        if name in q:
-            found_names.append(name)
-    
+    found_names = index.find_names(question)
+
     # If not enough matches, try partial matching (first name only)
     if len(found_names) < 2:
-        found_names = []
-        for name in all_names:
-            first_name = name.split()[0] if ' ' in name else name
-            if first_name in q:
-                found_names.append(name)
-    
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_names = []
-    for name in found_names:
-        if name not in seen:
-            seen.add(name)
-            unique_names.append(name)
-    
-    return unique_names
+        found_names = index.find_names_by_first_name(question)
+
+    return found_names
 
 
 def retrieve_multiple_people_data(df, question: str, column: str) -> Optional[str]:
@@ -266,13 +433,13 @@ def retrieve_multiple_people_data(df, question: str, column: str) -> Optional[st
     if len(names) < 2:
         return None
     
-    col_lower = column.lower()
+    index = get_entity_index(df)
     results = []
     
     for name in names:
-        person_data = df[df['name'].str.lower() == name.lower()]
-        if len(person_data) > 0:
-            value = person_data[column].values[0]
+        rows = index.rows_for(name)
+        if len(rows) > 0:
+            value = df[column].iloc[rows[0]]
             results.append(f"{name.title()}: {value}")
     
     if results:
@@ -283,23 +450,21 @@ def retrieve_multiple_people_data(df, question: str, column: str) -> Optional[st
 
 def extract_name(question: str, df: pd.DataFrame) -> Optional[str]:
     """Extract person/entity name from question - works with any ID column"""
-    q = question.lower()
-    for name in df['name']:
-        if name.lower() in q:
-            return name
+    if 'name' not in df.columns:
+        return None
+
+    index = get_entity_index(df)
+    found_names = index.find_names(question)
+    if found_names:
+        # Earliest record in the dataset wins, as in the original row scan
+        return index.display_name(found_names[0])
     return None
 
 
 def extract_column_from_question(question: str, df: pd.DataFrame) -> Optional[str]:
     """Extract column name from question - works with any DataFrame"""
-    q = question.lower()
-    
-    for col in df.columns:
-        col_lower = col.lower()
-        if col_lower in q:
-            return col
-    
-    return None
+    mentioned_cols = get_question_context(df).find_columns(question)
+    return mentioned_cols[0] if mentioned_cols else None
 
 
 def parse_visualization_request(question: str, df: pd.DataFrame) -> Optional[tuple]:
@@ -350,13 +515,8 @@ def detect_person_comparison(question: str, df: pd.DataFrame) -> Optional[tuple]
     if 'name' not in df.columns:
         return None
     
-    all_names = [name.lower() for name in df['name'].unique()]
-    
     # Find which two names are mentioned in the question
-    found_names = []
-    for name in all_names:
-        if name in q:
-            found_names.append(name)
+    found_names = get_entity_index(df).find_names(question)
     
     # Return if exactly 2 people found
     if len(found_names) == 2:
@@ -375,14 +535,15 @@ def create_person_comparison_chart(df, person1: str, person2: str):
         import numpy as np
         
         # Filter data for both people
-        p1_data = df[df['name'].str.lower() == person1.lower()]
-        p2_data = df[df['name'].str.lower() == person2.lower()]
+        index = get_entity_index(df)
+        p1_data = df.iloc[index.rows_for(person1)]
+        p2_data = df.iloc[index.rows_for(person2)]
         
         if len(p1_data) == 0 or len(p2_data) == 0:
             return None, None
         
         # Get numeric columns for comparison
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = list(get_question_context(df).numeric_cols)
         
         if not numeric_cols:
             return None, None
@@ -436,8 +597,15 @@ def create_person_comparison_chart(df, person1: str, person2: str):
         return None, None
 
 
-def answer_question(df, question):
-    """Router: Pandas first, LLM second. NO LOGIC, NO CONDITIONS."""
+def answer_question(df, question, stream=False, approximate=None):
+    """
+    Router: Pandas first, LLM second. NO LOGIC, NO CONDITIONS.
+
+    With stream=True an LLM answer is returned as a generator of text chunks
+    (see stream_llm_for_analysis); dataset answers are always plain text.
+    approximate selects the statistics mode of the LLM context (see
+    get_dataset_stats).
+    """
     # Debug output
     print(f"[ROUTER] Question Type: {type(question)} | Value Type Check: {isinstance(question, str)}")
     
@@ -451,75 +619,96 @@ def answer_question(df, question):
     result = retrieve_from_dataset(df, question)
 
     if result is None:
-        return ask_llm_for_analysis(question, df)
+        if stream:
+            return stream_llm_for_analysis(question, df, approximate)
+        return ask_llm_for_analysis(question, df, approximate)
     else:
         return result
 
 
-def ask_llm_for_analysis(question, df):
+def ask_llm_for_analysis(question, df, approximate=None):
     """
     Call OpenAI GPT-4 for advanced analysis - provides deep insights with statistical rigor.
-    Falls back to Gemini if OpenAI is unavailable.
+    Gemini is started as a hedge when OpenAI is slower than usual, or at once
+    when it fails (see chat.llm_providers); the first good answer is used.
     Dataset-agnostic approach - only summaries, no raw data.
     """
     print(">>> ENTERING LLM ANALYSIS <<<")
     
-    # Try OpenAI first (preferred)
-    openai_response = _ask_openai_for_analysis(question, df)
-    if openai_response:
-        print("✅ Using OpenAI response")
-        return openai_response
-    
-    print("⚠️ OpenAI failed or unavailable, trying Gemini...")
-    
-    # Fallback to Gemini if OpenAI is unavailable
-    gemini_response = _ask_gemini_for_analysis(question, df)
-    if gemini_response:
-        print("✅ Using Gemini response")
-        return gemini_response
+    # Same question about the same dataset answered before (by either model)
+    cache = get_llm_cache()
+    variant = _context_variant(df, approximate)
+    for model in (OPENAI_MODEL, GEMINI_MODEL):
+        cached_response = cache.get(llm_cache_key(df, question, model, variant))
+        if cached_response:
+            print(f"✅ Using cached {model} response")
+            return cached_response
+    
+    # Built here, not on the shared event loop, so the pandas work cannot stall other requests
+    context = _build_data_context(df, question, approximate)
+    print(f"✓ Data context built ({len(context)} chars)")
+    
+    # OpenAI first (preferred), Gemini hedged behind it
+    provider, response = run_coroutine(race_providers(LLM_PROVIDERS, question, context))
+    if response:
+        print(f"✅ Using {provider.name} response")
+        cache.put(llm_cache_key(df, question, provider.model, variant), response, provider.model)
+        return response
     
     print("❌ Both APIs failed, generating basic response from data...")
     
     # Last resort: Generate basic response from data statistics
-    return _generate_basic_response(question, df)
+    return _generate_basic_response(question, df, approximate)
 
 
-def _ask_openai_for_analysis(question, df):
+async def _ask_openai_for_analysis(question, context):
     """Call OpenAI GPT-4 API for advanced analysis"""
     print(">>> ROUTED TO OPENAI GPT-4 <<<")
+    clients = get_llm_clients()
     
     try:
-        from openai import OpenAI
-        
-        # Get API key from environment
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            print("⚠️ OPENAI_API_KEY not found in environment")
-            return None
-        
-        print(f"✓ API Key found (length: {len(api_key)})")
-        
-        # Initialize client with proper error handling
-        try:
-            client = OpenAI(api_key=api_key)
-            print("✓ OpenAI client initialized")
-        except Exception as e:
-            print(f"❌ Failed to initialize OpenAI client: {e}")
-            return None
-        
-        # Build rich context with statistical analysis
-        context = _build_data_context(df)
-        print(f"✓ Data context built ({len(context)} chars)")
-        
-        # Create a sophisticated prompt for data analysis
-        system_prompt = """You are an expert data analyst like ChatGPT. Your responses should be:
+        response = await clients.async_openai().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=_openai_messages(question, context),
+            **OPENAI_PARAMS
+        )
+    except Exception as e:
+        clients.record_failure("async_openai", e)
+        raise
+    clients.record_success("async_openai")
+    
+    result = response.choices[0].message.content.strip()
+    print(f"✅ OpenAI Success! Response: {len(result)} chars")
+    return result
+
+
+async def _ask_gemini_for_analysis(question, context):
+    """Call Google Gemini API for analysis - fallback option"""
+    print(">>> ROUTED TO GEMINI (FALLBACK) <<<")
+    clients = get_llm_clients()
+    
+    try:
+        response = await clients.gemini_model(GEMINI_MODEL).generate_content_async(_gemini_prompt(question, context))
+    except Exception as e:
+        clients.record_failure(f"gemini:{GEMINI_MODEL}", e)
+        raise
+    clients.record_success(f"gemini:{GEMINI_MODEL}")
+    result = response.text.strip()
+    print(f"✅ Gemini Success! Response: {len(result)} chars")
+    return result
+
+
+def _openai_messages(question, context):
+    """Chat messages of an OpenAI analysis request (context: from _build_data_context)"""
+    # Create a sophisticated prompt for data analysis
+    system_prompt = """You are an expert data analyst like ChatGPT. Your responses should be:
 - Clear, concise, and well-structured
 - Specific with numbers and statistics
 - Actionable and insightful
 - Professional yet conversational
 - Use markdown formatting for better readability"""
-        
-        user_prompt = f"""Analyze this dataset and answer the following question:
+    
+    user_prompt = f"""Analyze this dataset and answer the following question:
 
 QUESTION: {question}
 
@@ -527,63 +716,29 @@ DATASET STATISTICS:
 {context}
 
 Please provide a comprehensive, ChatGPT-style response with clear sections and actionable insights."""
-        
-        print("🔄 Calling OpenAI API...")
-        
-        response = client.chat.completions.create(
-            model="gpt-4-turbo",
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_prompt
-                },
-                {
-                    "role": "user",
-                    "content": user_prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=2000,
-            top_p=0.95,
-            timeout=30.0
-        )
-        
-        result = response.choices[0].message.content.strip()
-        print(f"✅ OpenAI Success! Response: {len(result)} chars")
-        return result
     
-    except Exception as e:
-        print(f"❌ OpenAI Error: {type(e).__name__}: {str(e)}")
-        return None
+    return [
+        {
+            "role": "system",
+            "content": system_prompt
+        },
+        {
+            "role": "user",
+            "content": user_prompt
+        }
+    ]
 
 
-def _ask_gemini_for_analysis(question, df):
-    """Call Google Gemini API for analysis - fallback option"""
-    print(">>> ROUTED TO GEMINI (FALLBACK) <<<")
-    
-    try:
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            print("⚠️ GEMINI_API_KEY not set - skipping Gemini fallback")
-            return None
-        
-        print("✓ Configuring Gemini...")
-        import google.generativeai as genai
-        
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        
-        context = _build_data_context(df)
-        print(f"✓ Data context built ({len(context)} chars)")
-        
-        system_prompt = """You are a ChatGPT-like data analyst. Your responses should be:
+def _gemini_prompt(question, context):
+    """Prompt text of a Gemini analysis request (context: from _build_data_context)"""
+    system_prompt = """You are a ChatGPT-like data analyst. Your responses should be:
 - Clear and well-structured with sections
 - Specific with numbers and statistics from the provided data
 - Insightful and actionable
 - Use markdown formatting
 - Professional yet conversational"""
-        
-        prompt = f"""{system_prompt}
+    
+    return f"""{system_prompt}
 
 DATASET STATISTICS:
 {context}
@@ -591,80 +746,123 @@ DATASET STATISTICS:
 USER QUESTION: {question}
 
 Please provide a comprehensive analysis similar to how ChatGPT would respond. Use clear sections and specific numbers."""
-        
-        print("🔄 Calling Gemini API...")
-        response = model.generate_content(prompt)
-        result = response.text.strip()
-        print(f"✅ Gemini Success! Response: {len(result)} chars")
-        return result
-    
+
+
+async def _stream_openai_for_analysis(question, context):
+    """Text chunks of an OpenAI answer as they arrive (OPENAI_BASE_URL may point at a stub server)"""
+    clients = get_llm_clients()
+    try:
+        stream = await clients.async_openai().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=_openai_messages(question, context),
+            stream=True,
+            **OPENAI_PARAMS
+        )
     except Exception as e:
-        print(f"❌ Gemini Error: {type(e).__name__}: {str(e)}")
-        return None
+        clients.record_failure("async_openai", e)
+        raise
+    clients.record_success("async_openai")
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        await stream.close()
+
+
+async def _stream_gemini_for_analysis(question, context):
+    """Text chunks of a Gemini answer as they arrive"""
+    clients = get_llm_clients()
+    name = f"gemini:{GEMINI_MODEL}"
+    try:
+        response = await clients.gemini_model(GEMINI_MODEL).generate_content_async(
+            _gemini_prompt(question, context), stream=True)
+    except Exception as e:
+        clients.record_failure(name, e)
+        raise
+    clients.record_success(name)
+    async for chunk in response:
+        if chunk.text:
+            yield chunk.text
+
+
+# Providers in order of preference; circuit breakers and latency statistics live on them
+LLM_PROVIDERS = [
+    LLMProvider("OpenAI", OPENAI_MODEL, _ask_openai_for_analysis, api_key_env="OPENAI_API_KEY",
+                stream=_stream_openai_for_analysis),
+    LLMProvider("Gemini", GEMINI_MODEL, _ask_gemini_for_analysis, api_key_env="GEMINI_API_KEY",
+                stream=_stream_gemini_for_analysis),
+]
+
+
+def stream_llm_for_analysis(question, df, approximate=None):
+    """
+    Streaming variant of ask_llm_for_analysis: yields the answer in chunks as
+    the model produces them, so the first words show after the time to first
+    token instead of the whole generation time.
+    
+    Providers race as in ask_llm_for_analysis, hedged on the time to first
+    token: the first provider to produce a token is used and the other streams
+    are cancelled. If every provider fails before its first token, the basic
+    response is returned. Completed answers are cached like blocking ones.
+    """
+    print(">>> ENTERING LLM ANALYSIS (STREAMING) <<<")
+    
+    cache = get_llm_cache()
+    variant = _context_variant(df, approximate)
+    for model in (OPENAI_MODEL, GEMINI_MODEL):
+        cached_response = cache.get(llm_cache_key(df, question, model, variant))
+        if cached_response:
+            print(f"✅ Using cached {model} response")
+            yield cached_response
+            return
+    
+    context = _build_data_context(df, question, approximate)
+    print(f"✓ Data context built ({len(context)} chars)")
+    
+    start = time.perf_counter()
+    provider, stream = run_coroutine(race_streams(LLM_PROVIDERS, question, context))
+    if provider is not None:
+        model = provider.model
+        first, rest = stream
+        print(f"✅ Streaming {model} response (first token after {time.perf_counter() - start:.2f}s)")
+        
+        parts = [first]
+        try:
+            yield first
+            for chunk in iterate_stream(rest):
+                parts.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"❌ {model} stream interrupted: {type(e).__name__}: {str(e)}")
+            yield "\n\n⚠️ The response was interrupted."
+            return
+        finally:
+            # Also when the reader stops early (a no-op once the stream is exhausted)
+            run_coroutine(rest.aclose())
+        cache.put(llm_cache_key(df, question, model, variant), "".join(parts).strip(), model)
+        return
+    
+    print("❌ Both APIs failed, generating basic response from data...")
+    yield _generate_basic_response(question, df, approximate)
+
+
+def _context_variant(df, approximate=None) -> str:
+    """How the LLM data context of df is built, as part of the answer cache key"""
+    return f"approximate={get_dataset_stats(df, approximate=approximate).approximate}|tokens={context_tokens()}"
+
+
+def _build_data_context(df, question=None, approximate=None):
+    """Statistical context of the dataset, limited to the columns relevant to the question under a token budget"""
+    return get_context_builder(df, approximate).build(question)
 
 
-def _build_data_context(df):
-    """Build comprehensive statistical context from the dataset"""
-    context = f"📊 Dataset Overview: {len(df):,} rows, {len(df.columns)} columns\n\n"
-    
-    # Numeric column analysis
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-    if numeric_cols:
-        context += "📈 NUMERIC COLUMNS (Statistical Summary):\n"
-        for col in numeric_cols:
-            try:
-                col_data = df[col].dropna()
-                if len(col_data) > 0:
-                    context += f"  • {col.upper()}:\n"
-                    context += f"      - Count: {len(col_data):,} values\n"
-                    context += f"      - Min: {col_data.min():.2f}\n"
-                    context += f"      - Q1 (25%): {col_data.quantile(0.25):.2f}\n"
-                    context += f"      - Median: {col_data.median():.2f}\n"
-                    context += f"      - Q3 (75%): {col_data.quantile(0.75):.2f}\n"
-                    context += f"      - Max: {col_data.max():.2f}\n"
-                    context += f"      - Mean: {col_data.mean():.2f}\n"
-                    context += f"      - Std Dev: {col_data.std():.2f}\n"
-            except:
-                pass
-        context += "\n"
-    
-    # Categorical column analysis
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    if categorical_cols:
-        context += "🏷️ CATEGORICAL COLUMNS:\n"
-        for col in categorical_cols:
-            unique_count = df[col].nunique()
-            context += f"  • {col.upper()}: {unique_count} unique values\n"
-            # Show top 5 categories
-            top_values = df[col].value_counts().head(5)
-            for idx, (val, count) in enumerate(top_values.items(), 1):
-                pct = (count / len(df)) * 100
-                context += f"      {idx}. {val}: {count} ({pct:.1f}%)\n"
-        context += "\n"
-    
-    # Missing data summary
-    missing = df.isnull().sum()
-    if missing.sum() > 0:
-        context += "⚠️ MISSING DATA:\n"
-        for col in missing[missing > 0].index:
-            pct = (missing[col] / len(df)) * 100
-            context += f"  • {col}: {missing[col]} missing ({pct:.1f}%)\n"
-        context += "\n"
-    
-    # Data quality metrics
-    context += "✅ DATA QUALITY:\n"
-    context += f"  • Total cells: {len(df) * len(df.columns):,}\n"
-    context += f"  • Complete cells: {(len(df) * len(df.columns)) - df.isnull().sum().sum():,}\n"
-    context += f"  • Completeness: {((1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100):.1f}%\n"
-    
-    return context
-
-
-def _generate_basic_response(question, df):
+def _generate_basic_response(question, df, approximate=None):
     """Generate a basic response from data statistics when APIs are unavailable"""
     print(">>> GENERATING BASIC RESPONSE <<<")
     
     try:
+        stats = get_dataset_stats(df, approximate=approximate)
         response = f"""## Analysis of Your Dataset
 
 Based on your question: **{question}**
@@ -672,32 +870,32 @@ Based on your question: **{question}**
 ### 📊 Dataset Overview
 - **Total Rows:** {len(df):,}
 - **Total Columns:** {len(df.columns)}
-- **Data Size:** {df.memory_usage(deep=True).sum() / 1024 / 1024:.2f} MB
+- **Data Size:** {stats.memory_mb:.2f} MB
 
 ### 📈 Numeric Columns Analysis
 """
         
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        numeric_cols = stats.numeric_cols
         if numeric_cols:
             response += f"Found {len(numeric_cols)} numeric columns:\n"
             for col in numeric_cols[:5]:  # Show first 5
-                col_data = df[col].dropna()
+                summary = stats.numeric_summary(col)
                 response += f"\n**{col}:**\n"
-                response += f"- Min: {col_data.min():.2f}\n"
-                response += f"- Max: {col_data.max():.2f}\n"
-                response += f"- Mean: {col_data.mean():.2f}\n"
-                response += f"- Median: {col_data.median():.2f}\n"
+                response += f"- Min: {summary['min']:.2f}\n"
+                response += f"- Max: {summary['max']:.2f}\n"
+                response += f"- Mean: {summary['mean']:.2f}\n"
+                response += f"- Median: {summary['50%']:.2f}\n"
         
         response += f"\n### 🏷️ Categorical Columns Analysis\n"
-        cat_cols = df.select_dtypes(include=['object']).columns.tolist()
+        cat_cols = stats.categorical_cols
         if cat_cols:
             response += f"Found {len(cat_cols)} categorical columns\n"
             for col in cat_cols[:3]:  # Show first 3
-                unique_count = df[col].nunique()
+                unique_count = stats.nunique(col)
                 response += f"- **{col}:** {unique_count} unique values\n"
         
         response += f"\n### ⚠️ Data Quality\n"
-        missing_pct = (df.isnull().sum().sum() / (len(df) * len(df.columns)) * 100)
+        missing_pct = stats.missing_pct
         response += f"- Missing data: {missing_pct:.1f}%\n"
         response += f"- Data completeness: {100 - missing_pct:.1f}%\n"
         
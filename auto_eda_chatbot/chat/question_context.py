@@ -0,0 +1,66 @@
+"""
+Question Context Module
+=======================
+Per-dataset question-parsing context shared by the Q&A routing functions.
+
+The column lists and a phrase index over column names (plus simple synonyms)
+are built once per dataset, so finding the columns a question mentions costs
+O(question length) instead of a substring test against every column.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.dataset_cache import dataset_memo
+from .entity_index import PhraseIndex, phrase_keys
+
+
+def column_synonyms(key: str) -> list:
+    """Alternative spellings of a column phrase key a question may use"""
+    synonyms = [key]
+    spaced = key.replace("_", " ")
+    if spaced != key:
+        synonyms.append(spaced)
+    for form in list(synonyms):
+        if form.endswith("y") and not form.endswith(("ay", "ey", "oy", "uy")):
+            synonyms.append(form[:-1] + "ies")
+        elif not form.endswith("s"):
+            synonyms.append(form + "s")
+    return synonyms
+
+
+class QuestionContext:
+    """Column lists and column-name lookups for one dataset"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = tuple(df.columns)
+        self.numeric_cols = tuple(df.select_dtypes(include=['number']).columns)
+        self.categorical_cols = tuple(df.select_dtypes(include=['object', 'category', 'bool']).columns)
+        self._numeric = set(self.numeric_cols)
+
+        keys, positions = [], []
+        for position, key in enumerate(phrase_keys(self.columns)):
+            for synonym in column_synonyms(key):
+                keys.append(synonym)
+                positions.append(position)
+        self._column_index = PhraseIndex(keys, np.asarray(positions, dtype=np.intp))
+
+    def find_columns(self, question) -> list:
+        """Columns mentioned in the question as whole words, in dataset column order"""
+        positions = sorted(set(self._column_index.find_all(question)))
+        return [self.columns[position] for position in positions]
+
+    def find_numeric_columns(self, question) -> list:
+        """Numeric columns mentioned in the question, in dataset column order"""
+        return [col for col in self.find_columns(question) if col in self._numeric]
+
+
+def get_question_context(df: pd.DataFrame) -> QuestionContext:
+    """Question context for df, built once per dataset version"""
+    return dataset_memo(df, "question_context", lambda: QuestionContext(df))
@@ -7,7 +7,8 @@ Comprehensive charting library with modern chart types:
 - Radar/Spider Charts, Stacked Bar Charts, Gauges
 - Comparison Charts, and more
 
-Uses matplotlib and plotly for rich visualizations.
+Uses matplotlib and plotly for rich visualizations. Point-heavy charts draw
+within the render budget of eda.sampling and note the share they show.
 """
 
 import matplotlib.pyplot as plt
@@ -16,11 +17,17 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from .eda_palette import EDAPalette, EDAPaletteConfigurator
+from .sampling import annotate_sample_ratio, lttb, minmax_decimate, sample_scatter
 
 # Ensure dark theme is applied
 EDAPaletteConfigurator.apply_dark_theme()
 
 
+def _is_categorical(series):
+    """True for string, category and bool columns (anything charted by value counts)"""
+    return not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series)
+
+
 def create_area_chart(df, col_list=None):
     """
     Create area chart showing cumulative distribution.
@@ -30,16 +37,23 @@ def create_area_chart(df, col_list=None):
         col_list: List of column names to plot (default: first 3)
     """
     if col_list is None:
-        col_list = df.select_dtypes(include=['float64', 'int64']).columns[:3]
+        col_list = df.select_dtypes(include=['number']).columns[:3]
     
     try:
         fig, ax = plt.subplots(figsize=(5, 3.5))
+        shown = plotted = 0
         
         for idx, col in enumerate(col_list):
-            ax.fill_between(range(len(df)), df[col].values, alpha=0.6, 
+            # Min-max decimation keeps the envelope of the filled area
+            values = df[col].to_numpy(dtype=float, na_value=np.nan)
+            positions = minmax_decimate(values)
+            shown += len(positions)
+            plotted += int(np.isfinite(values).sum())
+            ax.fill_between(positions, values[positions], alpha=0.6, 
                            color=EDAPalette.CATEGORICAL['colors'][idx % 8],
                            label=str(col)[:20])
         
+        annotate_sample_ratio(ax, shown, plotted, "min-max")
         ax.set_title("Area Chart - Value Distribution Over Index", 
                     fontsize=13, fontweight='bold', color=EDAPalette.ACCENT['glow_cyan'], pad=15)
         ax.set_xlabel("Index", color=EDAPalette.ACCENT['glow_cyan'], fontweight='bold')
@@ -66,7 +80,7 @@ def create_column_chart(df, col_name, top_n=10):
     try:
         fig, ax = plt.subplots(figsize=(5, 4))
         
-        if df[col_name].dtype == 'object':
+        if _is_categorical(df[col_name]):
             # Categorical column
             value_counts = df[col_name].value_counts().head(top_n)
             x_pos = np.arange(len(value_counts))
@@ -117,7 +131,7 @@ def create_doughnut_chart(df, col_name, top_n=8):
     try:
         fig, ax = plt.subplots(figsize=(7, 6.5))
         
-        if df[col_name].dtype == 'object':
+        if _is_categorical(df[col_name]):
             value_counts = df[col_name].value_counts().head(top_n)
             labels = [str(x)[:20] for x in value_counts.index]
             sizes = value_counts.values
@@ -159,7 +173,7 @@ def create_bubble_chart(df, x_col=None, y_col=None, size_col=None, color_col=Non
         color_col: Column for bubble color (default: fourth numeric)
     """
     try:
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = df.select_dtypes(include=['number']).columns
         
         if len(numeric_cols) < 2:
             st.warning("Need at least 2 numeric columns for bubble chart")
@@ -172,17 +186,20 @@ def create_bubble_chart(df, x_col=None, y_col=None, size_col=None, color_col=Non
         
         fig, ax = plt.subplots(figsize=(5, 4))
         
-        x_data = df[x_col].values
-        y_data = df[y_col].values
-        size_data = df[size_col].values
-        color_data = df[color_col].values
+        x_data = df[x_col].to_numpy(dtype=float, na_value=np.nan)
+        y_data = df[y_col].to_numpy(dtype=float, na_value=np.nan)
+        size_data = df[size_col].to_numpy(dtype=float, na_value=np.nan)
+        color_data = df[color_col].to_numpy(dtype=float, na_value=np.nan)
         
-        # Normalize sizes
-        sizes = (size_data - size_data.min()) / (size_data.max() - size_data.min()) * 300 + 50
+        # Normalize sizes and colors over all rows, then draw a density-preserving sample
+        sizes = (size_data - np.nanmin(size_data)) / (np.nanmax(size_data) - np.nanmin(size_data)) * 300 + 50
+        positions = sample_scatter(x_data, y_data)
         
-        scatter = ax.scatter(x_data, y_data, s=sizes, c=color_data, 
+        scatter = ax.scatter(x_data[positions], y_data[positions], s=sizes[positions], c=color_data[positions], 
                            cmap='twilight', alpha=0.7, edgecolors=EDAPalette.ACCENT['glow_cyan'],
-                           linewidth=1.5)
+                           linewidth=1.5, vmin=np.nanmin(color_data), vmax=np.nanmax(color_data))
+        plotted = int((np.isfinite(x_data) & np.isfinite(y_data)).sum())
+        annotate_sample_ratio(ax, len(positions), plotted, "stratified sample")
         
         cbar = plt.colorbar(scatter, ax=ax)
         cbar.set_label(str(color_col), color=EDAPalette.ACCENT['glow_cyan'], fontweight='bold')
@@ -216,7 +233,7 @@ def create_radar_chart(df, col_list=None):
     try:
         from sklearn.preprocessing import MinMaxScaler
         
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = df.select_dtypes(include=['number']).columns
         
         if len(numeric_cols) < 3:
             st.warning("Need at least 3 numeric columns for radar chart")
@@ -274,7 +291,7 @@ def create_stacked_bar_chart(df, col_name, stack_col=None, top_n=5):
     """
     try:
         if stack_col is None:
-            cat_cols = df.select_dtypes(include=['object']).columns
+            cat_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns
             if len(cat_cols) < 2:
                 st.warning("Need at least 2 categorical columns for stacked bar")
                 return None
@@ -379,7 +396,7 @@ def create_comparison_chart(df, col_list=None, normalize=True):
         normalize: Normalize to 0-1 scale
     """
     try:
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = df.select_dtypes(include=['number']).columns
         col_list = col_list or numeric_cols[:6]
         
         comparison_data = df[col_list].describe().loc[['mean', '50%', 'std']].T
@@ -427,17 +444,24 @@ def create_line_area_combination(df, col_list=None):
         col_list: Columns to plot
     """
     try:
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        numeric_cols = df.select_dtypes(include=['number']).columns
         col_list = col_list or numeric_cols[:3]
         
         fig, ax = plt.subplots(figsize=(5, 3.5))
+        shown = plotted = 0
         
         for idx, col in enumerate(col_list):
-            ax.plot(df.index, df[col], marker='o', linewidth=2.5, markersize=4,
+            values = df[col].to_numpy(dtype=float, na_value=np.nan)
+            positions = lttb(values)
+            shown += len(positions)
+            plotted += int(np.isfinite(values).sum())
+            x_values = df.index[positions]
+            ax.plot(x_values, values[positions], marker='o', linewidth=2.5, markersize=4,
                    label=str(col)[:20], color=EDAPalette.CATEGORICAL['colors'][idx % 8])
-            ax.fill_between(df.index, df[col], alpha=0.2, 
+            ax.fill_between(x_values, values[positions], alpha=0.2, 
                           color=EDAPalette.CATEGORICAL['colors'][idx % 8])
         
+        annotate_sample_ratio(ax, shown, plotted, "LTTB")
         ax.set_title("Line-Area Combination Chart", fontsize=13, fontweight='bold',
                     color=EDAPalette.ACCENT['glow_cyan'], pad=15)
         ax.set_xlabel("Index", color=EDAPalette.ACCENT['glow_cyan'], fontweight='bold')
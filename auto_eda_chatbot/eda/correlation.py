@@ -0,0 +1,248 @@
+"""
+Correlation Module
+==================
+Blocked, out-of-core correlation engine.
+
+The matrix is assembled from co-moment sums accumulated over row chunks, so
+only one chunk of rows is converted to floats at a time. Missing values are
+handled pairwise, as in ``DataFrame.corr``: every entry uses the rows where
+both columns are present. Columns are centred on a per-column shift in
+float64 before summing, and only then cast to the accumulation dtype, so
+float32 keeps its precision on columns with large offsets (e.g. timestamps or
+IDs around 1e6).
+
+Wide tables are split into column blocks; the upper-triangle block pairs are
+computed in a process pool that reads the data from shared memory.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+import pandas as pd
+
+CORRELATION_METHODS = ("pearson", "spearman")
+
+# Rows converted and accumulated per step
+DEFAULT_ROW_CHUNK = 100_000
+
+# Columns per block in the process-pool path
+DEFAULT_BLOCK_COLS = 256
+
+# Tables with at least this many columns use the process pool (EDA_CORR_PARALLEL_COLS)
+DEFAULT_PARALLEL_COLS = 512
+
+_pool = None
+_pool_workers = 0
+
+
+class CoMoments:
+    """
+    Pairwise-complete co-moment sums between two column sets.
+
+    With ``symmetric=True`` both sets are the same columns and the
+    right-hand sums are taken as transposes of the left-hand ones.
+    """
+
+    def __init__(self, n_left: int, n_right: int, dtype=np.float64, symmetric: bool = False):
+        shape = (n_left, n_right)
+        self.symmetric = symmetric
+        self.count = np.zeros(shape, dtype=dtype)
+        self.sum_left = np.zeros(shape, dtype=dtype)
+        self.sumsq_left = np.zeros(shape, dtype=dtype)
+        self.sum_right = None if symmetric else np.zeros(shape, dtype=dtype)
+        self.sumsq_right = None if symmetric else np.zeros(shape, dtype=dtype)
+        self.cross = np.zeros(shape, dtype=dtype)
+
+    def update(self, left: np.ndarray, right: np.ndarray = None):
+        """Add a row chunk of centred values (NaN for missing)"""
+        left_missing = np.isnan(left)
+        left = np.where(left_missing, 0, left)
+        if self.symmetric:
+            right, right_missing = left, left_missing
+        else:
+            right_missing = np.isnan(right)
+            right = np.where(right_missing, 0, right)
+
+        # Sums as if every row were complete: one large product, the rest column sums
+        rows = len(left)
+        self.count += rows
+        self.cross += left.T @ right
+        self.sum_left += left.sum(axis=0)[:, None]
+        self.sumsq_left += (left * left).sum(axis=0)[:, None]
+        if not self.symmetric:
+            self.sum_right += right.sum(axis=0)[None, :]
+            self.sumsq_right += (right * right).sum(axis=0)[None, :]
+
+        # Pairwise-complete corrections, only over the columns that have gaps
+        left_gaps = np.flatnonzero(left_missing.any(axis=0))
+        right_gaps = left_gaps if self.symmetric else np.flatnonzero(right_missing.any(axis=0))
+        if len(right_gaps):
+            right_absent = right_missing[:, right_gaps].astype(left.dtype)
+            self.count[:, right_gaps] -= right_absent.sum(axis=0)[None, :]
+            self.sum_left[:, right_gaps] -= left.T @ right_absent
+            self.sumsq_left[:, right_gaps] -= (left * left).T @ right_absent
+        if len(left_gaps):
+            left_absent = left_missing[:, left_gaps].astype(left.dtype)
+            self.count[left_gaps, :] -= left_absent.sum(axis=0)[:, None]
+            if not self.symmetric:
+                self.sum_right[left_gaps, :] -= left_absent.T @ right
+                self.sumsq_right[left_gaps, :] -= left_absent.T @ (right * right)
+        if len(left_gaps) and len(right_gaps):
+            # Rows missing on both sides were subtracted twice
+            self.count[np.ix_(left_gaps, right_gaps)] += left_absent.T @ right_absent
+        return self
+
+    def correlation(self) -> np.ndarray:
+        sum_right = self.sum_left.T if self.symmetric else self.sum_right
+        sumsq_right = self.sumsq_left.T if self.symmetric else self.sumsq_right
+        with np.errstate(divide="ignore", invalid="ignore"):
+            count = np.where(self.count > 1, self.count, np.nan)
+            cov = self.cross - self.sum_left * sum_right / count
+            var_left = self.sumsq_left - self.sum_left ** 2 / count
+            var_right = sumsq_right - sum_right ** 2 / count
+            denominator = np.sqrt(var_left * var_right)
+            result = np.where(denominator > 0, cov / denominator, np.nan)
+        return np.clip(result.astype(np.float64), -1.0, 1.0)
+
+
+def _row_chunks(frame: pd.DataFrame, columns, row_chunk: int, dtype):
+    """Float arrays of successive row chunks; only one chunk is materialized at a time"""
+    for start in range(0, len(frame), row_chunk):
+        yield frame.iloc[start:start + row_chunk][columns].to_numpy(dtype=dtype, na_value=np.nan)
+
+
+def _column_shift(rows: np.ndarray) -> np.ndarray:
+    """Per-column centre taken from the first chunk (any value near the mean works)"""
+    present = ~np.isnan(rows)
+    totals = np.where(present, rows, 0).sum(axis=0)
+    counts = present.sum(axis=0)
+    return (np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)).astype(rows.dtype)
+
+
+def _centred_chunks(frame: pd.DataFrame, columns, row_chunk: int, dtype):
+    """Row chunks minus a per-column shift, centred in float64 and then cast to dtype"""
+    shift = None
+    for rows in _row_chunks(frame, columns, row_chunk, np.float64):
+        if shift is None:
+            shift = _column_shift(rows)
+        yield (rows - shift).astype(dtype, copy=False)
+
+
+def _block_correlation(data, left, right, row_chunk, dtype) -> np.ndarray:
+    """Correlation block between column slices left and right of an in-memory array of centred values"""
+    moments = CoMoments(left.stop - left.start, right.stop - right.start, dtype, symmetric=left == right)
+    for start in range(0, len(data), row_chunk):
+        rows = data[start:start + row_chunk]
+        moments.update(rows[:, left], None if left == right else rows[:, right])
+    return moments.correlation()
+
+
+def _pool_task(shm_name, shape, data_dtype, left, right, row_chunk, dtype):
+    """Process-pool worker: attach to the shared array and compute one block"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray(shape, dtype=data_dtype, buffer=shm.buf)
+        return _block_correlation(data, left, right, row_chunk, dtype)
+    finally:
+        shm.close()
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool reused across calls (spawned once; safe next to Streamlit's threads)"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != max_workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"))
+        _pool_workers = max_workers
+    return _pool
+
+
+def _blocked_parallel(frame, columns, row_chunk, block_cols, dtype, max_workers) -> np.ndarray:
+    """Upper-triangle column blocks computed in the process pool from shared memory"""
+    n_rows, n_cols = len(frame), len(columns)
+    blocks = [slice(start, min(start + block_cols, n_cols)) for start in range(0, n_cols, block_cols)]
+    pairs = [(i, j) for i in range(len(blocks)) for j in range(i, len(blocks))]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(n_rows * n_cols * np.dtype(dtype).itemsize, 1))
+    shared = None
+    try:
+        shared = np.ndarray((n_rows, n_cols), dtype=dtype, buffer=shm.buf)
+        for start, rows in zip(range(0, n_rows, row_chunk), _centred_chunks(frame, columns, row_chunk, dtype)):
+            shared[start:start + len(rows)] = rows
+
+        pool = _get_pool(max_workers)
+        futures = {
+            (i, j): pool.submit(_pool_task, shm.name, shared.shape, shared.dtype,
+                                blocks[i], blocks[j], row_chunk, dtype)
+            for i, j in pairs
+        }
+        result = np.empty((n_cols, n_cols))
+        for (i, j), future in futures.items():
+            block = future.result()
+            result[blocks[i], blocks[j]] = block
+            result[blocks[j], blocks[i]] = block.T
+    finally:
+        shared = None  # Release the buffer view before closing the segment
+        shm.close()
+        shm.unlink()
+    return result
+
+
+def _chunked_serial(frame, columns, row_chunk, dtype) -> np.ndarray:
+    """All columns as one block, streaming row chunks straight from the frame"""
+    moments = CoMoments(len(columns), len(columns), dtype, symmetric=True)
+    for rows in _centred_chunks(frame, columns, row_chunk, dtype):
+        moments.update(rows)
+    return moments.correlation()
+
+
+def validate_method(method: str):
+    """Raise ValueError unless method is one of CORRELATION_METHODS"""
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Unknown correlation method '{method}'. Use one of: {', '.join(CORRELATION_METHODS)}")
+
+
+def correlation_matrix(df: pd.DataFrame, columns=None, method: str = "pearson", float32: bool = False,
+                       row_chunk: int = DEFAULT_ROW_CHUNK, block_cols: int = DEFAULT_BLOCK_COLS,
+                       max_workers=None) -> pd.DataFrame:
+    """
+    Pairwise-complete correlation matrix, equivalent to ``df[columns].corr(method)``.
+
+    Args:
+        columns: numeric columns to correlate (default: all numeric columns)
+        method: 'pearson' or 'spearman' (Pearson on per-column ranks; with missing
+            values this differs slightly from pandas, which re-ranks each pair)
+        float32: accumulate in float32 (half the memory; entries within about 1e-4 of float64)
+        row_chunk: rows accumulated per step
+        block_cols: columns per block when computing in the process pool
+        max_workers: pool size; default EDA_CORR_WORKERS or the CPU count
+    """
+    validate_method(method)
+    if columns is None:
+        columns = df.select_dtypes(include=['number']).columns
+    columns = list(columns)
+    dtype = np.float32 if float32 else np.float64
+
+    frame = df
+    if method == "spearman":
+        # Ranks need whole columns; Pearson on the ranks is Spearman's rho
+        frame = df[columns].rank()
+
+    if max_workers is None:
+        max_workers = int(os.getenv("EDA_CORR_WORKERS", os.cpu_count() or 1))
+    parallel_cols = int(os.getenv("EDA_CORR_PARALLEL_COLS", DEFAULT_PARALLEL_COLS))
+
+    if not columns or len(frame) == 0:
+        result = np.full((len(columns), len(columns)), np.nan)
+    elif max_workers > 1 and len(columns) >= parallel_cols and len(columns) > block_cols:
+        result = _blocked_parallel(frame, columns, row_chunk, block_cols, dtype, max_workers)
+    else:
+        result = _chunked_serial(frame, columns, row_chunk, dtype)
+
+    # A column correlates perfectly with itself wherever it has any spread
+    diagonal = np.diag(result).copy()
+    np.fill_diagonal(result, np.where(np.isnan(diagonal), np.nan, 1.0))
+    return pd.DataFrame(result, index=columns, columns=columns)
@@ -4,6 +4,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from .stats import get_dataset_stats
+from .render_pool import RenderJob, render_charts
+
 sns.set_style("whitegrid")
 
 def sanitize_label(label):
@@ -21,7 +24,120 @@ def sanitize_label(label):
         label = label.encode('utf-8', 'replace').decode('utf-8')
     return label
 
-def show_complete_dashboard(df):
+
+def _type_breakdown_figure(n_numeric, n_categorical):
+    """Bar chart of numeric vs categorical column counts"""
+    col_info = pd.DataFrame({
+        'Type': ['Numeric', 'Categorical'],
+        'Count': [n_numeric, n_categorical]
+    })
+    
+    fig, ax = plt.subplots(figsize=(8, 5))
+    colors = ['#667eea', '#764ba2']
+    bars = ax.bar(col_info['Type'], col_info['Count'], color=colors, edgecolor='#2c3e50', linewidth=2, alpha=0.85)
+    ax.set_ylabel('Count', fontsize=12, fontweight='bold')
+    ax.set_title('Data Type Distribution', fontsize=13, fontweight='bold', pad=15)
+    
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+               f'{int(height)}',
+               ha='center', va='bottom', fontweight='bold', fontsize=12)
+    
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(True, alpha=0.3, axis='y')
+    return fig
+
+
+def _distribution_figure(df, columns):
+    """Stacked histograms of up to three numeric columns"""
+    fig, axes = plt.subplots(len(columns), 1, figsize=(9, 10))
+    
+    if len(columns) == 1:
+        axes = [axes]
+    
+    for idx, col in enumerate(columns):
+        axes[idx].hist(df[col].dropna(), bins=30, color='#667eea', edgecolor='#2c3e50', alpha=0.8)
+        safe_col = sanitize_label(col)
+        axes[idx].set_title(f'{safe_col}', fontsize=11, fontweight='bold')
+        axes[idx].set_xlabel('Value', fontsize=10)
+        axes[idx].set_ylabel('Frequency', fontsize=10)
+        axes[idx].spines['top'].set_visible(False)
+        axes[idx].spines['right'].set_visible(False)
+        axes[idx].grid(True, alpha=0.3, axis='y')
+    
+    fig.tight_layout()
+    return fig
+
+
+def _top_categories_figure(top_categories, col):
+    """Horizontal bars of the most frequent values of a column"""
+    fig, ax = plt.subplots(figsize=(9, 5))
+    colors = plt.cm.Set3(np.linspace(0, 1, len(top_categories)))
+    bars = ax.barh(range(len(top_categories)), top_categories.values, color=colors, edgecolor='#2c3e50', linewidth=1.5)
+    ax.set_yticks(range(len(top_categories)))
+    ax.set_yticklabels([str(x)[:20] for x in top_categories.index], fontsize=10)
+    ax.set_xlabel('Count', fontweight='bold', fontsize=11)
+    safe_col = sanitize_label(col)
+    ax.set_title(f'Top Categories - {safe_col}', fontweight='bold', fontsize=12, pad=15)
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    ax.grid(True, alpha=0.3, axis='x')
+    return fig
+
+
+def _top_categories_compact_figure(top_categories, col):
+    """Compact variant of the top categories chart"""
+    fig, ax = plt.subplots(figsize=(8, 4))
+    colors = plt.cm.Set2(np.linspace(0, 1, len(top_categories)))
+    top_categories.plot(kind='barh', ax=ax, color=colors, edgecolor='#2c3e50', linewidth=1.5)
+    ax.set_xlabel('Count', fontweight='bold')
+    safe_col = sanitize_label(col)
+    ax.set_title(f'Top Categories - {safe_col}', fontweight='bold')
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+    return fig
+
+
+def _correlation_figure(corr_matrix):
+    """Annotated correlation heatmap"""
+    fig, ax = plt.subplots(figsize=(10, 8))
+    sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', center=0,
+               square=True, linewidths=1, cbar_kws={"shrink": 0.8},
+               ax=ax, vmin=-1, vmax=1)
+    ax.set_title('Correlation Matrix', fontsize=12, fontweight='bold', pad=20)
+    return fig
+
+
+def _dashboard_charts(df, stats) -> dict:
+    """Render every dashboard chart in one batch ({name: PNG bytes, or None if it failed})"""
+    numeric_cols = stats.numeric_cols
+    categorical_cols = stats.categorical_cols
+    
+    jobs = {
+        "types": RenderJob(_type_breakdown_figure, (len(numeric_cols), len(categorical_cols)), uses_frame=False,
+                           chart_type="dashboard_types", width=8, height=5),
+    }
+    if numeric_cols:
+        jobs["distribution"] = RenderJob(_distribution_figure, (numeric_cols[:3],), columns=numeric_cols[:3],
+                                         chart_type="dashboard_distribution", width=9, height=10)
+    for col in categorical_cols[:2]:
+        top_categories = stats.top_values(col, 8)
+        jobs[("top_categories", col)] = RenderJob(
+            _top_categories_figure, (top_categories, col), uses_frame=False, columns=[col],
+            chart_type="dashboard_top_categories", width=9, height=5, approximate=stats.approximate)
+        jobs[("top_categories_compact", col)] = RenderJob(
+            _top_categories_compact_figure, (top_categories, col), uses_frame=False, columns=[col],
+            chart_type="dashboard_top_categories_compact", width=8, height=4, approximate=stats.approximate)
+    if len(numeric_cols) > 1:
+        jobs["correlation"] = RenderJob(_correlation_figure, (stats.correlation(),), uses_frame=False,
+                                        chart_type="dashboard_correlation", width=10, height=8)
+    
+    return dict(zip(jobs, render_charts(df, list(jobs.values()))))
+
+
+def show_complete_dashboard(df, approximate=None):
     """Display professional student performance dashboard"""
     
     # Add professional CSS styling
@@ -67,13 +183,17 @@ def show_complete_dashboard(df):
     """, unsafe_allow_html=True)
     
     try:
-        total_rows = len(df)
-        total_cols = len(df.columns)
-        missing_pct = (df.isnull().sum().sum() / (total_rows * total_cols) * 100) if (total_rows * total_cols) > 0 else 0
-        duplicate_pct = (df.duplicated().sum() / total_rows * 100) if total_rows > 0 else 0
+        stats = get_dataset_stats(df, approximate=approximate)
+        total_rows = stats.n_rows
+        total_cols = stats.n_cols
+        missing_pct = stats.missing_pct
+        duplicate_pct = (stats.duplicate_rows / total_rows * 100) if total_rows > 0 else 0
         
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+        numeric_cols = stats.numeric_cols
+        categorical_cols = stats.categorical_cols
+        
+        # Every chart of the page, rendered as one parallel batch
+        charts = _dashboard_charts(df, stats)
         
     except Exception as e:
         st.error(f"Error calculating metrics: {str(e)}")
@@ -151,28 +271,8 @@ def show_complete_dashboard(df):
     
     with col1:
         st.markdown("##### 📊 Column Type Breakdown")
-        col_info = pd.DataFrame({
-            'Type': ['Numeric', 'Categorical'],
-            'Count': [len(numeric_cols), len(categorical_cols)]
-        })
-        
-        fig, ax = plt.subplots(figsize=(8, 5))
-        colors = ['#667eea', '#764ba2']
-        bars = ax.bar(col_info['Type'], col_info['Count'], color=colors, edgecolor='#2c3e50', linewidth=2, alpha=0.85)
-        ax.set_ylabel('Count', fontsize=12, fontweight='bold')
-        ax.set_title('Data Type Distribution', fontsize=13, fontweight='bold', pad=15)
-        
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontweight='bold', fontsize=12)
-        
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.grid(True, alpha=0.3, axis='y')
-        st.pyplot(fig, width="stretch")
-        plt.close()
+        if charts["types"] is not None:
+            st.image(charts["types"], width="stretch")
     
     with col2:
         st.markdown("##### ✨ Data Quality Metrics")
@@ -192,7 +292,7 @@ def show_complete_dashboard(df):
     if numeric_cols:
         st.markdown("#### 📊 Numeric Columns Analysis")
         
-        numeric_stats = df[numeric_cols].describe().T[['count', 'mean', 'std', 'min', 'max']]
+        numeric_stats = stats.describe_numeric(numeric_cols).T[['count', 'mean', 'std', 'min', 'max']]
         numeric_stats.columns = ['Count', 'Mean', 'Std Dev', 'Min', 'Max']
         
         col1, col2 = st.columns(2)
@@ -203,27 +303,9 @@ def show_complete_dashboard(df):
         
         with col2:
             st.markdown("##### 📉 Distribution Overview")
-            try:
-                fig, axes = plt.subplots(min(3, len(numeric_cols)), 1, figsize=(9, 10))
-                
-                if len(numeric_cols) == 1:
-                    axes = [axes]
-                
-                for idx, col in enumerate(numeric_cols[:3]):
-                    if idx < len(axes):
-                        axes[idx].hist(df[col].dropna(), bins=30, color='#667eea', edgecolor='#2c3e50', alpha=0.8)
-                        safe_col = sanitize_label(col)
-                        axes[idx].set_title(f'{safe_col}', fontsize=11, fontweight='bold')
-                        axes[idx].set_xlabel('Value', fontsize=10)
-                        axes[idx].set_ylabel('Frequency', fontsize=10)
-                        axes[idx].spines['top'].set_visible(False)
-                        axes[idx].spines['right'].set_visible(False)
-                        axes[idx].grid(True, alpha=0.3, axis='y')
-                
-                plt.tight_layout()
-                st.pyplot(fig, width="stretch")
-                plt.close()
-            except Exception as e:
+            if charts["distribution"] is not None:
+                st.image(charts["distribution"], width="stretch")
+            else:
                 st.warning("Could not render distribution charts")
         
         st.divider()
@@ -235,9 +317,9 @@ def show_complete_dashboard(df):
         for col in categorical_cols:
             cat_info.append({
                 'Column': sanitize_label(col),
-                'Unique': df[col].nunique(),
-                'Top Value': str(df[col].value_counts().index[0])[:30] if len(df[col].value_counts()) > 0 else 'N/A',
-                'Missing': df[col].isnull().sum()
+                'Unique': stats.nunique(col),
+                'Top Value': str(stats.value_counts(col).index[0])[:30] if len(stats.value_counts(col)) > 0 else 'N/A',
+                'Missing': stats.missing[col]
             })
         
         cat_df = pd.DataFrame(cat_info)
@@ -250,38 +332,15 @@ def show_complete_dashboard(df):
             plot_col = col1 if idx == 0 else col2
             
             with plot_col:
-                try:
-                    fig, ax = plt.subplots(figsize=(9, 5))
-                    top_categories = df[col].value_counts().head(8)
-                    colors = plt.cm.Set3(np.linspace(0, 1, len(top_categories)))
-                    bars = ax.barh(range(len(top_categories)), top_categories.values, color=colors, edgecolor='#2c3e50', linewidth=1.5)
-                    ax.set_yticks(range(len(top_categories)))
-                    ax.set_yticklabels([str(x)[:20] for x in top_categories.index], fontsize=10)
-                    ax.set_xlabel('Count', fontweight='bold', fontsize=11)
-                    safe_col = sanitize_label(col)
-                    ax.set_title(f'Top Categories - {safe_col}', fontweight='bold', fontsize=12, pad=15)
-                    ax.spines['top'].set_visible(False)
-                    ax.spines['right'].set_visible(False)
-                    ax.grid(True, alpha=0.3, axis='x')
-                    st.pyplot(fig, width="stretch")
-                    plt.close()
-                except Exception as e:
+                if charts[("top_categories", col)] is not None:
+                    st.image(charts[("top_categories", col)], width="stretch")
+                else:
                     st.warning(f"Could not render chart for {col}")
             
             with plot_col:
-                try:
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    top_categories = df[col].value_counts().head(8)
-                    colors = plt.cm.Set2(np.linspace(0, 1, len(top_categories)))
-                    top_categories.plot(kind='barh', ax=ax, color=colors, edgecolor='#2c3e50', linewidth=1.5)
-                    ax.set_xlabel('Count', fontweight='bold')
-                    safe_col = sanitize_label(col)
-                    ax.set_title(f'Top Categories - {safe_col}', fontweight='bold')
-                    ax.spines['top'].set_visible(False)
-                    ax.spines['right'].set_visible(False)
-                    st.pyplot(fig, width="stretch")
-                    plt.close()
-                except:
+                if charts[("top_categories_compact", col)] is not None:
+                    st.image(charts[("top_categories_compact", col)], width="stretch")
+                else:
                     st.write("Chart unavailable")
         
         st.divider()
@@ -289,18 +348,10 @@ def show_complete_dashboard(df):
     if len(numeric_cols) > 1:
         st.markdown("### 🔗 Correlation Analysis")
         
-        try:
-            corr_matrix = df[numeric_cols].corr()
-            
-            fig, ax = plt.subplots(figsize=(10, 8))
-            sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-                       square=True, linewidths=1, cbar_kws={"shrink": 0.8},
-                       ax=ax, vmin=-1, vmax=1)
-            ax.set_title('Correlation Matrix', fontsize=12, fontweight='bold', pad=20)
-            st.pyplot(fig, width="stretch")
-            plt.close()
-        except Exception as e:
-            st.warning(f"Could not generate correlation matrix: {str(e)}")
+        if charts["correlation"] is not None:
+            st.image(charts["correlation"], width="stretch")
+        else:
+            st.warning("Could not generate correlation matrix")
         
         st.divider()
     
@@ -326,7 +377,7 @@ def show_complete_dashboard(df):
             st.write(f"• Rows: **{total_rows:,}**")
             st.write(f"• Columns: **{total_cols}**")
             st.write(f"• Total Cells: **{total_rows * total_cols:,}**")
-            st.write(f"• Memory: **{df.memory_usage(deep=True).sum() / 1024**2:.2f} MB**")
+            st.write(f"• Memory: **{stats.memory_mb:.2f} MB**")
         
         with col2:
             st.markdown("**Data Characteristics**")
@@ -342,9 +393,9 @@ def show_complete_dashboard(df):
     col_details = pd.DataFrame({
         'Column': df.columns,
         'Type': df.dtypes.astype(str),
-        'Non-Null': df.count().values,
-        'Null': df.isnull().sum().values,
-        'Unique': [df[col].nunique() for col in df.columns]
+        'Non-Null': (total_rows - stats.missing).values,
+        'Null': stats.missing.values,
+        'Unique': [stats.nunique(col) for col in df.columns]
     })
     
     st.dataframe(col_details, width="stretch", height=400)
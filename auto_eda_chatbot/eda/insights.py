@@ -1,18 +1,56 @@
-def generate_insights(df):
+import numpy as np
+import pandas as pd
+
+from .correlation import validate_method
+from .stats import get_dataset_stats
+
+
+def strong_correlations(corr_matrix: pd.DataFrame, threshold=0.8, top_k=None):
+    """
+    Column pairs whose absolute correlation exceeds threshold.
+
+    Only the upper triangle is scanned, so each pair appears once. Pairs are
+    ranked by absolute correlation, strongest first, and cut to top_k.
+    Returns a list of (column_1, column_2, correlation) tuples.
+    """
+    values = corr_matrix.to_numpy(dtype=np.float64)
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_values = values[rows, cols]
+
+    # NaN (constant columns) compares False and drops out here
+    strong = np.flatnonzero(np.abs(pair_values) > threshold)
+    strength = np.abs(pair_values[strong])
+    if top_k is not None and top_k < len(strong):
+        keep = np.argpartition(-strength, top_k - 1)[:top_k]
+        strong, strength = strong[keep], strength[keep]
+    strong = strong[np.argsort(-strength, kind="stable")]
+
+    names = corr_matrix.columns
+    return [(names[rows[i]], names[cols[i]], float(pair_values[i])) for i in strong]
+
+
+def generate_insights(df, threshold=0.8, top_k=None, method="pearson", approximate=None, max_missing=None):
+    """
+    Plain-text findings: columns with missing values, then strongly correlated pairs.
+
+    max_missing keeps only the columns with the most missing values; top_k
+    keeps only the strongest correlations (see strong_correlations).
+    """
+    validate_method(method)
+
     insights = []
+    stats = get_dataset_stats(df, approximate=approximate)
 
     # Missing data
-    missing = df.isnull().sum()
+    missing = stats.missing[stats.missing > 0]
+    if max_missing is not None:
+        missing = missing.nlargest(max_missing)
     for col, count in missing.items():
-        if count > 0:
-            insights.append(f"Column '{col}' has {count} missing values")
+        insights.append(f"Column '{col}' has {count} missing values")
 
     # Strong correlations
-    numeric_cols = df.select_dtypes(include='number')
-    corr_matrix = numeric_cols.corr()
-    for col1 in corr_matrix.columns:
-        for col2 in corr_matrix.columns:
-            if col1 != col2 and abs(corr_matrix[col1][col2]) > 0.8:
-                insights.append(f"Columns '{col1}' and '{col2}' are strongly correlated ({corr_matrix[col1][col2]:.2f})")
+    if len(stats.numeric_cols) > 1:
+        for col1, col2, value in strong_correlations(stats.correlation(method), threshold, top_k):
+            insights.append(f"Columns '{col1}' and '{col2}' are strongly correlated ({value:.2f})")
 
     return insights
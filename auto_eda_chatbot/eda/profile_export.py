@@ -0,0 +1,295 @@
+"""
+Profile Export Module
+=====================
+Machine-readable profile artifacts and incremental drift checks.
+
+``build_profile`` turns the column profiles behind ``profile_data`` and
+DatasetStats into a compact, JSON-friendly document; ``save_profile`` writes
+it as JSON or as Parquet (one row per column, dataset-level figures in the
+schema metadata) and ``load_profile`` reads either back.
+
+Every column profile is stored with a hash of the column's content. Given a
+stored baseline, ``build_profile`` re-profiles only the columns whose hash
+changed and reuses the baseline profile of every other column, so a daily
+drift check costs one hashing pass plus the profiling of what changed.
+``diff_profiles`` then lists added, removed and changed columns with the
+statistics that moved.
+"""
+
+import hashlib
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from .profiler import profile_columns
+from .stats import get_dataset_stats
+
+PROFILE_FORMAT_VERSION = 1
+
+# Column statistics compared by diff_profiles
+DIFF_STATS = ("dtype", "count", "nulls", "distinct", "min", "max", "mean", "std", "quantiles")
+
+# Stored as plain Parquet columns; everything else goes into the per-column JSON detail
+PARQUET_COLUMNS = ("dtype", "hash", "count", "nulls", "distinct", "mean", "std")
+
+
+def _value_hashes(series: pd.Series) -> np.ndarray:
+    """64-bit hash of every value of a column"""
+    try:
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+    except TypeError:
+        # Unhashable cells (lists, dicts): hash their text form
+        return pd.util.hash_pandas_object(series.astype(str), index=False).to_numpy()
+
+
+def _digest(series: pd.Series, values: np.ndarray) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{series.dtype}|{len(series)}".encode("utf-8"))
+    hasher.update(values.tobytes())
+    return hasher.hexdigest()
+
+
+def column_hash(series: pd.Series) -> str:
+    """Hash of a column's dtype, length and values (row order included)"""
+    return _digest(series, _value_hashes(series))
+
+
+def _hash_columns(df: pd.DataFrame):
+    """({column: content hash}, duplicate row count) from one hashing pass over the frame"""
+    hashes = {}
+    rows = np.zeros(len(df), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for col in df.columns:
+            values = _value_hashes(df[col])
+            hashes[str(col)] = _digest(df[col], values)
+            rows = rows * np.uint64(1_000_003) ^ values
+    # Rows with equal value hashes in every column; collisions are negligible at 64 bits
+    duplicates = int(pd.Series(rows).duplicated().sum()) if len(df.columns) else 0
+    return hashes, duplicates
+
+
+# ----------------------------------------------------------------------
+# Encoding between in-memory profiles and JSON-friendly values
+# ----------------------------------------------------------------------
+def _encode_value(value):
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return value.isoformat()
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def _encode_profile(profile: dict) -> dict:
+    encoded = {}
+    for key, value in profile.items():
+        if key == "top_values":
+            encoded[key] = [[_encode_value(item), int(count)] for item, count in value]
+        elif key == "quantiles":
+            encoded[key] = {str(q): _encode_value(v) for q, v in value.items()}
+        elif key == "moments":
+            encoded[key] = [_encode_value(v) for v in value]
+        elif key == "error_bounds":
+            encoded[key] = {name: _encode_value(v) for name, v in value.items()}
+        else:
+            encoded[key] = _encode_value(value)
+    return encoded
+
+
+def _decode_profile(encoded: dict) -> dict:
+    """In-memory profile (as eda.profiler returns it) from its encoded form"""
+    profile = dict(encoded)
+    is_datetime = str(profile.get("dtype", "")).startswith("datetime")
+
+    def restore(value):
+        if value is None:
+            return np.nan
+        return pd.Timestamp(value) if is_datetime and isinstance(value, str) else value
+
+    profile["top_values"] = [(restore(item), count) for item, count in encoded.get("top_values", [])]
+    for key in ("min", "max", "mean", "std"):
+        if key in encoded:
+            profile[key] = restore(encoded[key])
+    if "quantiles" in encoded:
+        profile["quantiles"] = {float(q): restore(v) for q, v in encoded["quantiles"].items()}
+    if "moments" in encoded:
+        profile["moments"] = tuple(0.0 if v is None else v for v in encoded["moments"])
+    return profile
+
+
+# ----------------------------------------------------------------------
+# Building, saving and loading profiles
+# ----------------------------------------------------------------------
+def build_profile(df: pd.DataFrame, baseline: dict = None, approximate=None) -> dict:
+    """
+    Profile artifact of df: the ``profile_data`` layout plus column hashes and
+    dataset-level figures, JSON-serializable.
+
+    With a baseline (a profile built by this module, e.g. from load_profile),
+    only columns whose content hash differs from the baseline are profiled
+    again; ``recomputed_columns`` lists them. The resulting profiles also seed
+    the shared DatasetStats of df, so reports built afterwards reuse them.
+    """
+    stats = get_dataset_stats(df, approximate=approximate)
+    hashes, duplicate_rows = _hash_columns(df)
+
+    reusable = {}
+    if baseline and baseline.get("approximate") == stats.approximate:
+        for col in df.columns:
+            key = str(col)
+            if baseline.get("column_hashes", {}).get(key) == hashes[key] and key in baseline["column_profiles"]:
+                reusable[col] = _decode_profile(baseline["column_profiles"][key])
+
+    if baseline is None:
+        profiles = stats.profiles
+        recomputed = list(df.columns)
+    else:
+        recomputed = [col for col in df.columns if col not in reusable]
+        fresh = profile_columns(df, columns=recomputed, approximate=stats.approximate) if recomputed else {}
+        profiles = {col: reusable[col] if col in reusable else fresh[col] for col in df.columns}
+        stats.seed_profiles(profiles)
+
+    return {
+        "format_version": PROFILE_FORMAT_VERSION,
+        "rows": stats.n_rows,
+        "columns": stats.n_cols,
+        "approximate": stats.approximate,
+        "duplicate_rows": duplicate_rows,
+        "memory_mb": round(stats.memory_mb, 3),
+        "missing_values": {str(col): int(profile["nulls"]) for col, profile in profiles.items()},
+        "column_types": {str(col): str(dtype) for col, dtype in df.dtypes.items()},
+        "column_hashes": hashes,
+        "column_profiles": {str(col): _encode_profile(profile) for col, profile in profiles.items()},
+        "recomputed_columns": [str(col) for col in recomputed],
+    }
+
+
+def save_profile(profile: dict, path: str) -> str:
+    """Write a profile as JSON (.json) or Parquet (.parquet/.pq)"""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".json":
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+        os.replace(tmp_path, path)
+    elif suffix in (".parquet", ".pq"):
+        _save_parquet(profile, path)
+    else:
+        raise ValueError(f"Unsupported profile format: {path} (use .json or .parquet)")
+    return path
+
+
+def load_profile(path: str) -> dict:
+    """Read a profile written by save_profile"""
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            profile = json.load(f)
+    elif suffix in (".parquet", ".pq"):
+        profile = _load_parquet(path)
+    else:
+        raise ValueError(f"Unsupported profile format: {path} (use .json or .parquet)")
+    if profile.get("format_version") != PROFILE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported profile version {profile.get('format_version')} in {path}")
+    return profile
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Parquet profiles require pyarrow (pip install pyarrow)")
+    return pyarrow, pyarrow.parquet
+
+
+def _save_parquet(profile: dict, path: str):
+    """One row per column; the dataset-level fields go into the schema metadata"""
+    pa, pq = _import_pyarrow()
+    rows = []
+    for col, column_profile in profile["column_profiles"].items():
+        row = {"column": col, "hash": profile["column_hashes"].get(col)}
+        row.update({key: column_profile.get(key) for key in PARQUET_COLUMNS if key != "hash"})
+        row["detail"] = json.dumps({key: value for key, value in column_profile.items() if key not in PARQUET_COLUMNS})
+        rows.append(row)
+    table = pa.Table.from_pylist(rows, schema=pa.schema([
+        ("column", pa.string()), ("dtype", pa.string()), ("hash", pa.string()), ("count", pa.int64()),
+        ("nulls", pa.int64()), ("distinct", pa.int64()), ("mean", pa.float64()), ("std", pa.float64()),
+        ("detail", pa.string()),
+    ]))
+    dataset = {key: value for key, value in profile.items()
+               if key not in ("column_profiles", "column_hashes", "missing_values", "column_types")}
+    table = table.replace_schema_metadata({"eda_profile": json.dumps(dataset)})
+    pq.write_table(table, path)
+
+
+def _load_parquet(path: str) -> dict:
+    _, pq = _import_pyarrow()
+    table = pq.read_table(path)
+    profile = json.loads(table.schema.metadata[b"eda_profile"])
+    profile.update(column_profiles={}, column_hashes={}, missing_values={}, column_types={})
+    for row in table.to_pylist():
+        col = row["column"]
+        # Non-numeric columns have no mean/std
+        column_profile = {key: row[key] for key in PARQUET_COLUMNS
+                          if key != "hash" and not (key in ("mean", "std") and row[key] is None)}
+        column_profile.update(json.loads(row["detail"]))
+        profile["column_profiles"][col] = column_profile
+        profile["column_hashes"][col] = row["hash"]
+        profile["missing_values"][col] = row["nulls"]
+        profile["column_types"][col] = row["dtype"]
+    return profile
+
+
+# ----------------------------------------------------------------------
+# Drift between two profiles
+# ----------------------------------------------------------------------
+def _stat_change(before, after) -> dict:
+    change = {"baseline": before, "current": after}
+    numbers = (int, float)
+    if isinstance(before, numbers) and isinstance(after, numbers) and not isinstance(before, bool):
+        change["delta"] = after - before
+    return change
+
+
+def diff_profiles(baseline: dict, current: dict) -> dict:
+    """
+    Differences between two profiles built by this module.
+
+    Returns rows (baseline/current), added, removed and unchanged column lists,
+    and ``changed``: {column: {statistic: {baseline, current[, delta]}}} for
+    every column whose content hash differs. A changed column with no moved
+    statistic had its values reordered or replaced without changing the summary.
+    """
+    base_profiles = baseline["column_profiles"]
+    current_profiles = current["column_profiles"]
+    diff = {
+        "rows": {"baseline": baseline["rows"], "current": current["rows"]},
+        "added": [col for col in current_profiles if col not in base_profiles],
+        "removed": [col for col in base_profiles if col not in current_profiles],
+        "unchanged": [],
+        "changed": {},
+    }
+    for col, after in current_profiles.items():
+        if col not in base_profiles:
+            continue
+        if baseline["column_hashes"].get(col) == current["column_hashes"].get(col):
+            diff["unchanged"].append(col)
+            continue
+        before = base_profiles[col]
+        changes = {}
+        for stat in DIFF_STATS:
+            if before.get(stat) != after.get(stat):
+                changes[stat] = _stat_change(before.get(stat), after.get(stat))
+        rates = [profile["nulls"] / (profile["count"] + profile["nulls"]) if profile["count"] + profile["nulls"] else 0.0
+                 for profile in (before, after)]
+        if rates[0] != rates[1]:
+            changes["null_rate"] = _stat_change(*rates)
+        diff["changed"][col] = changes
+    return diff
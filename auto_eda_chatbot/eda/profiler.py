@@ -1,7 +1,244 @@
-def profile_data(df):
+"""
+Profiler Module
+===============
+Single-pass column profiler used as the profiling engine of the app.
+
+Each column is factorized once. The codes and their counts give the null
+count, the exact distinct count and the top-k values; for numeric columns the
+sorted uniques plus counts also give min/max, mean/variance and quantiles
+without another scan of the data. Columns are profiled in parallel threads
+(pandas/NumPy release the GIL in the heavy kernels).
+
+Moments are stored as (count, mean, M2) so profiles of row chunks can be
+combined with Chan's parallel form of Welford's update (``merge_moments``).
+
+For very large data an approximate mode summarizes each column chunk by chunk
+with the mergeable sketches in eda.sketches, in memory independent of the row
+count; those profiles carry ``error_bounds`` for the estimated statistics.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+# Quantiles reported for numeric columns
+DEFAULT_QUANTILES = (0.25, 0.5, 0.75)
+
+# Most frequent values kept per column
+DEFAULT_TOP_K = 10
+
+# Rows summarized per step in approximate mode
+DEFAULT_SKETCH_CHUNKSIZE = 1_000_000
+
+
+def merge_moments(a: tuple, b: tuple) -> tuple:
+    """Combine two (count, mean, M2) moment triples (Chan et al.)"""
+    count_a, mean_a, m2_a = a
+    count_b, mean_b, m2_b = b
+    count = count_a + count_b
+    if count == 0:
+        return (0, 0.0, 0.0)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * count_b / count
+    m2 = m2_a + m2_b + delta * delta * count_a * count_b / count
+    return (count, mean, m2)
+
+
+def _weighted_quantiles(values: np.ndarray, counts: np.ndarray, quantiles) -> list:
+    """Linearly interpolated quantiles (as ``Series.quantile``) of sorted values with multiplicities"""
+    total = int(counts.sum())
+    if total == 0:
+        return [np.nan] * len(quantiles)
+    # Last sorted rank held by each distinct value
+    upper_ranks = np.cumsum(counts) - 1
+    results = []
+    for q in quantiles:
+        position = q * (total - 1)
+        lower = int(np.floor(position))
+        low_value = values[np.searchsorted(upper_ranks, lower)]
+        high_value = values[np.searchsorted(upper_ranks, min(lower + 1, total - 1))]
+        results.append(float(low_value + (high_value - low_value) * (position - lower)))
+    return results
+
+
+def _factorize(series: pd.Series, sort: bool):
+    try:
+        return pd.factorize(series, sort=sort)
+    except TypeError:
+        # Unhashable or unorderable cells (lists, mixed types): profile their text form
+        return pd.factorize(series.astype(str).where(series.notna()), sort=sort)
+
+
+def profile_column(series: pd.Series, quantiles=DEFAULT_QUANTILES, top_k: int = DEFAULT_TOP_K) -> dict:
+    """Profile one column from a single factorization"""
+    is_numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+    is_datetime = pd.api.types.is_datetime64_any_dtype(series)
+
+    codes, uniques = _factorize(series, sort=is_numeric or is_datetime)
+    present = codes >= 0
+    counts = np.bincount(codes[present], minlength=len(uniques))
+    count = int(counts.sum())
+
+    # Most frequent first; ties keep first-appearance (or sorted) order like value_counts
+    top = np.argsort(-counts, kind="stable")[:top_k]
+    profile = {
+        "dtype": str(series.dtype),
+        "count": count,
+        "nulls": int(len(series) - count),
+        "distinct": int(len(uniques)),
+        "top_values": list(zip(pd.Index(uniques).take(top).tolist(), counts[top].tolist())),
+    }
+
+    if is_numeric:
+        values = np.asarray(uniques, dtype=np.float64)
+        if count:
+            mean = float(np.dot(values, counts) / count)
+            m2 = float(np.dot((values - mean) ** 2, counts))
+        else:
+            mean, m2 = np.nan, 0.0
+        minimum, maximum = pd.Index(uniques)[[0, -1]].tolist() if count else (np.nan, np.nan)
+        profile.update({
+            "min": minimum,
+            "max": maximum,
+            "mean": mean,
+            "std": float(np.sqrt(m2 / (count - 1))) if count > 1 else np.nan,
+            "moments": (count, mean if count else 0.0, m2),
+            "quantiles": dict(zip(quantiles, _weighted_quantiles(values, counts, quantiles))),
+        })
+    elif is_datetime and count:
+        profile.update({"min": uniques[0], "max": uniques[-1]})
+
+    return profile
+
+
+class ColumnSketch:
+    """Approximate, mergeable profile of one column built from row chunks"""
+
+    def __init__(self):
+        self.dtype = None
+        self.count = 0
+        self.nulls = 0
+        self.numeric = None
+        self.moments = (0, 0.0, 0.0)
+        self.min = None
+        self.max = None
+        self.distinct = HyperLogLog()
+        self.quantiles = KLLSketch()
+        self.heavy_hitters = SpaceSaving()
+
+    def update(self, series: pd.Series):
+        if self.numeric is None:
+            self.dtype = str(series.dtype)
+            self.numeric = pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+        values = series.dropna()
+        self.count += len(values)
+        self.nulls += len(series) - len(values)
+        self.distinct.update(values)
+        self.heavy_hitters.update(values)
+        if self.numeric and len(values):
+            numbers = values.to_numpy(dtype=np.float64)
+            mean = float(numbers.mean())
+            self.moments = merge_moments(self.moments, (len(numbers), mean, float(((numbers - mean) ** 2).sum())))
+            self.min = numbers.min() if self.min is None else min(self.min, numbers.min())
+            self.max = numbers.max() if self.max is None else max(self.max, numbers.max())
+            self.quantiles.update(numbers)
+        return self
+
+    def merge(self, other: "ColumnSketch"):
+        if self.numeric is None:
+            self.dtype, self.numeric = other.dtype, other.numeric
+        self.count += other.count
+        self.nulls += other.nulls
+        self.moments = merge_moments(self.moments, other.moments)
+        for bound, pick in (("min", min), ("max", max)):
+            values = [value for value in (getattr(self, bound), getattr(other, bound)) if value is not None]
+            setattr(self, bound, pick(values) if values else None)
+        self.distinct.merge(other.distinct)
+        self.quantiles.merge(other.quantiles)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        return self
+
+    def to_profile(self, quantiles=DEFAULT_QUANTILES, top_k: int = DEFAULT_TOP_K) -> dict:
+        top = self.heavy_hitters.top(top_k)
+        profile = {
+            "dtype": self.dtype,
+            "count": self.count,
+            "nulls": self.nulls,
+            # HLL can over-shoot tiny columns slightly; never report more distinct values than rows
+            "distinct": int(min(round(self.distinct.estimate()), self.count)),
+            "top_values": [(value, count) for value, count, _ in top],
+            "approximate": True,
+            "error_bounds": {
+                "distinct": self.distinct.relative_error,
+                "top_values": max((error for _, _, error in top), default=0),
+            },
+        }
+        if self.numeric:
+            count, mean, m2 = self.moments
+            profile.update({
+                "min": float(self.min) if count else np.nan,
+                "max": float(self.max) if count else np.nan,
+                "mean": mean if count else np.nan,
+                "std": float(np.sqrt(m2 / (count - 1))) if count > 1 else np.nan,
+                "moments": self.moments,
+                "quantiles": dict(zip(quantiles, self.quantiles.quantiles(quantiles))),
+            })
+            profile["error_bounds"]["quantiles"] = self.quantiles.rank_error
+        return profile
+
+
+def sketch_column(series: pd.Series, chunksize: int = DEFAULT_SKETCH_CHUNKSIZE) -> ColumnSketch:
+    """Summarize a column chunk by chunk into a ColumnSketch"""
+    sketch = ColumnSketch()
+    for start in range(0, max(len(series), 1), chunksize):
+        sketch.update(series.iloc[start:start + chunksize])
+    return sketch
+
+
+def profile_chunks(chunks, quantiles=DEFAULT_QUANTILES, top_k: int = DEFAULT_TOP_K) -> dict:
+    """
+    Approximate profiles of data arriving as DataFrame chunks.
+
+    Memory stays bounded by the chunk size plus the fixed-size sketches, so
+    e.g. ``profile_chunks(pd.read_csv(path, chunksize=1_000_000))`` profiles
+    files far larger than RAM.
+    """
+    sketches = {}
+    for chunk in chunks:
+        for col in chunk.columns:
+            sketches.setdefault(col, ColumnSketch()).update(chunk[col])
+    return {col: sketch.to_profile(quantiles, top_k) for col, sketch in sketches.items()}
+
+
+def profile_columns(df: pd.DataFrame, columns=None, quantiles=DEFAULT_QUANTILES, top_k: int = DEFAULT_TOP_K,
+                    max_workers=None, approximate: bool = False) -> dict:
+    """Profile several columns in parallel; returns {column: profile} in column order"""
+    columns = list(df.columns if columns is None else columns)
+    if max_workers is None:
+        max_workers = int(os.getenv("EDA_PROFILE_WORKERS", min(8, os.cpu_count() or 1)))
+
+    def run(col):
+        if approximate:
+            return sketch_column(df[col]).to_profile(quantiles, top_k)
+        return profile_column(df[col], quantiles=quantiles, top_k=top_k)
+
+    if max_workers <= 1 or len(columns) <= 1:
+        return {col: run(col) for col in columns}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(columns, pool.map(run, columns)))
+
+
+def profile_data(df, quantiles=DEFAULT_QUANTILES, top_k: int = DEFAULT_TOP_K, max_workers=None, approximate=False):
+    profiles = profile_columns(df, quantiles=quantiles, top_k=top_k, max_workers=max_workers,
+                               approximate=approximate)
     return {
         "rows": df.shape[0],
         "columns": df.shape[1],
-        "missing_values": df.isnull().sum().to_dict(),
-        "column_types": df.dtypes.apply(str).to_dict()
+        "missing_values": {col: profile["nulls"] for col, profile in profiles.items()},
+        "column_types": df.dtypes.apply(str).to_dict(),
+        "column_profiles": profiles,
     }
@@ -0,0 +1,190 @@
+"""
+Render Pool Module
+==================
+Parallel rendering of independent matplotlib charts.
+
+Matplotlib draws on one thread under the GIL, so pages with many figures
+(dashboard, PDF report) render them one after another. ``render_charts``
+instead sends each figure build to a process pool whose workers use the Agg
+backend and return PNG bytes.
+
+The dataset is not pickled per task. It is written once as an Arrow snapshot
+(the same files the dataset cache uses, keyed by the dataset fingerprint),
+and workers memory-map it and keep the frame for later batches. Workers draw
+with the caller's matplotlib rcParams, so pooled and in-process charts look
+identical. Results go through the chart render cache in utils.chart_cache.
+"""
+
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, util
+from pathlib import Path
+
+import matplotlib
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.chart_cache import figure_png, get_chart_cache, png_chart_key
+from utils.dataset_cache import load_snapshot, share_snapshot
+
+# Frames kept per worker process (most recent datasets)
+WORKER_FRAMES = 2
+
+_pool = None
+_pool_workers = 0
+_worker_frames = {}  # snapshot key -> DataFrame, inside worker processes
+
+
+class RenderJob:
+    """
+    One chart to render: ``builder(df, *args, **kwargs)`` returning a figure.
+
+    builder must be a module-level function (it is sent to workers by name).
+    With ``uses_frame=False`` the builder is called without the dataset,
+    ``builder(*args, **kwargs)``, for charts drawn from small precomputed
+    inputs. savefig overrides the PNG options (dpi, facecolor, ...).
+    chart_type, columns, size, savefig and params form the render-cache key.
+    """
+
+    def __init__(self, builder, args=(), kwargs=None, chart_type=None, columns=(), width=5, height=3,
+                 uses_frame=True, savefig=None, **params):
+        self.builder = builder
+        self.args = tuple(args)
+        self.kwargs = kwargs or {}
+        self.chart_type = chart_type or builder.__name__
+        self.columns = tuple(columns)
+        self.width = width
+        self.height = height
+        self.uses_frame = uses_frame
+        self.savefig = savefig or {}
+        self.params = dict(params, savefig=self.savefig) if self.savefig else params
+
+
+def _theme_rc() -> dict:
+    """The caller's rcParams, minus backend settings"""
+    return {key: value for key, value in matplotlib.rcParams.items()
+            if not key.startswith(('backend', 'interactive', 'webagg', 'toolbar'))}
+
+
+def _init_worker():
+    matplotlib.use("Agg")
+
+
+def _worker_frame(key: str):
+    frame = _worker_frames.get(key)
+    if frame is None:
+        frame = load_snapshot(key)
+        if frame is None:
+            raise RuntimeError(f"Dataset snapshot {key} is not available")
+        _worker_frames[key] = frame
+        while len(_worker_frames) > WORKER_FRAMES:
+            _worker_frames.pop(next(iter(_worker_frames)))
+    return frame
+
+
+def _render(job: RenderJob, frame_source, rc: dict):
+    """Build and rasterize one chart; frame_source is the frame or its snapshot key"""
+    with matplotlib.rc_context(rc):
+        if job.uses_frame:
+            frame = _worker_frame(frame_source) if isinstance(frame_source, str) else frame_source
+            fig = job.builder(frame, *job.args, **job.kwargs)
+        else:
+            fig = job.builder(*job.args, **job.kwargs)
+        return None if fig is None else figure_png(fig, job.width, job.height, **job.savefig)
+
+
+def _render_local(job: RenderJob, frame_source, rc: dict):
+    """(PNG or None, error text or None); one bad chart does not stop the batch"""
+    try:
+        return _render(job, frame_source, rc), None
+    except Exception:
+        return None, traceback.format_exc(limit=-2)
+
+
+def _pool_task(job: RenderJob, snapshot_key, rc: dict):
+    """Process-pool worker"""
+    return _render_local(job, snapshot_key, rc)
+
+
+def _get_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool reused across calls (spawned once; safe next to Streamlit's threads)"""
+    global _pool, _pool_workers
+    if _pool is None or _pool_workers != max_workers:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_context("spawn"),
+                                    initializer=_init_worker)
+        _pool_workers = max_workers
+        # A pool made inside a worker process (report job, batch file) must be stopped before
+        # that process exits: multiprocessing joins its children ahead of the atexit handlers.
+        # Runs ahead of the pool's own queue finalizers (priority 10), which would drop the stop signal
+        util.Finalize(None, _pool.shutdown, kwargs={"cancel_futures": True}, exitpriority=20)
+    return _pool
+
+
+def _reset_pool():
+    global _pool, _pool_workers
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+    _pool, _pool_workers = None, 0
+
+
+def render_workers_per_process(processes: int) -> int:
+    """
+    Render pool size for code already running in one of `processes` worker
+    processes (report jobs, batch files), so all their render pools together
+    use about the CPU count. An explicit EDA_RENDER_WORKERS wins.
+    """
+    if os.getenv("EDA_RENDER_WORKERS"):
+        return int(os.getenv("EDA_RENDER_WORKERS"))
+    return max(1, (os.cpu_count() or 1) // max(1, processes))
+
+
+def render_charts(df, jobs, max_workers=None) -> list:
+    """
+    PNG bytes for each job, in order (None where a chart could not be drawn).
+
+    Cached charts are returned directly; the rest are rendered in the process
+    pool when there is more than one and more than one worker (EDA_RENDER_WORKERS,
+    default: CPU count), otherwise in this process.
+    """
+    cache = get_chart_cache()
+    keys = [png_chart_key(df, job.chart_type, job.columns, job.width, job.height, **job.params) for job in jobs]
+    results = [cache.get(key) for key in keys]
+    pending = [index for index, png in enumerate(results) if png is None]
+    if not pending:
+        return results
+
+    if max_workers is None:
+        max_workers = int(os.getenv("EDA_RENDER_WORKERS", os.cpu_count() or 1))
+    rc = _theme_rc()
+    snapshot_key = None
+    if max_workers > 1 and len(pending) > 1:
+        needs_frame = any(jobs[index].uses_frame for index in pending)
+        snapshot_key = share_snapshot(df) if needs_frame else ""
+
+    outcomes = None
+    if snapshot_key is not None:
+        try:
+            pool = _get_pool(max_workers)
+            futures = {index: pool.submit(_pool_task, jobs[index], snapshot_key, rc) for index in pending}
+            outcomes = {index: future.result() for index, future in futures.items()}
+        except Exception as e:
+            # A pool that cannot start or died (e.g. a worker was killed): render here instead
+            print(f"[RENDER] Process pool unavailable ({type(e).__name__}: {e}); rendering in-process")
+            _reset_pool()
+    if outcomes is None:
+        outcomes = {index: _render_local(jobs[index], df, rc) for index in pending}
+
+    for index, (png, error) in outcomes.items():
+        if error:
+            print(f"[RENDER] {jobs[index].chart_type} failed:\n{error}")
+        results[index] = png
+
+    for index in pending:
+        if results[index] is not None:
+            cache.put(keys[index], results[index])
+    return results
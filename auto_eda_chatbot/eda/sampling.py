@@ -0,0 +1,161 @@
+"""
+Sampling Module
+===============
+Render budget for point-heavy charts.
+
+A chart only has a few hundred pixels per axis, so drawing every row of a
+large dataset costs seconds of matplotlib time without changing the picture.
+These helpers reduce what is drawn while keeping its shape:
+
+- Line charts: Largest-Triangle-Three-Buckets (LTTB) keeps the points that
+  define the visible shape of the curve.
+- Area charts: min-max decimation keeps the lowest and highest value of each
+  bucket, so the filled envelope is unchanged.
+- Scatter plots: stratified sampling over a 2-D grid keeps the density of
+  crowded regions and at least one point of every occupied cell (outliers).
+- Past a row threshold scatter plots are aggregated into hexbins instead.
+
+Every helper returns row positions into the original arrays, and charts are
+annotated with the share of the data they show (``annotate_sample_ratio``).
+Sampling is seeded, so the same data always renders the same chart.
+"""
+
+import os
+
+import numpy as np
+
+from .eda_palette import EDAPalette
+
+# Points drawn per line or area series (override with EDA_RENDER_LINE_POINTS)
+DEFAULT_LINE_POINTS = 2_000
+
+# Points drawn per scatter plot (override with EDA_RENDER_SCATTER_POINTS)
+DEFAULT_SCATTER_POINTS = 5_000
+
+# Scatter plots over at least this many rows become hexbins (override with EDA_RENDER_HEXBIN_ROWS)
+DEFAULT_HEXBIN_ROWS = 200_000
+
+
+def line_budget() -> int:
+    return int(os.getenv("EDA_RENDER_LINE_POINTS", DEFAULT_LINE_POINTS))
+
+
+def scatter_budget() -> int:
+    return int(os.getenv("EDA_RENDER_SCATTER_POINTS", DEFAULT_SCATTER_POINTS))
+
+
+def should_hexbin(n_rows: int) -> bool:
+    """True when a scatter plot of n_rows points should be aggregated into hexbins"""
+    return n_rows >= int(os.getenv("EDA_RENDER_HEXBIN_ROWS", DEFAULT_HEXBIN_ROWS))
+
+
+def _as_float(values) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def lttb(y, n_out: int = None, x=None) -> np.ndarray:
+    """
+    Positions of the Largest-Triangle-Three-Buckets downsample of a series.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket. Missing values are skipped.
+    """
+    n_out = line_budget() if n_out is None else n_out
+    y = _as_float(y)
+    positions = np.flatnonzero(np.isfinite(y))
+    n = len(positions)
+    if n <= n_out or n_out < 3:
+        return positions
+
+    xs = positions.astype(np.float64) if x is None else _as_float(x)[positions]
+    ys = y[positions]
+    # n_out - 2 buckets between the fixed first and last point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+        areas = np.abs((xs[previous] - avg_x) * (ys[start:end] - ys[previous])
+                       - (xs[previous] - xs[start:end]) * (avg_y - ys[previous]))
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return positions[selected]
+
+
+def minmax_decimate(y, n_out: int = None) -> np.ndarray:
+    """Positions of the minimum and maximum of n_out / 2 equal buckets, in order"""
+    n_out = line_budget() if n_out is None else n_out
+    y = _as_float(y)
+    positions = np.flatnonzero(np.isfinite(y))
+    n = len(positions)
+    if n <= n_out or n_out < 2:
+        return positions
+
+    n_buckets = n_out // 2
+    edges = np.linspace(0, n, n_buckets + 1).astype(np.intp)
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+    # Sorted by bucket, then value: each bucket's first entry is its minimum, its last the maximum
+    order = np.lexsort((y[positions], bucket))
+    keep = np.union1d(order[edges[:-1]], order[edges[1:] - 1])
+    return positions[keep]
+
+
+def sample_scatter(x, y, n_out: int = None, bins: int = None, seed: int = 0) -> np.ndarray:
+    """
+    Positions of a density-preserving sample of a scatter plot.
+
+    Points are binned on a bins x bins grid; each occupied cell keeps a share
+    of the budget proportional to its count, but never less than one point,
+    so sparse regions and outliers stay visible. The result can exceed n_out
+    by at most the number of sparsely occupied cells.
+    """
+    n_out = scatter_budget() if n_out is None else n_out
+    x, y = _as_float(x), _as_float(y)
+    positions = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    n = len(positions)
+    if n <= n_out:
+        return positions
+
+    if bins is None:
+        # Leave most of the budget for the proportional share
+        bins = max(4, int(np.sqrt(n_out / 4)))
+    cells = np.zeros(n, dtype=np.intp)
+    for values in (x[positions], y[positions]):
+        low, span = values.min(), np.ptp(values)
+        scaled = (values - low) / span * bins if span > 0 else np.zeros(n)
+        cells = cells * bins + np.clip(scaled.astype(np.intp), 0, bins - 1)
+
+    counts = np.bincount(cells, minlength=bins * bins)
+    quota = np.where(counts > 0, np.maximum(1, np.floor(counts * (n_out / n))), 0)
+
+    # Random order within each cell; keep the first quota points of every cell
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(n)
+    order = order[np.argsort(cells[order], kind="stable")]
+    starts = np.cumsum(counts) - counts
+    ranks = np.arange(n) - starts[cells[order]]
+    keep = order[ranks < quota[cells[order]]]
+    return positions[np.sort(keep)]
+
+
+def annotate_sample_ratio(ax, shown: int, total: int, method: str):
+    """
+    Note in the chart corner how much of the data it shows.
+
+    Nothing is added when every point is drawn; hexbin charts state how many
+    points were aggregated.
+    """
+    if method == "hexbin":
+        text = f"hexbin of all {total:,} points"
+    elif total and shown < total:
+        text = f"{method}: {shown:,} of {total:,} points ({shown / total:.1%})"
+    else:
+        return
+    ax.text(0.99, 0.01, text, transform=ax.transAxes, ha="right", va="bottom", fontsize=7,
+            color=EDAPalette.DARK_THEME['text_secondary'], alpha=0.9)
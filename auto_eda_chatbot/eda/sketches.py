@@ -0,0 +1,197 @@
+"""
+Sketches Module
+===============
+Mergeable, fixed-size summaries for approximate column statistics.
+
+- HyperLogLog: distinct counts (relative standard error 1.04 / sqrt(2^p))
+- KLLSketch: quantiles (normalized rank error about 1.65 / k)
+- SpaceSaving: top-k values (each count over-estimated by at most its error)
+
+Every sketch takes whole arrays in ``update`` and combines with ``merge``, so
+a column can be summarized chunk by chunk in constant memory and the partial
+sketches of different chunks (or workers) merged afterwards.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Defaults chosen for ~1% error with a few KB to a few hundred KB per column
+DEFAULT_HLL_PRECISION = 14
+DEFAULT_KLL_K = 200
+DEFAULT_SPACE_SAVING_CAPACITY = 100
+
+
+def hash_values(values) -> np.ndarray:
+    """Stable 64-bit hashes of non-null values (same value -> same hash in every chunk)"""
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    series = series.dropna()
+    try:
+        return pd.util.hash_pandas_object(series, index=False).to_numpy()
+    except TypeError:
+        return pd.util.hash_pandas_object(series.astype(str), index=False).to_numpy()
+
+
+class HyperLogLog:
+    """HyperLogLog distinct-count sketch with 2^precision one-byte registers"""
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def update(self, values):
+        self.update_hashes(hash_values(values))
+        return self
+
+    def update_hashes(self, hashes: np.ndarray):
+        if len(hashes) == 0:
+            return self
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        # Position of the first set bit in the remaining 64 - p bits
+        rest = (hashes << np.uint64(p)) | np.uint64(1 << (p - 1))
+        bit_length = np.floor(np.log2(rest.astype(np.float64))).astype(np.int64) + 1
+        ranks = (65 - bit_length).astype(np.uint8)
+        np.maximum.at(self.registers, index, ranks)
+        return self
+
+    def merge(self, other: "HyperLogLog"):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            # Small-range correction: linear counting
+            return m * np.log(m / zeros)
+        return float(raw)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch.
+
+    Level h holds items of weight 2^h. When a level outgrows its capacity it
+    is sorted and every other item (random offset) is promoted to the next
+    level, so the sketch keeps O(k log(n / k)) items for n inserted values.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: int = 0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def rank_error(self) -> float:
+        return 1.65 / self.k
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(8, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values):
+        values = np.asarray(pd.Series(values).dropna(), dtype=np.float64)
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self.count += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so total weight is preserved exactly
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[:len(items) - len(keep)]
+                promoted = pairs[self._rng.integers(0, 2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                # Adding a level shrinks every lower capacity, so re-check from the bottom
+                level = 0
+                continue
+            level += 1
+
+    def quantiles(self, qs) -> list:
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return [np.nan] * len(qs)
+        weights = np.concatenate([np.full(len(level), 1 << h, dtype=np.int64) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        positions = np.searchsorted(cumulative, np.asarray(qs) * cumulative[-1], side="left")
+        return items[np.minimum(positions, len(items) - 1)].tolist()
+
+    def __len__(self):
+        return sum(len(level) for level in self.levels)
+
+
+class SpaceSaving:
+    """
+    Mergeable SpaceSaving summary for heavy hitters.
+
+    Keeps at most ``capacity`` (value, count, error) entries. A reported count
+    exceeds the true count by at most its error; any value missing from the
+    summary occurred at most ``floor`` times.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SPACE_SAVING_CAPACITY):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.floor = 0
+
+    def update(self, values):
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        try:
+            chunk_counts = series.value_counts()
+        except TypeError:
+            chunk_counts = series.dropna().astype(str).value_counts()
+        chunk = SpaceSaving(self.capacity)
+        chunk.counts = chunk_counts.head(self.capacity).astype(np.int64)
+        chunk.errors = pd.Series(0, index=chunk.counts.index, dtype=np.int64)
+        # Values cut from the chunk summary occurred at most as often as the first one cut
+        chunk.floor = int(chunk_counts.iloc[self.capacity]) if len(chunk_counts) > self.capacity else 0
+        return self.merge(chunk)
+
+    def merge(self, other: "SpaceSaving"):
+        floor_self, floor_other = self.floor, other.floor
+        union = self.counts.index.union(other.counts.index, sort=False)
+        counts = (self.counts.reindex(union, fill_value=floor_self)
+                  + other.counts.reindex(union, fill_value=floor_other))
+        errors = (self.errors.reindex(union, fill_value=floor_self)
+                  + other.errors.reindex(union, fill_value=floor_other))
+
+        order = np.argsort(-counts.to_numpy(), kind="stable")
+        kept, dropped = order[:self.capacity], order[self.capacity:]
+        self.floor = max(floor_self + floor_other, int(counts.iloc[dropped].max()) if len(dropped) else 0)
+        self.counts = counts.iloc[kept].astype(np.int64)
+        self.errors = errors.iloc[kept].astype(np.int64)
+        return self
+
+    def top(self, n: int) -> list:
+        """(value, estimated count, max over-estimate) of the n heaviest values"""
+        return list(zip(self.counts.index[:n].tolist(), self.counts.iloc[:n].tolist(),
+                        self.errors.iloc[:n].tolist()))
@@ -0,0 +1,246 @@
+"""
+Dataset Statistics Module
+=========================
+Lazily computed, per-dataset statistics shared by the chat context, the EDA
+tabs, the dashboard, the Data Inspector and the PDF report.
+
+Every statistic is computed on first use and memoized (per column where
+applicable), and one DatasetStats instance is shared per dataset version, so a
+page render no longer re-scans the frame once per consumer. Column statistics
+come from the single-pass profiler in eda.profiler; in approximate mode (large
+datasets, or on request) they come from mergeable sketches instead and carry
+error bounds for display.
+"""
+
+import os
+import sys
+import threading
+import weakref
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.dataset_cache import dataset_memo
+from .correlation import correlation_matrix
+from .profiler import DEFAULT_TOP_K, profile_columns
+
+NUMERIC_TYPES = ['number']
+CATEGORICAL_TYPES = ['object', 'category', 'bool']
+DATETIME_TYPES = ['datetime64', 'datetimetz']
+
+# Datasets with at least this many rows use approximate statistics by default
+# (override with EDA_APPROX_STATS_ROWS)
+DEFAULT_APPROX_STATS_ROWS = 5_000_000
+
+
+class DatasetStats:
+    """
+    Memoized statistics for one dataset version.
+
+    The frame is held through a weak reference so the memo does not keep
+    evicted datasets alive; ``get_dataset_stats`` re-binds it on every call.
+    """
+
+    def __init__(self, df: pd.DataFrame, approximate: bool = False):
+        self.approximate = approximate
+        self._df_ref = weakref.ref(df)
+        self._values = {}
+        self._lock = threading.RLock()
+
+    def bind(self, df: pd.DataFrame):
+        """Point the statistics at a live frame with the same content"""
+        if self._df_ref() is not df:
+            self._df_ref = weakref.ref(df)
+        return self
+
+    @property
+    def df(self) -> pd.DataFrame:
+        df = self._df_ref()
+        if df is None:
+            raise RuntimeError("DatasetStats used after its DataFrame was released")
+        return df
+
+    def _memo(self, key, compute):
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = compute()
+            return self._values[key]
+
+    # ------------------------------------------------------------------
+    # Shape and column groups
+    # ------------------------------------------------------------------
+    @property
+    def n_rows(self) -> int:
+        return len(self.df)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.df.columns)
+
+    @property
+    def total_cells(self) -> int:
+        return self.n_rows * self.n_cols
+
+    @property
+    def numeric_cols(self) -> list:
+        return list(self._memo("numeric_cols", lambda: self.df.select_dtypes(include=NUMERIC_TYPES).columns.tolist()))
+
+    @property
+    def categorical_cols(self) -> list:
+        return list(self._memo("categorical_cols",
+                               lambda: self.df.select_dtypes(include=CATEGORICAL_TYPES).columns.tolist()))
+
+    @property
+    def datetime_cols(self) -> list:
+        return list(self._memo("datetime_cols", lambda: self.df.select_dtypes(include=DATETIME_TYPES).columns.tolist()))
+
+    # ------------------------------------------------------------------
+    # Data quality
+    # ------------------------------------------------------------------
+    @property
+    def profiles(self) -> dict:
+        """Single-pass profiles of every column ({column: profile})"""
+        return self._memo("profiles", lambda: profile_columns(self.df, approximate=self.approximate))
+
+    def seed_profiles(self, profiles: dict):
+        """Use precomputed column profiles (e.g. reused from a stored baseline) if none were computed yet"""
+        with self._lock:
+            self._values.setdefault("profiles", profiles)
+
+    def profile(self, col) -> dict:
+        return self.profiles[col]
+
+    @property
+    def missing(self) -> pd.Series:
+        """Missing values per column"""
+        return self._memo("missing", lambda: pd.Series(
+            [profile["nulls"] for profile in self.profiles.values()], index=self.df.columns, dtype="int64"))
+
+    @property
+    def total_missing(self) -> int:
+        return int(self.missing.sum())
+
+    @property
+    def missing_pct(self) -> float:
+        """Share of missing cells in percent"""
+        return self.total_missing / self.total_cells * 100 if self.total_cells else 0.0
+
+    @property
+    def completeness_pct(self) -> float:
+        return 100 - self.missing_pct
+
+    @property
+    def complete_rows(self) -> int:
+        """Rows without any missing value"""
+        return self._memo("complete_rows", lambda: int((~self.df.isnull().any(axis=1)).sum()))
+
+    @property
+    def duplicate_rows(self) -> int:
+        return self._memo("duplicate_rows", lambda: int(self.df.duplicated().sum()))
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memo("memory_bytes", lambda: int(self.df.memory_usage(deep=True).sum()))
+
+    @property
+    def memory_mb(self) -> float:
+        return self.memory_bytes / 1024 ** 2
+
+    # ------------------------------------------------------------------
+    # Per-column statistics
+    # ------------------------------------------------------------------
+    def numeric_summary(self, col) -> dict:
+        """count/mean/std/min/quartiles/max of a numeric column, ignoring nulls"""
+        profile = self.profile(col)
+        quantiles = profile["quantiles"]
+        return {
+            'count': profile["count"],
+            'mean': profile["mean"],
+            'std': profile["std"],
+            'min': profile["min"],
+            '25%': quantiles[0.25],
+            '50%': quantiles[0.5],
+            '75%': quantiles[0.75],
+            'max': profile["max"],
+        }
+
+    def describe_numeric(self, columns=None) -> pd.DataFrame:
+        """Equivalent of ``df[columns].describe()`` built from the per-column summaries"""
+        columns = self.numeric_cols if columns is None else list(columns)
+        return pd.DataFrame({col: self.numeric_summary(col) for col in columns},
+                            index=['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max'])
+
+    def outlier_count(self, col) -> int:
+        """Values outside the 1.5 * IQR fences of a numeric column"""
+        def compute():
+            summary = self.numeric_summary(col)
+            iqr = summary['75%'] - summary['25%']
+            lower_bound = summary['25%'] - 1.5 * iqr
+            upper_bound = summary['75%'] + 1.5 * iqr
+            col_data = self.df[col]
+            return int(((col_data < lower_bound) | (col_data > upper_bound)).sum())
+        return self._memo(("outlier_count", col), compute)
+
+    def value_counts(self, col) -> pd.Series:
+        """Non-null value frequencies of a column, most frequent first"""
+        return self._memo(("value_counts", col), lambda: self.df[col].value_counts())
+
+    def top_values(self, col, n: int = 5) -> pd.Series:
+        """The n most frequent values, from the profile when it kept enough of them"""
+        if n > DEFAULT_TOP_K:
+            return self.value_counts(col).head(n)
+        top = self.profile(col)["top_values"][:n]
+        return pd.Series([count for _, count in top], index=pd.Index([value for value, _ in top], name=col),
+                         name="count", dtype="int64")
+
+    def nunique(self, col) -> int:
+        return self.profile(col)["distinct"]
+
+    # ------------------------------------------------------------------
+    # Display helpers for approximate mode
+    # ------------------------------------------------------------------
+    def error_bounds(self, col) -> dict:
+        """Error bounds of a column's estimated statistics (empty when exact)"""
+        return self.profile(col).get("error_bounds", {})
+
+    def format_nunique(self, col) -> str:
+        """Distinct count for display, e.g. "1,234" or "≈1,234 (±0.8%)" """
+        bound = self.error_bounds(col).get("distinct")
+        if bound is None:
+            return f"{self.nunique(col):,}"
+        return f"≈{self.nunique(col):,} (±{bound * 100:.1f}%)"
+
+    def approximation_note(self) -> str:
+        """One-line explanation of the error bounds, or "" for exact statistics"""
+        if not self.approximate:
+            return ""
+        bounds = {}
+        for profile in self.profiles.values():
+            bounds.update(profile.get("error_bounds", {}))
+        note = "≈ Approximate statistics"
+        if "distinct" in bounds:
+            note += f" · distinct counts ±{bounds['distinct'] * 100:.1f}% (HyperLogLog)"
+        if "quantiles" in bounds:
+            note += f" · quantiles within ±{bounds['quantiles'] * 100:.1f}% of rank (KLL)"
+        return note + " · top-value counts are upper estimates (SpaceSaving)"
+
+    def correlation(self, method: str = "pearson") -> pd.DataFrame:
+        """Correlation matrix (pearson or spearman) of the numeric columns"""
+        return self._memo(("correlation", method),
+                          lambda: correlation_matrix(self.df, self.numeric_cols, method=method))
+
+
+def get_dataset_stats(df: pd.DataFrame, approximate=None) -> DatasetStats:
+    """
+    Statistics for df, shared by every consumer of the same dataset version.
+
+    approximate: True/False to force a mode; None picks approximate
+    statistics for datasets of at least EDA_APPROX_STATS_ROWS rows.
+    """
+    if approximate is None:
+        approximate = len(df) >= int(os.getenv("EDA_APPROX_STATS_ROWS", DEFAULT_APPROX_STATS_ROWS))
+    name = "dataset_stats:approximate" if approximate else "dataset_stats"
+    return dataset_memo(df, name, lambda: DatasetStats(df, approximate)).bind(df)
@@ -12,9 +12,16 @@ from matplotlib import cm
 import plotly.graph_objects as go
 import plotly.express as px
 from sklearn.preprocessing import StandardScaler
+import sys
 import warnings
+from pathlib import Path
 warnings.filterwarnings('ignore')
 
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.ui import show_cached_plotly
+
 
 class Visualizer3D:
     """3D visualization techniques for EDA"""
@@ -22,7 +29,7 @@ class Visualizer3D:
     @staticmethod
     def get_numeric_columns(df, min_count=2):
         """Get numeric columns for 3D plots"""
-        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
         return numeric_cols[:min_count] if len(numeric_cols) >= min_count else numeric_cols
     
     @staticmethod
@@ -206,7 +213,7 @@ class Visualizer3D:
         """
         # For 3D bars, we'll use top categories to avoid clutter
         numeric_cols = Visualizer3D.get_numeric_columns(df, min_count=2)
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'category', 'bool']).columns.tolist()
         
         if len(numeric_cols) < 2 or len(categorical_cols) < 1:
             st.warning("Need at least 2 numeric columns and 1 categorical column")
@@ -308,7 +315,7 @@ class Visualizer3D:
     def show_3d_eda(df):
         """Display comprehensive 3D EDA visualizations"""
         
-        if df.empty or len(df.select_dtypes(include=['float64', 'int64']).columns) < 3:
+        if df.empty or len(df.select_dtypes(include=['number']).columns) < 3:
             st.warning("⚠️ Requires at least 3 numeric columns for 3D visualizations")
             return
         
@@ -329,7 +336,7 @@ class Visualizer3D:
             st.info("Identify clusters, correlations, and outliers across three numerical variables")
             
             col1, col2, col3 = st.columns(3)
-            numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
+            numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
             
             with col1:
                 x_col = st.selectbox("X-axis", numeric_cols, key="scatter_x")
@@ -338,9 +345,8 @@ class Visualizer3D:
             with col3:
                 z_col = st.selectbox("Z-axis", numeric_cols, index=2 if len(numeric_cols) > 2 else 0, key="scatter_z")
             
-            fig = Visualizer3D.scatter_3d(df, x_col, y_col, z_col)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
+            show_cached_plotly(df, "scatter_3d", lambda: Visualizer3D.scatter_3d(df, x_col, y_col, z_col),
+                               columns=[x_col, y_col, z_col])
         
         # TAB 2: 3D Surface Plot
         with tab2:
@@ -356,9 +362,8 @@ class Visualizer3D:
             with col3:
                 z_col = st.selectbox("Z-axis", numeric_cols, index=2 if len(numeric_cols) > 2 else 0, key="surface_z")
             
-            fig = Visualizer3D.surface_3d(df, x_col, y_col, z_col)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
+            show_cached_plotly(df, "surface_3d", lambda: Visualizer3D.surface_3d(df, x_col, y_col, z_col),
+                               columns=[x_col, y_col, z_col])
         
         # TAB 3: 3D Line Plot
         with tab3:
@@ -374,24 +379,19 @@ class Visualizer3D:
             with col3:
                 z_col = st.selectbox("Z-axis", numeric_cols, index=2 if len(numeric_cols) > 2 else 0, key="line_z")
             
-            fig = Visualizer3D.line_3d(df, x_col, y_col, z_col)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
+            show_cached_plotly(df, "line_3d", lambda: Visualizer3D.line_3d(df, x_col, y_col, z_col),
+                               columns=[x_col, y_col, z_col])
         
         # TAB 4: 3D Bar Chart
         with tab4:
             st.subheader("3D Bar Chart")
             st.info("Compare multiple categorical variables across a common numerical metric")
             
-            fig = Visualizer3D.bar_3d(df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
+            show_cached_plotly(df, "bar_3d", lambda: Visualizer3D.bar_3d(df))
         
         # TAB 5: 3D Bubble Plot
         with tab5:
             st.subheader("3D Bubble Plot")
             st.info("Extended visualization with variable bubble sizes and color coding")
             
-            fig = Visualizer3D.bubble_3d(df)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
+            show_cached_plotly(df, "bubble_3d", lambda: Visualizer3D.bubble_3d(df))
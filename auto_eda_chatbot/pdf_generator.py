@@ -1,17 +1,26 @@
 """
 PDF Report Generation Module
 Creates comprehensive EDA reports as PDF
+
+A report is built in three stages: the statistics are computed once, the
+chart images are rendered concurrently (and reused from the render cache
+while the dataset is unchanged), then the PDF is assembled.
 """
 
 from fpdf import FPDF
 from datetime import datetime
 import io
+import time
 import pandas as pd
 import base64
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+from eda.insights import generate_insights
+from eda.stats import get_dataset_stats
+from eda.render_pool import RenderJob, render_charts
+
 class EDAPDFReport(FPDF):
     """Custom PDF class for EDA reports"""
     
@@ -171,107 +180,188 @@ class EDAPDFReport(FPDF):
         except:
             pass
 
+# PNG options of report charts (dark background, print resolution)
+REPORT_SAVEFIG = {"dpi": 100, "facecolor": '#0a0e27', "edgecolor": 'none'}
+
+# Correlation heatmaps wider than this are drawn without per-cell labels
+MAX_ANNOTATED_CORR_COLUMNS = 20
+
+# Findings listed under Key Insights: strongest correlations and columns with the most missing values
+MAX_REPORT_CORRELATIONS = 5
+MAX_REPORT_MISSING_COLUMNS = 5
+
+
+def _histogram_figure(df, column):
+    """Histogram of a numeric column with a low-to-high gradient"""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    # Use gradient from cyan to magenta
+    n, bins, patches = ax.hist(df[column].dropna(), bins=20, edgecolor='white', linewidth=0.5, alpha=0.85)
+    # Color bars with gradient from low to high
+    cm = plt.cm.coolwarm
+    for i, patch in enumerate(patches):
+        patch.set_facecolor(cm(i/len(patches)))
+    ax.set_title(f"Distribution of {column} (Low → High)", fontsize=11, fontweight='bold', color='#00d9ff')
+    ax.set_xlabel(column, color='#00f5dd', fontweight='bold')
+    ax.set_ylabel("Frequency", color='#00f5dd', fontweight='bold')
+    ax.set_facecolor('#111829')
+    ax.tick_params(colors='#00f5dd')
+    ax.grid(True, alpha=0.1, color='#667eea')
+    return fig
+
+
+def _correlation_figure(corr_matrix):
+    """Correlation heatmap; cell labels only while they stay readable"""
+    fig, ax = plt.subplots(figsize=(8, 6))
+    # Use coolwarm to show strong positive (red/warm) to strong negative (blue/cool)
+    annotate = len(corr_matrix) <= MAX_ANNOTATED_CORR_COLUMNS
+    sns.heatmap(corr_matrix, annot=annotate, fmt='.2f', cmap='coolwarm', ax=ax, 
+                cbar_kws={'label': 'Strong → Weak'}, vmin=-1, vmax=1,
+                linewidths=1.5 if annotate else 0, linecolor='white',
+                annot_kws={'fontweight': 'bold', 'fontsize': 9})
+    ax.set_facecolor('#111829')
+    ax.set_title("Correlation Matrix (High ↔ Low)", fontsize=11, fontweight='bold', color='#00d9ff')
+    ax.tick_params(colors='#00f5dd')
+    return fig
+
+
+def _categorical_figure(value_counts, column):
+    """Bar chart of the most frequent values with a high-to-low gradient"""
+    fig, ax = plt.subplots(figsize=(8, 5))
+    value_counts = value_counts.sort_values(ascending=False)
+    # Create gradient from warm (high) to cool (low)
+    colors_list = plt.cm.coolwarm(np.linspace(0.95, 0.05, len(value_counts)))
+    bars = ax.barh(range(len(value_counts)), value_counts.values, color=colors_list, edgecolor='white', linewidth=1.5, alpha=0.85)
+    # Add value labels
+    for bar, val in zip(bars, value_counts.values):
+        width = bar.get_width()
+        ax.text(width, bar.get_y() + bar.get_height()/2., f' {int(val)}',
+               ha='left', va='center', fontsize=9, color='#00d9ff', fontweight='bold')
+    ax.set_yticks(range(len(value_counts)))
+    ax.set_yticklabels(value_counts.index, color='#00f5dd', fontweight='bold')
+    ax.set_facecolor('#111829')
+    ax.tick_params(colors='#00f5dd')
+    ax.set_title(f"{column} Distribution (High → Low)", fontsize=11, fontweight='bold', color='#00d9ff')
+    ax.set_xlabel("Count", fontweight='bold', color='#00f5dd')
+    ax.grid(True, alpha=0.1, axis='x', color='#667eea')
+    return fig
+
+
+def _render_one(df, job):
+    """Render a single report chart as a BytesIO PNG (None on failure)"""
+    png = render_charts(df, [job], max_workers=1)[0]
+    return io.BytesIO(png) if png else None
+
+
 def generate_histogram(df, column):
     """Generate histogram for a numeric column"""
-    try:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        # Use gradient from cyan to magenta
-        n, bins, patches = ax.hist(df[column].dropna(), bins=20, edgecolor='white', linewidth=0.5, alpha=0.85)
-        # Color bars with gradient from low to high
-        cm = plt.cm.coolwarm
-        for i, patch in enumerate(patches):
-            patch.set_facecolor(cm(i/len(patches)))
-        ax.set_title(f"Distribution of {column} (Low → High)", fontsize=11, fontweight='bold', color='#00d9ff')
-        ax.set_xlabel(column, color='#00f5dd', fontweight='bold')
-        ax.set_ylabel("Frequency", color='#00f5dd', fontweight='bold')
-        ax.set_facecolor('#111829')
-        ax.tick_params(colors='#00f5dd')
-        ax.grid(True, alpha=0.1, color='#667eea')
-        
-        # Save to BytesIO
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', bbox_inches='tight', dpi=100, facecolor='#0a0e27', edgecolor='none')
-        img_bytes.seek(0)
-        plt.close(fig)
-        return img_bytes
-    except Exception as e:
-        return None
+    return _render_one(df, _histogram_job(column))
 
-def generate_correlation_heatmap(df):
+
+def generate_correlation_heatmap(df, approximate=None):
     """Generate correlation heatmap for numeric columns"""
-    try:
-        numeric_df = df.select_dtypes(include=['float64', 'int64'])
-        if numeric_df.empty or numeric_df.shape[1] < 2:
-            return None
-        
-        fig, ax = plt.subplots(figsize=(8, 6))
-        corr_matrix = numeric_df.corr()
-        # Use coolwarm to show strong positive (red/warm) to strong negative (blue/cool)
-        sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', ax=ax, 
-                    cbar_kws={'label': 'Strong → Weak'}, vmin=-1, vmax=1,
-                    linewidths=1.5, linecolor='white', annot_kws={'fontweight': 'bold', 'fontsize': 9})
-        ax.set_facecolor('#111829')
-        ax.set_title("Correlation Matrix (High ↔ Low)", fontsize=11, fontweight='bold', color='#00d9ff')
-        ax.tick_params(colors='#00f5dd')
-        
-        # Save to BytesIO
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', bbox_inches='tight', dpi=100, facecolor='#0a0e27', edgecolor='none')
-        img_bytes.seek(0)
-        plt.close(fig)
-        return img_bytes
-    except Exception as e:
+    stats = get_dataset_stats(df, approximate=approximate)
+    if len(stats.numeric_cols) < 2:
         return None
+    return _render_one(df, _correlation_job(stats))
+
 
-def generate_categorical_chart(df, column):
+def generate_categorical_chart(df, column, approximate=None):
     """Generate bar chart for categorical column with high-low gradient"""
-    try:
-        fig, ax = plt.subplots(figsize=(8, 5))
-        value_counts = df[column].value_counts().head(10).sort_values(ascending=False)
-        # Create gradient from warm (high) to cool (low)
-        colors_list = plt.cm.coolwarm(np.linspace(0.95, 0.05, len(value_counts)))
-        bars = ax.barh(range(len(value_counts)), value_counts.values, color=colors_list, edgecolor='white', linewidth=1.5, alpha=0.85)
-        # Add value labels
-        for bar, val in zip(bars, value_counts.values):
-            width = bar.get_width()
-            ax.text(width, bar.get_y() + bar.get_height()/2., f' {int(val)}',
-                   ha='left', va='center', fontsize=9, color='#00d9ff', fontweight='bold')
-        ax.set_yticks(range(len(value_counts)))
-        ax.set_yticklabels(value_counts.index, color='#00f5dd', fontweight='bold')
-        ax.set_facecolor('#111829')
-        ax.tick_params(colors='#00f5dd')
-        ax.set_title(f"{column} Distribution (High → Low)", fontsize=11, fontweight='bold', color='#00d9ff')
-        ax.set_xlabel("Count", fontweight='bold', color='#00f5dd')
-        ax.grid(True, alpha=0.1, axis='x', color='#667eea')
-        
-        # Save to BytesIO
-        img_bytes = io.BytesIO()
-        plt.savefig(img_bytes, format='png', bbox_inches='tight', dpi=100, facecolor='#0a0e27', edgecolor='none')
-        img_bytes.seek(0)
-        plt.close(fig)
-        return img_bytes
-    except Exception as e:
-        return None
+    stats = get_dataset_stats(df, approximate=approximate)
+    return _render_one(df, _categorical_job(stats, column))
+
+
+def _histogram_job(column):
+    return RenderJob(_histogram_figure, (column,), chart_type="report_histogram", columns=[column],
+                     width=8, height=5, savefig=REPORT_SAVEFIG)
 
-def generate_pdf_report(df, username="User", dataset_name="Dataset"):
-    """Generate complete PDF report for the dataset"""
+
+def _correlation_job(stats):
+    return RenderJob(_correlation_figure, (stats.correlation(),), uses_frame=False, chart_type="report_correlation",
+                     width=8, height=6, savefig=REPORT_SAVEFIG)
+
+
+def _categorical_job(stats, column):
+    return RenderJob(_categorical_figure, (stats.top_values(column, 10), column), uses_frame=False,
+                     chart_type="report_categorical", columns=[column], width=8, height=5,
+                     savefig=REPORT_SAVEFIG, approximate=stats.approximate)
+
+
+# ----------------------------------------------------------------------
+# Report pipeline: statistics -> chart images -> PDF
+# ----------------------------------------------------------------------
+def compute_report_data(df, approximate=None):
+    """
+    Stage 1: every statistic and table the report shows, computed once.
+
+    approximate: statistics mode as for get_dataset_stats (None: by dataset size)
+    """
+    stats = get_dataset_stats(df, approximate=approximate)
+    numeric_cols = stats.numeric_cols
+    categorical_cols = stats.categorical_cols
     
+    data = {
+        "rows": len(df),
+        "cols": len(df.columns),
+        "memory_mb": stats.memory_mb,
+        "numeric_cols": numeric_cols,
+        "categorical_cols": categorical_cols,
+        "dtype_summary": pd.DataFrame({
+            'Column': df.columns,
+            'Type': df.dtypes.astype(str),
+            'Non-Null Count': (len(df) - stats.missing).values,
+            'Null Count': stats.missing.values
+        }),
+        "insights": [
+            f"Numeric Columns: {len(numeric_cols)} ({', '.join(numeric_cols[:3])}{'...' if len(numeric_cols) > 3 else ''})",
+            f"Categorical Columns: {len(categorical_cols)} ({', '.join(categorical_cols[:3])}{'...' if len(categorical_cols) > 3 else ''})",
+            f"Missing Values: {stats.total_missing} ({stats.missing_pct:.2f}% of dataset)",
+            f"Duplicate Rows: {stats.duplicate_rows} ({stats.duplicate_rows/len(df)*100:.2f}% of dataset)",
+            f"Memory Usage: {stats.memory_mb:.2f} MB"
+        ] + generate_insights(df, top_k=MAX_REPORT_CORRELATIONS, approximate=approximate,
+                              max_missing=MAX_REPORT_MISSING_COLUMNS),
+        "categorical_info": [f"- {col}: {stats.nunique(col)} unique values" for col in categorical_cols[:5]],
+    }
+    
+    if numeric_cols:
+        numeric_stats = stats.describe_numeric().round(3).T
+        numeric_stats['Column'] = numeric_stats.index
+        data["numeric_stats"] = numeric_stats[['Column', 'count', 'mean', 'std', 'min', 'max']]
+    
+    # Charts of the report, in page order
+    jobs = {("histogram", col): _histogram_job(col) for col in numeric_cols[:3]}  # Limit to 3 distributions
+    if len(numeric_cols) > 1:
+        jobs["correlation"] = _correlation_job(stats)
+    for col in categorical_cols[:2]:  # Limit to 2 categorical charts
+        jobs[("categorical", col)] = _categorical_job(stats, col)
+    data["chart_jobs"] = jobs
+    return data
+
+
+def render_report_images(df, data):
+    """Stage 2: PNG bytes of every report chart, rendered concurrently (reused from the render cache)"""
+    jobs = data["chart_jobs"]
+    return dict(zip(jobs, render_charts(df, list(jobs.values()))))
+
+
+def assemble_pdf(data, images, username="User", dataset_name="Dataset"):
+    """Stage 3: lay out the precomputed tables and images"""
     pdf = EDAPDFReport(username=username)
     
     # Title page
     pdf.add_title_page(
         dataset_name=dataset_name,
-        rows=len(df),
-        cols=len(df.columns)
+        rows=data["rows"],
+        cols=data["cols"]
     )
     
     # Dataset Overview
     pdf.add_section("Dataset Overview")
     overview_text = f"""
     Dataset Name: {dataset_name}
-    Total Records: {len(df):,}
-    Total Columns: {len(df.columns)}
-    Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB
+    Total Records: {data["rows"]:,}
+    Total Columns: {data["cols"]}
+    Memory Usage: {data["memory_mb"]:.2f} MB
     
     This section provides comprehensive information about your dataset structure and contents.
     """
@@ -279,34 +369,17 @@ def generate_pdf_report(df, username="User", dataset_name="Dataset"):
     
     # Statistics
     pdf.add_section("Data Quality Report")
-    
-    dtype_summary = pd.DataFrame({
-        'Column': df.columns,
-        'Type': df.dtypes.astype(str),
-        'Non-Null Count': df.count().values,
-        'Null Count': df.isnull().sum().values
-    })
-    pdf.add_statistics_table(dtype_summary)
+    pdf.add_statistics_table(data["dtype_summary"])
     
     # Key insights
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    
-    insights = [
-        f"Numeric Columns: {len(numeric_cols)} ({', '.join(numeric_cols[:3])}{'...' if len(numeric_cols) > 3 else ''})",
-        f"Categorical Columns: {len(categorical_cols)} ({', '.join(categorical_cols[:3])}{'...' if len(categorical_cols) > 3 else ''})",
-        f"Missing Values: {df.isnull().sum().sum()} ({df.isnull().sum().sum()/len(df)/len(df.columns)*100:.2f}% of dataset)",
-        f"Duplicate Rows: {df.duplicated().sum()} ({df.duplicated().sum()/len(df)*100:.2f}% of dataset)",
-        f"Memory Usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB"
-    ]
-    pdf.add_insights(insights)
+    numeric_cols = data["numeric_cols"]
+    categorical_cols = data["categorical_cols"]
+    pdf.add_insights(data["insights"])
     
     # Numeric Summary
-    if not df.select_dtypes(include=['float64', 'int64']).empty:
+    if numeric_cols:
         pdf.add_section("Numeric Column Summary")
-        numeric_stats = df.describe().round(3).T
-        numeric_stats['Column'] = numeric_stats.index
-        numeric_stats = numeric_stats[['Column', 'count', 'mean', 'std', 'min', 'max']]
+        numeric_stats = data["numeric_stats"]
         
         pdf.set_font("Arial", "B", 9)
         pdf.set_fill_color(230, 230, 250)
@@ -327,59 +400,80 @@ def generate_pdf_report(df, username="User", dataset_name="Dataset"):
             pdf.cell(35, 5, f"{row['max']:.2f}", 1, 1)
     
     # Categorical Summary
-    if not df.select_dtypes(include=['object']).empty:
+    if categorical_cols:
         pdf.add_section("Categorical Column Summary")
-        cat_info = []
-        for col in df.select_dtypes(include=['object']).columns[:5]:
-            cat_info.append(f"- {col}: {df[col].nunique()} unique values")
-        
-        for info in cat_info:
+        for info in data["categorical_info"]:
             pdf.cell(0, 5, info, 0, 1)
     
+    def place(png):
+        if png:
+            pdf.set_xy(10, pdf.get_y())
+            pdf.image(io.BytesIO(png), x=10, y=None, w=190)
+            pdf.ln(5)
+    
     # VISUALIZATION SECTION
     pdf.add_page()
     pdf.add_section("Visualizations")
     
     # Numeric distributions
-    numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns.tolist()
     if numeric_cols:
         pdf.ln(3)
         pdf.set_font("Arial", "B", 10)
         pdf.cell(0, 8, "Numeric Distributions", 0, 1)
         pdf.ln(2)
         
-        for i, col in enumerate(numeric_cols[:3]):  # Limit to 3 distributions
-            img_bytes = generate_histogram(df, col)
-            if img_bytes:
-                pdf.set_xy(10, pdf.get_y())
-                pdf.image(img_bytes, x=10, y=None, w=190)
-                pdf.ln(5)
+        for col in numeric_cols[:3]:
+            place(images.get(("histogram", col)))
     
     # Correlation heatmap
     if len(numeric_cols) > 1:
         pdf.add_page()
         pdf.add_section("Correlation Analysis")
-        img_bytes = generate_correlation_heatmap(df)
-        if img_bytes:
-            pdf.set_xy(10, pdf.get_y())
-            pdf.image(img_bytes, x=10, y=None, w=190)
-            pdf.ln(5)
+        place(images.get("correlation"))
     
     # Categorical visualizations
-    categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
     if categorical_cols:
         pdf.add_page()
         pdf.add_section("Categorical Analysis")
         
-        for i, col in enumerate(categorical_cols[:2]):  # Limit to 2 categorical charts
-            img_bytes = generate_categorical_chart(df, col)
-            if img_bytes:
-                pdf.set_xy(10, pdf.get_y())
-                pdf.image(img_bytes, x=10, y=None, w=190)
-                pdf.ln(5)
+        for col in categorical_cols[:2]:
+            place(images.get(("categorical", col)))
     
     return pdf
 
+
+def generate_pdf_report(df, username="User", dataset_name="Dataset", progress_callback=None, approximate=None):
+    """
+    Generate complete PDF report for the dataset.
+    
+    Runs the three report stages and records their durations in seconds on
+    the returned report as ``pdf.timings`` ({"stats", "images", "assemble"}).
+    progress_callback(fraction, message) is called as each stage starts.
+    approximate selects the statistics mode (see get_dataset_stats).
+    """
+    report_progress = progress_callback or (lambda fraction, message: None)
+    timings = {}
+    
+    report_progress(0.05, "Computing statistics")
+    start = time.perf_counter()
+    data = compute_report_data(df, approximate=approximate)
+    timings["stats"] = time.perf_counter() - start
+    
+    report_progress(0.25, f"Rendering {len(data['chart_jobs'])} charts")
+    start = time.perf_counter()
+    images = render_report_images(df, data)
+    timings["images"] = time.perf_counter() - start
+    
+    report_progress(0.85, "Assembling PDF")
+    start = time.perf_counter()
+    pdf = assemble_pdf(data, images, username=username, dataset_name=dataset_name)
+    timings["assemble"] = time.perf_counter() - start
+    
+    pdf.timings = timings
+    print("[PDF] " + " · ".join(f"{stage} {seconds:.2f}s" for stage, seconds in timings.items()))
+    return pdf
+
+
 def get_pdf_bytes(pdf):
     """Get PDF as bytes for download"""
     pdf_bytes = pdf.output()
@@ -0,0 +1,276 @@
+"""
+Report Jobs Module
+Background PDF report generation with progress and downloadable artifacts
+
+Generating a report inside the Streamlit script run blocks the page, and any
+widget interaction reruns the script and throws the half-built report away.
+Reports are submitted to a local process pool instead: ``submit`` returns a
+job ID at once, the page polls ``status`` and offers the PDF for download
+when the job is done.
+
+Job state lives in an artifact store on disk (EDA_REPORT_DIR, default: system
+temp dir), one ``<job_id>.json`` status file and one ``<job_id>.pdf`` per job,
+so jobs survive reruns and are visible from every session. Workers load the
+dataset from its Arrow snapshot instead of receiving a pickled copy.
+
+Every status write records a heartbeat (``updated``) and status files record
+the pid and host of the process running the job, so an unfinished job that
+another process (e.g. a second app instance) still runs is left alone; it is
+reported as interrupted only once that process is gone or, where it cannot be
+checked, its heartbeat is older than EDA_REPORT_STALE_SECONDS.
+"""
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Optional
+
+from eda.render_pool import render_workers_per_process
+from utils.dataset_cache import load_snapshot, share_snapshot
+
+# Reports generated at the same time (override with EDA_REPORT_WORKERS)
+DEFAULT_REPORT_WORKERS = 2
+
+# Finished jobs and their PDFs are deleted after this many hours (override with EDA_REPORT_TTL_HOURS)
+DEFAULT_REPORT_TTL_HOURS = 24
+
+# Unfinished jobs without a status update for this long are interrupted (override with EDA_REPORT_STALE_SECONDS)
+DEFAULT_REPORT_STALE_SECONDS = 900
+
+FINISHED_STATES = ("done", "failed")
+
+
+def report_dir() -> str:
+    """Directory of the artifact store"""
+    return os.getenv("EDA_REPORT_DIR", os.path.join(tempfile.gettempdir(), "auto_eda_reports"))
+
+
+def _status_path(directory: str, job_id: str) -> str:
+    return os.path.join(directory, f"{job_id}.json")
+
+
+def _artifact_path(directory: str, job_id: str) -> str:
+    return os.path.join(directory, f"{job_id}.pdf")
+
+
+def _write_atomic(path: str, payload: bytes):
+    # A unique temp file per write: the app updates statuses from several threads and processes
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_status(directory: str, job_id: str) -> Optional[dict]:
+    try:
+        with open(_status_path(directory, job_id), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _update_status(directory: str, job_id: str, **fields) -> dict:
+    status = _read_status(directory, job_id) or {"id": job_id}
+    status.update(fields, updated=time.time())
+    _write_atomic(_status_path(directory, job_id), json.dumps(status).encode("utf-8"))
+    return status
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, owned by another user
+    return True
+
+
+def _is_abandoned(status: dict) -> bool:
+    """Whether no process runs an unfinished job any more: its process is gone or its heartbeat is stale"""
+    # Running jobs belong to their worker, queued ones to the process that submitted them
+    pid = status.get("worker_pid") if status.get("state") == "running" else status.get("pid")
+    # os.kill(pid, 0) would terminate the process on Windows
+    if pid and status.get("host") == socket.gethostname() and os.name != "nt":
+        if not _process_alive(pid):
+            return True
+        if status.get("state") != "running":
+            return False  # Waiting in a live process's queue sends no heartbeats
+    max_age = float(os.getenv("EDA_REPORT_STALE_SECONDS", DEFAULT_REPORT_STALE_SECONDS))
+    return time.time() - status.get("updated", status.get("created", 0)) > max_age
+
+
+def _init_worker(render_workers: int):
+    import matplotlib
+    matplotlib.use("Agg")
+    # Reports already run in parallel processes; share the CPUs between their render pools
+    os.environ["EDA_RENDER_WORKERS"] = str(render_workers)
+
+
+def _run_job(directory: str, job_id: str, snapshot_key: Optional[str], df, username: str, dataset_name: str,
+             approximate: Optional[bool] = None):
+    """Process-pool worker: build one report and store the PDF"""
+    from pdf_generator import generate_pdf_report, get_pdf_bytes
+
+    try:
+        _update_status(directory, job_id, state="running", progress=0.0, message="Loading dataset",
+                       started=time.time(), worker_pid=os.getpid())
+        if df is None:
+            df = load_snapshot(snapshot_key)
+            if df is None:
+                raise RuntimeError(f"Dataset snapshot {snapshot_key} is not available")
+
+        def progress(fraction, message):
+            _update_status(directory, job_id, progress=fraction, message=message)
+
+        pdf = generate_pdf_report(df, username=username, dataset_name=dataset_name, progress_callback=progress,
+                                  approximate=approximate)
+        _write_atomic(_artifact_path(directory, job_id), get_pdf_bytes(pdf))
+        _update_status(directory, job_id, state="done", progress=1.0, message="Report ready",
+                       finished=time.time(), timings=pdf.timings)
+    except Exception as e:
+        _update_status(directory, job_id, state="failed", message=f"{type(e).__name__}: {e}",
+                       error=traceback.format_exc(limit=-2), finished=time.time())
+
+
+class ReportJobQueue:
+    """Submits report jobs to a process pool and reads their state from the artifact store"""
+
+    def __init__(self, directory: Optional[str] = None, max_workers: Optional[int] = None):
+        self.directory = directory or report_dir()
+        if max_workers is None:
+            max_workers = int(os.getenv("EDA_REPORT_WORKERS", DEFAULT_REPORT_WORKERS))
+        self.max_workers = max_workers
+        self._pool = None
+        self._futures = {}  # job_id -> Future, for jobs submitted by this process
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Process pool started on first use (spawned; safe next to Streamlit's threads)"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=get_context("spawn"),
+                                             initializer=_init_worker,
+                                             initargs=(render_workers_per_process(self.max_workers),))
+        return self._pool
+
+    def submit(self, df, username: str = "User", dataset_name: str = "Dataset", owner: Optional[str] = None,
+               approximate: Optional[bool] = None) -> str:
+        """
+        Queue a report of df (statistics mode as for get_dataset_stats) and
+        return its job ID. owner is a stable user or session ID that jobs()
+        filters on; username is only the name printed in the report.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        self.prune()
+        # Frames Arrow cannot store are sent to the worker directly
+        snapshot_key = share_snapshot(df)
+        job_id = uuid.uuid4().hex[:12]
+        # Under the lock, so status() never sees the job without its future
+        with self._lock:
+            _update_status(self.directory, job_id, state="queued", progress=0.0, message="Waiting for a worker",
+                           owner=owner, dataset_name=dataset_name, created=time.time(),
+                           pid=os.getpid(), host=socket.gethostname())
+            try:
+                future = self._get_pool().submit(_run_job, self.directory, job_id, snapshot_key,
+                                                 None if snapshot_key else df, username, dataset_name, approximate)
+            except Exception as e:
+                # The pool cannot start or has broken (e.g. a worker was killed); the next submit starts a new one
+                print(f"[REPORT] Process pool unavailable ({type(e).__name__}: {e})")
+                self._pool = None
+                _update_status(self.directory, job_id, state="failed", message=f"Could not start the report: {e}",
+                               finished=time.time())
+                return job_id
+            self._futures[job_id] = future
+        print(f"[REPORT] Queued job {job_id} for {dataset_name}")
+        return job_id
+
+    def status(self, job_id: str) -> Optional[dict]:
+        """
+        Current state of a job: id, state (queued/running/done/failed), progress
+        (0-1), message, owner, dataset_name, timestamps and, once done, timings.
+        """
+        return self._check(_read_status(self.directory, job_id))
+
+    def _check(self, status: Optional[dict]) -> Optional[dict]:
+        """status, marked failed if the job can no longer finish"""
+        if status is None or status.get("state") in FINISHED_STATES:
+            return status
+
+        job_id = status["id"]
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is None:
+            # Submitted by another process (or an earlier run of this one, e.g. before an app restart)
+            if status.get("pid") == os.getpid() or _is_abandoned(status):
+                return _update_status(self.directory, job_id, state="failed", message="Interrupted",
+                                      finished=time.time())
+            return status
+        if future.done() and future.exception() is not None:
+            error = future.exception()
+            return _update_status(self.directory, job_id, state="failed",
+                                  message=f"{type(error).__name__}: {error}", finished=time.time())
+        return status
+
+    def artifact(self, job_id: str) -> Optional[bytes]:
+        """PDF bytes of a finished job, or None"""
+        try:
+            with open(_artifact_path(self.directory, job_id), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def jobs(self, owner: Optional[str] = None) -> list:
+        """Status of every stored job (of one owner), newest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        statuses = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                status = _read_status(self.directory, name[:-len(".json")])
+                if status and (owner is None or status.get("owner") == owner):
+                    statuses.append(self._check(status))
+        return sorted(statuses, key=lambda status: status.get("created", 0), reverse=True)
+
+    def prune(self):
+        """Delete finished jobs older than the retention period"""
+        if not os.path.isdir(self.directory):
+            return
+        max_age = float(os.getenv("EDA_REPORT_TTL_HOURS", DEFAULT_REPORT_TTL_HOURS)) * 3600
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            job_id = name[:-len(".json")]
+            status = _read_status(self.directory, job_id)
+            if status and status.get("state") in FINISHED_STATES and now - status.get("finished", now) > max_age:
+                for path in (_artifact_path(self.directory, job_id), _status_path(self.directory, job_id)):
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                with self._lock:
+                    self._futures.pop(job_id, None)
+
+
+# Process-wide queue shared by every Streamlit session
+_report_queue = None
+_report_queue_lock = threading.Lock()
+
+
+def get_report_queue() -> ReportJobQueue:
+    global _report_queue
+    with _report_queue_lock:
+        if _report_queue is None:
+            _report_queue = ReportJobQueue()
+        return _report_queue
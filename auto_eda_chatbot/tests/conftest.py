@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Import app modules as the app does (from the auto_eda_chatbot directory)
+sys.path.insert(0, str(Path(__file__).parent.parent))
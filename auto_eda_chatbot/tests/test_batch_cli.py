@@ -0,0 +1,38 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from batch_cli import find_inputs, run_batch
+
+
+def _write_inputs(directory, names=("a", "b")):
+    rng = np.random.default_rng(0)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        pd.DataFrame({"x": rng.random(50), "c": rng.choice(["p", "q"], 50)}).to_csv(directory / f"{name}.csv",
+                                                                                   index=False)
+
+
+def test_find_inputs_skips_excluded_directories(tmp_path):
+    _write_inputs(tmp_path)
+    _write_inputs(tmp_path / "reports", ["a.csv"])
+    _write_inputs(tmp_path / "yesterday", ["a.csv"])
+
+    found = find_inputs([str(tmp_path)], exclude=(str(tmp_path / "reports"), str(tmp_path / "yesterday")))
+
+    assert found == [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
+
+
+def test_second_run_does_not_profile_its_own_outputs(tmp_path, capsys):
+    _write_inputs(tmp_path)
+    out_dir = str(tmp_path / "reports")
+
+    run_batch([str(tmp_path)], out_dir, formats=["json", "parquet"], max_workers=1)
+    assert os.path.exists(os.path.join(out_dir, "a.csv.parquet"))
+    capsys.readouterr()
+
+    manifest = run_batch([str(tmp_path)], out_dir, formats=["json", "parquet"], max_workers=1)
+
+    assert "[BATCH] 2 datasets, 2 unchanged, 0 to process" in capsys.readouterr().out
+    assert sorted(manifest["files"]) == [str(tmp_path / "a.csv"), str(tmp_path / "b.csv")]
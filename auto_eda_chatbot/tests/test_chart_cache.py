@@ -0,0 +1,76 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from utils.chart_cache import ChartCache, cached_figure_png, chart_key, get_chart_cache
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"x": range(50), "y": [value * 2.0 for value in range(50)]})
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    get_chart_cache().clear()
+    yield
+    get_chart_cache().clear()
+
+
+def test_key_changes_with_data_and_parameters(df):
+    key = chart_key(df, "hist", ["x"], bins=10)
+
+    assert chart_key(df.copy(), "hist", ["x"], bins=10) == key
+    assert chart_key(df, "hist", ["y"], bins=10) != key
+    assert chart_key(df, "hist", ["x"], bins=20) != key
+    assert chart_key(df, "box", ["x"], bins=10) != key
+    changed = df.copy()
+    changed.loc[3, "y"] = -1.0
+    assert chart_key(changed, "hist", ["x"], bins=10) != key
+
+
+def test_key_follows_the_theme(df):
+    key = chart_key(df, "hist", ["x"])
+
+    with plt.rc_context({"axes.facecolor": "#123456"}):
+        assert chart_key(df, "hist", ["x"]) != key
+
+
+def test_figure_is_built_once_per_key(df):
+    calls = []
+
+    def build():
+        calls.append(1)
+        fig, ax = plt.subplots()
+        ax.hist(df["x"])
+        return fig
+
+    first = cached_figure_png(df, "hist", build, ["x"])
+    second = cached_figure_png(df.copy(), "hist", build, ["x"])
+
+    assert first == second and first.startswith(b"\x89PNG")
+    assert len(calls) == 1
+    assert cached_figure_png(df, "hist", lambda: None, ["y"]) is None
+
+
+def test_lru_eviction_by_bytes():
+    cache = ChartCache(max_bytes=100)
+    cache.put("a", b"1" * 40)
+    cache.put("b", b"2" * 40)
+    cache.get("a")
+    cache.put("c", b"3" * 40)
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total_bytes == 80
+    cache.put("huge", b"4" * 101)
+    assert "huge" not in cache
+
+
+def test_disk_tier_survives_a_new_cache(tmp_path):
+    ChartCache(disk_dir=str(tmp_path)).put("key", b"payload")
+
+    cache = ChartCache(disk_dir=str(tmp_path))
+
+    assert cache.get("key") == b"payload"
+    assert (cache.hits, cache.misses) == (1, 0)
+    assert cache.get("missing") is None
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.correlation import correlation_matrix
+
+
+@pytest.fixture
+def df():
+    """Correlated columns with large offsets, different scales and gaps"""
+    rng = np.random.default_rng(7)
+    values = rng.normal(size=(20_000, 5))
+    values[:, 1] += 0.8 * values[:, 0]
+    values[:, 3] -= 0.5 * values[:, 2]
+    frame = pd.DataFrame(values * [1, 2, 1000, 0.01, 5] + [1e6, 1e6, 3e7, 1e6, 0], columns=list("abcde"))
+    frame.loc[::7, "c"] = np.nan
+    frame.loc[::11, "a"] = np.nan
+    return frame
+
+
+def test_matches_pandas(df):
+    result = correlation_matrix(df, row_chunk=3000)
+
+    np.testing.assert_allclose(result.values, df.corr().values, atol=1e-9)
+
+
+def test_float32_keeps_precision_on_offset_columns(df):
+    result = correlation_matrix(df, float32=True, row_chunk=3000)
+
+    np.testing.assert_allclose(result.values, df.corr().values, atol=1e-4)
+
+
+def test_spearman_matches_pandas_without_missing_values(df):
+    complete = df.dropna()
+
+    result = correlation_matrix(complete, method="spearman")
+
+    np.testing.assert_allclose(result.values, complete.corr(method="spearman").values, atol=1e-9)
+
+
+def test_process_pool_blocks_match_pandas(df, monkeypatch):
+    monkeypatch.setenv("EDA_CORR_PARALLEL_COLS", "2")
+
+    result = correlation_matrix(df, float32=True, block_cols=2, max_workers=2)
+
+    np.testing.assert_allclose(result.values, df.corr().values, atol=1e-4)
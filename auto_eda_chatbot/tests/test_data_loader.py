@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_loader import optimize_dtypes
+
+
+@pytest.fixture
+def df():
+    rows = 120
+    return pd.DataFrame({
+        "answer": ["yes", "none", "no"] * (rows // 3),
+        "pet": ["cat", "None", "dog"] * (rows // 3),
+        "day": ["2024-01-01", "null", "2024-02-03"] * (rows // 3),
+        "count": np.arange(rows, dtype="int64"),
+        "ratio": np.linspace(0, 1, rows),
+        "halves": np.arange(rows) / 2,
+    })
+
+
+def test_null_tokens_stay_category_levels(df):
+    optimized, _ = optimize_dtypes(df.copy())
+
+    assert optimized["pet"].dtype == "category"
+    assert optimized["pet"].value_counts().to_dict() == df["pet"].value_counts().to_dict()
+
+
+def test_null_tokens_are_missing_in_bool_and_date_columns(df):
+    optimized, report = optimize_dtypes(df.copy())
+
+    assert str(optimized["answer"].dtype) == "boolean"
+    assert optimized["answer"].isna().tolist() == (df["answer"] == "none").tolist()
+    assert optimized["day"].isna().tolist() == (df["day"] == "null").tolist()
+    assert optimized["day"].dropna().tolist() == list(pd.to_datetime(df["day"][df["day"] != "null"]))
+    assert report["after_bytes"] < report["before_bytes"]
+
+
+def test_numeric_values_survive_downcasting(df):
+    optimized, _ = optimize_dtypes(df.copy())
+
+    assert optimized["count"].dtype == "int8"
+    assert optimized["halves"].dtype == "float32"  # Exact in float32
+    assert optimized["ratio"].dtype == "float64"  # Would lose precision
+    pd.testing.assert_frame_equal(optimized[["count", "ratio", "halves"]].astype("float64"),
+                                  df[["count", "ratio", "halves"]].astype("float64"))
+
+
+def test_normalize_strings_matches_pandas_str_methods():
+    from utils.data_loader import normalize_strings
+
+    series = pd.Series([" Paris", "PARIS ", None, "Rome", np.nan, "rome", "  "], index=list("abcdefg"), name="city")
+    expected = series.str.strip().str.lower()
+
+    result = normalize_strings(series)
+
+    pd.testing.assert_series_equal(result.fillna("<null>"), expected.fillna("<null>").astype(object))
+    assert result.isna().tolist() == series.isna().tolist()  # Nulls stay null, not the string "nan"
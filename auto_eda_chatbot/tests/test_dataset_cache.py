@@ -0,0 +1,84 @@
+import pandas as pd
+import pytest
+
+from utils import dataset_cache
+from utils.dataset_cache import DatasetCache, dataset_fingerprint, dataset_memo, get_dataset_cache, load_path_cached
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Empty memory cache and a private snapshot directory"""
+    monkeypatch.setenv("EDA_SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    get_dataset_cache().clear()
+    yield
+    get_dataset_cache().clear()
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    return str(path)
+
+
+class CountingLoader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, path, **options):
+        self.calls += 1
+        return pd.read_csv(path)
+
+
+def test_loader_version_change_invalidates_persisted_snapshots(csv_path, monkeypatch):
+    loader = CountingLoader()
+    load_path_cached(csv_path, loader)
+    get_dataset_cache().clear()
+    load_path_cached(csv_path, loader)
+    assert loader.calls == 1  # Reopened from the snapshot
+
+    monkeypatch.setattr(dataset_cache, "LOADER_VERSION", dataset_cache.LOADER_VERSION + 1)
+    get_dataset_cache().clear()
+    load_path_cached(csv_path, loader)
+    assert loader.calls == 2
+
+
+def test_changed_content_or_options_reload(csv_path):
+    loader = CountingLoader()
+    first = load_path_cached(csv_path, loader)
+    assert load_path_cached(csv_path, loader) is first
+    assert loader.calls == 1
+
+    load_path_cached(csv_path, loader, max_rows=1)
+    assert loader.calls == 2
+
+    with open(csv_path, "a") as f:
+        f.write("3,z\n")
+    changed = load_path_cached(csv_path, loader)
+    assert loader.calls == 3
+    pd.testing.assert_frame_equal(changed, pd.read_csv(csv_path))
+
+
+def test_fingerprint_follows_content_not_identity():
+    df = pd.DataFrame({"a": [1.0, 2.0, 3.0, 4.0]})
+    same = df.copy()
+    derived = df.assign(a=df["a"] * 100)
+
+    assert dataset_fingerprint(same) == dataset_fingerprint(df)
+    assert dataset_fingerprint(derived) != dataset_fingerprint(df)
+    # Memoized structures are rebuilt for the derived frame, not shared with the original
+    assert dataset_memo(df, "mean", lambda: df["a"].mean()) == 2.5
+    assert dataset_memo(derived, "mean", lambda: derived["a"].mean()) == 250.0
+
+
+def test_memory_budget_evicts_least_recently_used():
+    frames = {key: pd.DataFrame({"a": range(1000)}, dtype="int64") for key in "abc"}
+    size = int(frames["a"].memory_usage(deep=True, index=True).sum())
+    cache = DatasetCache(max_bytes=2 * size)
+    cache.put("a", frames["a"])
+    cache.put("b", frames["b"])
+    cache.get("a")
+    cache.put("c", frames["c"])
+
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert cache.total_bytes == 2 * size
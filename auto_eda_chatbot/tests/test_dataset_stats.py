@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.stats import get_dataset_stats
+
+
+@pytest.fixture
+def df():
+    """Numeric columns with outliers and gaps, a categorical column and duplicated rows"""
+    rng = np.random.default_rng(3)
+    rows = 2000
+    frame = pd.DataFrame({
+        "price": rng.normal(100.0, 15.0, rows),
+        "qty": rng.integers(0, 5, rows),
+        "shop": rng.choice(["north", "south", "east"], rows),
+    })
+    frame.loc[::50, "price"] = 1000.0
+    frame.loc[::13, "price"] = np.nan
+    frame.loc[::17, "shop"] = None
+    return pd.concat([frame, frame.iloc[:25]], ignore_index=True)
+
+
+def test_quality_measures_match_pandas(df):
+    stats = get_dataset_stats(df, approximate=False)
+
+    pd.testing.assert_series_equal(stats.missing, df.isnull().sum())
+    assert stats.total_missing == df.isnull().sum().sum()
+    assert stats.completeness_pct == pytest.approx(df.notna().to_numpy().mean() * 100)
+    assert stats.complete_rows == len(df.dropna())
+    assert stats.duplicate_rows == df.duplicated().sum()
+    assert stats.memory_bytes == df.memory_usage(deep=True).sum()
+
+
+def test_column_groups_match_select_dtypes(df):
+    stats = get_dataset_stats(df, approximate=False)
+
+    assert stats.numeric_cols == ["price", "qty"]
+    assert stats.categorical_cols == ["shop"]
+    assert stats.nunique("shop") == df["shop"].nunique()
+
+
+@pytest.mark.parametrize("col", ["price", "qty"])
+def test_outlier_count_matches_iqr_fences(df, col):
+    stats = get_dataset_stats(df, approximate=False)
+    q1, q3 = df[col].quantile([0.25, 0.75])
+    iqr = q3 - q1
+
+    expected = ((df[col] < q1 - 1.5 * iqr) | (df[col] > q3 + 1.5 * iqr)).sum()
+
+    assert stats.outlier_count(col) == expected
+
+
+def test_shared_per_dataset_version(df):
+    assert get_dataset_stats(df, approximate=False) is get_dataset_stats(df, approximate=False)
+    assert get_dataset_stats(df, approximate=False) is not get_dataset_stats(df, approximate=True)
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chat.entity_index import EntityIndex
+
+
+@pytest.fixture
+def names():
+    """Names with repeats in mixed case, a missing value and shared first names"""
+    return pd.Series(["Ada Lovelace", "Alan Turing", None, "ada lovelace", "Grace Hopper",
+                      "Alan Kay", "ADA LOVELACE", "Grace Hopper"])
+
+
+def test_rows_match_a_pandas_filter(names):
+    index = EntityIndex(names)
+
+    for name in names.dropna().str.lower().unique():
+        expected = np.flatnonzero((names.str.lower() == name).to_numpy())
+        np.testing.assert_array_equal(index.rows_for(name), expected)
+    assert len(index.rows_for("nobody")) == 0
+
+
+def test_display_name_is_the_first_record(names):
+    index = EntityIndex(names)
+
+    assert index.display_name("ADA lovelace") == "Ada Lovelace"
+    assert index.display_name("nobody") == "nobody"
+
+
+def test_find_names_in_dataset_order(names):
+    index = EntityIndex(names)
+    order = list(names.dropna().str.lower().unique())
+
+    found = index.find_names("Compare grace hopper with Ada Lovelace, please")
+
+    assert found == sorted(["grace hopper", "ada lovelace"], key=order.index)
+
+
+def test_find_names_by_first_name(names):
+    index = EntityIndex(names)
+
+    found = index.find_names_by_first_name("what did alan do?")
+
+    assert found == [name for name in names.dropna().str.lower().unique() if name.split()[0] == "alan"]
@@ -0,0 +1,61 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.insights import generate_insights, strong_correlations
+
+
+@pytest.fixture
+def df():
+    """Some strongly correlated pairs (one negative), an independent and a constant column"""
+    rng = np.random.default_rng(5)
+    base = rng.normal(size=3000)
+    frame = pd.DataFrame({
+        "a": base,
+        "b": base * 2 + rng.normal(scale=0.1, size=3000),
+        "c": -base + rng.normal(scale=0.3, size=3000),
+        "d": rng.normal(size=3000),
+        "e": 1.0,
+    })
+    frame.loc[::10, "d"] = np.nan
+    return frame
+
+
+def _pandas_pairs(corr, threshold):
+    """Reference: every pair above threshold from a nested loop over df.corr()"""
+    pairs = [(left, right, corr.loc[left, right]) for left, right in itertools.combinations(corr.columns, 2)
+             if abs(corr.loc[left, right]) > threshold]
+    return sorted(pairs, key=lambda pair: -abs(pair[2]))
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.99])
+def test_strong_correlations_match_pairwise_scan(df, threshold):
+    corr = df.corr()
+
+    result = strong_correlations(corr, threshold)
+
+    expected = _pandas_pairs(corr, threshold)
+    assert [pair[:2] for pair in result] == [pair[:2] for pair in expected]
+    np.testing.assert_allclose([pair[2] for pair in result], [pair[2] for pair in expected])
+
+
+def test_top_k_keeps_the_strongest(df):
+    corr = df.corr()
+
+    assert strong_correlations(corr, 0.5, top_k=2) == strong_correlations(corr, 0.5)[:2]
+
+
+def test_generate_insights(df):
+    insights = generate_insights(df, threshold=0.8, approximate=False)
+
+    expected = ["Column 'd' has 300 missing values"] + [
+        f"Columns '{left}' and '{right}' are strongly correlated ({value:.2f})"
+        for left, right, value in _pandas_pairs(df.corr(), 0.8)]
+    assert insights == expected
+
+
+def test_rejects_unknown_method(df):
+    with pytest.raises(ValueError):
+        generate_insights(df, method="kendal")
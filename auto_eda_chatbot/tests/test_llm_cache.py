@@ -0,0 +1,25 @@
+import pandas as pd
+import pytest
+
+from chat.llm_cache import llm_cache_key, normalize_question
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"age": [25, 31, 47], "x": [0, 1, 0]})
+
+
+def test_equivalent_questions_share_a_key(df):
+    assert normalize_question("How many rows have age>30, please?") == "how many rows have age > 30"
+    assert llm_cache_key(df, "How many rows have age > 30?", "m") == llm_cache_key(df, "how many rows  have age>30", "m")
+
+
+@pytest.mark.parametrize("first, second", [
+    ("How many rows have age > 30?", "How many rows have age < 30?"),
+    ("How many rows have age >= 30?", "How many rows have age > 30?"),
+    ("Rows where x != 0", "Rows where x = 0"),
+    ("Rows where x == 0", "Rows where x = 0"),
+    ("Average of age / x", "Average of age * x"),
+])
+def test_questions_differing_by_an_operator_get_different_keys(df, first, second):
+    assert llm_cache_key(df, first, "m") != llm_cache_key(df, second, "m")
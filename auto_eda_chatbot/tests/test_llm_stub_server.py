@@ -0,0 +1,116 @@
+import time
+
+import pandas as pd
+import pytest
+
+from chat import qa_engine
+from chat.llm_cache import get_llm_cache
+from chat.llm_clients import get_llm_clients
+from chat.llm_providers import LLMProvider, race_streams, run_coroutine
+from chat.llm_stub_server import start_stub_server
+
+ANSWER = "Revenue grows steadily with one dip in March."
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """Stub server the app's OpenAI provider talks to (Gemini disabled), with fresh clients and cache"""
+    server = start_stub_server(answer=ANSWER)
+    monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+    monkeypatch.setenv("OPENAI_API_KEY", "stub")
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.delenv("EDA_LLM_CACHE_DB", raising=False)
+    get_llm_clients().reset()
+    get_llm_cache().clear()
+    yield server
+    server.shutdown()
+    get_llm_clients().reset()
+    get_llm_cache().clear()
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({"month": ["Jan", "Feb", "Mar", "Apr"], "revenue": [10.0, 12.0, 9.0, 14.0]})
+
+
+def _stub_provider(name, server, closed):
+    """Streaming provider on its own stub server; records when its stream is closed"""
+    async def stream(question, context):
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key="stub", base_url=server.base_url)
+        try:
+            response = await client.chat.completions.create(
+                model=name, messages=[{"role": "user", "content": question}], stream=True)
+            async for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        finally:
+            closed.append(name)
+            await client.close()
+
+    async def call(question, context):
+        return None
+
+    return LLMProvider(name, name, call, stream=stream)
+
+
+def _drain(result):
+    """Whole text of a race_streams winner"""
+    provider, (first, chunks) = result
+
+    async def rest():
+        return [chunk async for chunk in chunks]
+    return provider, first + "".join(run_coroutine(rest()))
+
+
+def test_stream_yields_tokens_in_order(stub, df):
+    chunks = list(qa_engine.stream_llm_for_analysis("explain the revenue trend", df))
+
+    assert chunks == ["Revenue", " grows", " steadily", " with", " one", " dip", " in", " March."]
+    assert stub.requests[-1]["stream"] is True
+
+
+def test_hedge_starts_on_late_first_token_and_cancels_the_loser(monkeypatch):
+    monkeypatch.setenv("EDA_LLM_HEDGE_DELAY", "0.2")
+    slow = start_stub_server(answer="slow answer", first_token_delay=3.0)
+    fast = start_stub_server(answer="fast answer")
+    closed = []
+    providers = [_stub_provider("slow", slow, closed), _stub_provider("fast", fast, closed)]
+    try:
+        start = time.perf_counter()
+        provider, text = _drain(run_coroutine(race_streams(providers, "question", "context")))
+        elapsed = time.perf_counter() - start
+    finally:
+        slow.shutdown()
+        fast.shutdown()
+
+    assert (provider.name, text) == ("fast", "fast answer")
+    assert elapsed < 2.0
+    assert len(slow.requests) == len(fast.requests) == 1
+    assert "slow" in closed  # Cancelled while waiting for its first token
+    assert providers[0].breaker.state == "closed"  # Cancellation is not a failure
+
+
+def test_no_hedge_when_first_token_is_on_time(monkeypatch):
+    monkeypatch.setenv("EDA_LLM_HEDGE_DELAY", "1.0")
+    primary = start_stub_server(answer="primary answer")
+    backup = start_stub_server(answer="backup answer")
+    closed = []
+    providers = [_stub_provider("primary", primary, closed), _stub_provider("backup", backup, closed)]
+    try:
+        provider, text = _drain(run_coroutine(race_streams(providers, "question", "context")))
+    finally:
+        primary.shutdown()
+        backup.shutdown()
+
+    assert (provider.name, text) == ("primary", "primary answer")
+    assert backup.requests == []
+
+
+def test_pooled_client_reuses_its_connection(stub, df):
+    answers = [qa_engine.ask_llm_for_analysis(f"question {index} about revenue", df) for index in range(4)]
+
+    assert answers == [ANSWER] * 4
+    assert len(stub.requests) == 4
+    assert stub.connections == 1
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from chat.qa_engine import load_dataset
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(3)
+    rows = 1000
+    return pd.DataFrame({
+        "ID": np.arange(rows),
+        "Score": rng.normal(size=rows).round(3),
+        "City": rng.choice([" Paris", "berlin ", "ROME"], rows),
+    })
+
+
+@pytest.fixture
+def csv_path(tmp_path, frame):
+    path = tmp_path / "data.csv"
+    frame.to_csv(path, index=False)
+    return str(path)
+
+
+def test_chunked_read_matches_one_shot_read(csv_path):
+    progress = []
+
+    chunked = load_dataset(csv_path, chunksize=128, progress_callback=lambda fraction, rows: progress.append(fraction))
+
+    pd.testing.assert_frame_equal(chunked, load_dataset(csv_path))
+    assert progress == sorted(progress) and progress[-1] == 1.0
+
+
+def test_chunked_read_normalizes_like_pandas(csv_path, frame):
+    chunked = load_dataset(csv_path, chunksize=128)
+
+    assert list(chunked.columns) == ["id", "score", "city"]
+    assert chunked["city"].tolist() == frame["City"].str.strip().str.lower().tolist()
+
+
+def test_head_cap_matches_nrows(csv_path):
+    capped = load_dataset(csv_path, chunksize=128, max_rows=300)
+
+    pd.testing.assert_frame_equal(capped, load_dataset(csv_path).head(300))
+
+
+def test_random_sample_is_an_ordered_subset(csv_path):
+    sample = load_dataset(csv_path, chunksize=128, max_rows=200, sampling="random")
+
+    assert len(sample) == 200 and sample["id"].is_unique
+    assert sample["id"].is_monotonic_increasing
+    assert not sample["id"].equals(pd.Series(range(200), name="id"))  # Drawn from the whole file
+    assert sample.equals(load_dataset(csv_path, chunksize=128, max_rows=200, sampling="random"))  # Seeded
+
+
+def test_column_mixing_numbers_and_text_across_chunks_matches_one_shot_read(tmp_path):
+    path = tmp_path / "mixed.csv"
+    pd.DataFrame({"code": [str(i) for i in range(300)] + ["A1", "B2"]}).to_csv(path, index=False)
+
+    chunked = load_dataset(str(path), chunksize=100)
+
+    pd.testing.assert_frame_equal(chunked, load_dataset(str(path)))
+
+
+@pytest.mark.parametrize("suffix, write", [
+    (".parquet", lambda df, path: df.to_parquet(path, index=False)),
+    (".feather", lambda df, path: df.to_feather(path)),
+])
+def test_arrow_formats_match_csv(tmp_path, frame, csv_path, suffix, write):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / f"data{suffix}")
+    write(frame, path)
+    expected = load_dataset(csv_path)
+
+    pd.testing.assert_frame_equal(load_dataset(path), expected)
+    pd.testing.assert_frame_equal(load_dataset(path, max_rows=300), expected.head(300))
+    if suffix == ".parquet":
+        pd.testing.assert_frame_equal(load_dataset(path, chunksize=128), expected)
+
+
+def test_snapshot_round_trip(tmp_path, monkeypatch, csv_path):
+    pytest.importorskip("pyarrow")
+    from utils.dataset_cache import load_snapshot, save_snapshot
+
+    monkeypatch.setenv("EDA_SNAPSHOT_DIR", str(tmp_path / "snapshots"))
+    df = load_dataset(csv_path)
+
+    assert save_snapshot("key", df)
+    pd.testing.assert_frame_equal(load_snapshot("key"), df)
+    assert load_snapshot("other") is None
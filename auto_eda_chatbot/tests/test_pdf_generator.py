@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdf_generator import compute_report_data, generate_pdf_report, get_pdf_bytes, render_report_images
+from utils.chart_cache import get_chart_cache
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(8)
+    rows = 1500
+    frame = pd.DataFrame({
+        "age": rng.integers(18, 80, rows).astype(float),
+        "income": rng.lognormal(10, 0.5, rows),
+        "score": rng.normal(50, 10, rows),
+        "team": rng.choice(["red", "green", "blue"], rows),
+        "city": rng.choice(["oslo", "rome"], rows),
+    })
+    frame["spend"] = frame["income"] * 0.3 + rng.normal(scale=10, size=rows)
+    frame.loc[::9, "age"] = np.nan
+    frame.loc[::21, "team"] = None
+    return pd.concat([frame, frame.head(10)], ignore_index=True)
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    monkeypatch.setenv("EDA_SNAPSHOT_DIR", str(tmp_path))
+    monkeypatch.setenv("EDA_RENDER_WORKERS", "1")
+    get_chart_cache().clear()
+    yield
+    get_chart_cache().clear()
+
+
+def test_report_tables_match_pandas(df):
+    data = compute_report_data(df, approximate=False)
+
+    numeric = df.select_dtypes(include="number")
+    assert (data["rows"], data["cols"]) == df.shape
+    assert data["numeric_cols"] == list(numeric.columns)
+    np.testing.assert_array_equal(data["dtype_summary"]["Null Count"], df.isnull().sum().to_numpy())
+    np.testing.assert_array_equal(data["dtype_summary"]["Non-Null Count"], df.count().to_numpy())
+    expected = numeric.describe().round(3).T[["count", "mean", "std", "min", "max"]]
+    pd.testing.assert_frame_equal(data["numeric_stats"].drop(columns="Column"), expected, rtol=1e-9,
+                                  check_dtype=False)
+    assert data["categorical_info"] == [f"- {col}: {df[col].nunique()} unique values" for col in ["team", "city"]]
+
+
+def test_report_insights_match_pandas(df):
+    insights = compute_report_data(df, approximate=False)["insights"]
+
+    missing = df.isnull().sum().sum()
+    assert f"Missing Values: {missing} ({missing / df.size * 100:.2f}% of dataset)" in insights
+    duplicates = df.duplicated().sum()
+    assert f"Duplicate Rows: {duplicates} ({duplicates / len(df) * 100:.2f}% of dataset)" in insights
+    corr = df.corr(numeric_only=True).loc["income", "spend"]
+    assert f"Columns 'income' and 'spend' are strongly correlated ({corr:.2f})" in insights
+
+
+def test_report_lists_every_chart_and_renders(df):
+    pdf = generate_pdf_report(df, username="tester", dataset_name="people", approximate=False)
+
+    assert get_pdf_bytes(pdf).startswith(b"%PDF")
+    assert set(pdf.timings) == {"stats", "images", "assemble"}
+    images = render_report_images(df, compute_report_data(df, approximate=False))
+    assert all(png is not None for png in images.values())
+    assert list(images) == [("histogram", "age"), ("histogram", "income"), ("histogram", "score"), "correlation",
+                          ("categorical", "team"), ("categorical", "city")]
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.profiler import merge_moments, profile_column, profile_data
+from eda.stats import get_dataset_stats
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(11)
+    rows = 5000
+    amount = rng.gamma(2.0, 50.0, rows)
+    amount[rng.random(rows) < 0.05] = np.nan
+    # Distinct frequencies, so the order of value_counts has no ties
+    city = np.repeat(["paris", "berlin", "rome", "oslo", "lima"], [2000, 1500, 900, 400, 200])
+    return pd.DataFrame({
+        "amount": amount,
+        "items": rng.integers(0, 40, rows),
+        "city": pd.Series(rng.permutation(city)).where(rng.random(rows) > 0.02),
+    })
+
+
+@pytest.mark.parametrize("col", ["amount", "items"])
+def test_numeric_profile_matches_describe(df, col):
+    profile = profile_column(df[col])
+    expected = df[col].describe()
+
+    summary = {"count": profile["count"], "mean": profile["mean"], "std": profile["std"], "min": profile["min"],
+               "25%": profile["quantiles"][0.25], "50%": profile["quantiles"][0.5],
+               "75%": profile["quantiles"][0.75], "max": profile["max"]}
+    pd.testing.assert_series_equal(pd.Series(summary, dtype="float64"), expected, check_names=False, rtol=1e-9)
+    assert profile["distinct"] == df[col].nunique()
+    assert profile["nulls"] == df[col].isna().sum()
+
+
+def test_top_values_match_value_counts(df):
+    profile = profile_column(df["city"], top_k=3)
+
+    assert profile["top_values"] == list(df["city"].value_counts().head(3).items())
+    assert profile["distinct"] == df["city"].nunique()
+    assert profile["nulls"] == df["city"].isna().sum()
+
+
+def test_profile_data_missing_values_match_isna(df):
+    report = profile_data(df, max_workers=2)
+
+    assert report["missing_values"] == df.isna().sum().to_dict()
+    assert (report["rows"], report["columns"]) == df.shape
+
+
+def test_merged_moments_match_whole_column(df):
+    values = df["amount"].dropna().to_numpy()
+    halves = [values[:1234], values[1234:]]
+
+    count, mean, m2 = merge_moments(*[(len(h), h.mean(), ((h - h.mean()) ** 2).sum()) for h in halves])
+
+    assert count == len(values)
+    assert mean == pytest.approx(values.mean(), rel=1e-12)
+    assert m2 / (count - 1) == pytest.approx(values.var(ddof=1), rel=1e-12)
+
+
+def test_exact_dataset_stats_describe_like_pandas(df):
+    stats = get_dataset_stats(df, approximate=False)
+
+    pd.testing.assert_frame_equal(stats.describe_numeric(), df[stats.numeric_cols].describe(), rtol=1e-9,
+                                  check_dtype=False)
+    pd.testing.assert_series_equal(stats.top_values("city", 5), df["city"].value_counts().head(5),
+                                   check_names=False, check_index_type=False)
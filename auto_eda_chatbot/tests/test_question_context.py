@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+
+from chat.question_context import QuestionContext
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "name": ["Ada", "Alan"],
+        "salary": [100.0, 120.0],
+        "city": ["London", "Paris"],
+        "years_of_experience": [5, 7],
+        "category": pd.Series(["a", "b"], dtype="category"),
+        "active": [True, False],
+    })
+
+
+def test_column_lists_match_select_dtypes(df):
+    context = QuestionContext(df)
+
+    assert context.numeric_cols == tuple(df.select_dtypes(include=["number"]).columns)
+    assert context.categorical_cols == tuple(df.select_dtypes(include=["object", "category", "bool"]).columns)
+
+
+def test_find_columns_in_column_order(df):
+    context = QuestionContext(df)
+
+    found = context.find_columns("Average SALARY by city for each name?")
+
+    assert found == ["name", "salary", "city"]
+
+
+def test_find_columns_uses_synonyms_and_whole_words(df):
+    context = QuestionContext(df)
+
+    assert context.find_columns("salaries across cities") == ["salary", "city"]
+    assert context.find_columns("years of experience vs categories") == ["years_of_experience", "category"]
+    assert context.find_columns("citywide totals") == []  # "citywide" is not the word "city"
+
+
+def test_find_numeric_columns(df):
+    context = QuestionContext(df)
+
+    assert context.find_numeric_columns("salary by city and years_of_experience") == ["salary", "years_of_experience"]
@@ -0,0 +1,68 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda import render_pool
+from eda.render_pool import RenderJob, render_charts
+from utils.chart_cache import get_chart_cache
+
+
+def hist_chart(df, col, bins=20):
+    fig, ax = plt.subplots()
+    ax.hist(df[col].dropna(), bins=bins)
+    return fig
+
+
+def bar_chart(labels, heights):
+    fig, ax = plt.subplots()
+    ax.bar(labels, heights)
+    return fig
+
+
+def broken_chart(df):
+    raise ValueError("cannot draw")
+
+
+@pytest.fixture
+def df():
+    rng = np.random.default_rng(4)
+    return pd.DataFrame({"a": rng.normal(size=2000), "b": rng.exponential(size=2000)})
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """Fresh chart cache and render pool; snapshots in a temporary directory"""
+    monkeypatch.setenv("EDA_SNAPSHOT_DIR", str(tmp_path))
+    get_chart_cache().clear()
+    yield
+    render_pool._reset_pool()
+    get_chart_cache().clear()
+
+
+def _jobs():
+    return [RenderJob(hist_chart, ("a",), columns=["a"]),
+            RenderJob(hist_chart, ("b",), {"bins": 5}, columns=["b"], bins=5),
+            RenderJob(bar_chart, (["x", "y"], [1, 3]), chart_type="bar", uses_frame=False),
+            RenderJob(broken_chart)]
+
+
+def test_pool_matches_in_process_rendering(df):
+    local = render_charts(df, _jobs(), max_workers=1)
+    get_chart_cache().clear()
+
+    pooled = render_charts(df, _jobs(), max_workers=2)
+
+    assert pooled == local
+    assert all(png.startswith(b"\x89PNG") for png in pooled[:3])
+    assert pooled[3] is None  # A failing chart does not stop the batch
+
+
+def test_rendered_charts_come_from_the_cache(df, monkeypatch):
+    first = render_charts(df, _jobs(), max_workers=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("chart rendered twice")
+    monkeypatch.setattr(render_pool, "_render", fail)
+
+    assert render_charts(df.copy(), _jobs()[:3], max_workers=1) == first[:3]
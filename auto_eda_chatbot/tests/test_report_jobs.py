@@ -0,0 +1,47 @@
+import json
+import os
+import socket
+import time
+
+from report_jobs import ReportJobQueue, _status_path, _write_atomic
+
+
+def _store(directory, job_id, **fields):
+    os.makedirs(directory, exist_ok=True)
+    status = {"id": job_id, "state": "done", "created": time.time(), **fields}
+    _write_atomic(_status_path(directory, job_id), json.dumps(status).encode("utf-8"))
+
+
+def test_jobs_are_listed_per_owner_id_not_display_name(tmp_path):
+    queue = ReportJobQueue(str(tmp_path))
+    _store(queue.directory, "a", owner="user:ann", username="User")
+    _store(queue.directory, "b", owner="session:1f2e", username="User")
+
+    assert [job["id"] for job in queue.jobs(owner="user:ann")] == ["a"]
+    assert [job["id"] for job in queue.jobs(owner="session:1f2e")] == ["b"]
+    assert queue.jobs(owner="User") == []
+
+
+def test_unfinished_job_of_a_live_process_is_not_interrupted(tmp_path):
+    queue = ReportJobQueue(str(tmp_path))
+    now = time.time()
+    _store(queue.directory, "live", owner="o", state="running", worker_pid=os.getppid(), host=socket.gethostname(),
+           updated=now)
+    _store(queue.directory, "stale", owner="o", state="running", worker_pid=1, host="elsewhere", updated=now - 10**5)
+
+    states = {job["id"]: job["state"] for job in queue.jobs(owner="o")}
+
+    assert states == {"live": "running", "stale": "failed"}
+
+
+def test_concurrent_status_writes_never_leave_a_torn_file(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = _status_path(str(tmp_path), "job")
+    payloads = [json.dumps({"id": "job", "message": str(index) * 20000}).encode("utf-8") for index in range(8)]
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda payload: _write_atomic(path, payload), payloads * 10))
+
+    with open(path, "rb") as f:
+        assert f.read() in payloads
+    assert os.listdir(tmp_path) == ["job.json"]
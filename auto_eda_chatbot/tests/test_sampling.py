@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.sampling import lttb, minmax_decimate, sample_scatter
+
+
+@pytest.fixture
+def series():
+    """Noisy sine wave with a spike and a few gaps"""
+    rng = np.random.default_rng(9)
+    values = pd.Series(np.sin(np.linspace(0, 20, 50_000)) + rng.normal(scale=0.05, size=50_000))
+    values[31_337] = 5.0
+    values[::997] = np.nan
+    return values
+
+
+def test_minmax_keeps_every_bucket_envelope(series):
+    positions = minmax_decimate(series, n_out=400)
+
+    present = series.dropna().reset_index(drop=True)
+    buckets = np.repeat(np.arange(200), np.diff(np.linspace(0, len(present), 201).astype(np.intp)))
+    envelope = present.groupby(buckets).agg(["min", "max"])
+    kept = series.iloc[positions].reset_index(drop=True)
+    kept_buckets = buckets[np.searchsorted(series.dropna().index, positions)]
+    np.testing.assert_array_equal(kept.groupby(kept_buckets).agg(["min", "max"]).to_numpy(), envelope.to_numpy())
+    assert len(positions) <= 400 and np.all(np.diff(positions) > 0)
+
+
+def test_lttb_keeps_endpoints_and_extremes(series):
+    positions = lttb(series, n_out=500)
+
+    present = series.dropna()
+    assert len(positions) == 500 and np.all(np.diff(positions) > 0)
+    assert positions[0] == present.index[0] and positions[-1] == present.index[-1]
+    assert {present.idxmax(), present.idxmin()} <= set(positions)
+    assert series.iloc[positions].notna().all()
+
+
+def test_small_series_are_returned_whole(series):
+    head = series.head(100)
+
+    np.testing.assert_array_equal(lttb(head, n_out=500), np.flatnonzero(head.notna()))
+    np.testing.assert_array_equal(minmax_decimate(head, n_out=500), np.flatnonzero(head.notna()))
+
+
+def test_scatter_sample_preserves_density_and_outliers():
+    rng = np.random.default_rng(2)
+    frame = pd.DataFrame(rng.normal(size=(100_000, 2)), columns=["x", "y"])
+    frame.loc[0] = [40.0, -40.0]
+
+    positions = sample_scatter(frame["x"], frame["y"], n_out=5_000, bins=10, seed=1)
+
+    assert 0 in positions
+    assert len(positions) <= 5_000 + 100
+    cells = pd.DataFrame({"x": pd.cut(frame["x"], 10, labels=False), "y": pd.cut(frame["y"], 10, labels=False)})
+    full = cells.value_counts(normalize=True)
+    sample = cells.iloc[positions].value_counts(normalize=True).reindex(full.index)
+    assert sample.notna().all()  # Every occupied cell keeps a point
+    dense = full[full > 0.05].index
+    np.testing.assert_allclose(sample[dense], full[dense], atol=0.01)
+    np.testing.assert_array_equal(positions, sample_scatter(frame["x"], frame["y"], n_out=5_000, bins=10, seed=1))
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.profiler import profile_chunks
+from eda.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+def _chunks(values, size):
+    return [values[start:start + size] for start in range(0, len(values), size)]
+
+
+@pytest.fixture
+def values():
+    """Skewed integers: a few heavy hitters and a long tail"""
+    rng = np.random.default_rng(5)
+    return pd.Series(rng.zipf(1.3, 300_000) % 200_000)
+
+
+@pytest.mark.parametrize("distinct", [500, 150_000])
+def test_hyperloglog_within_error_bound(distinct):
+    rng = np.random.default_rng(distinct)
+    values = pd.Series(rng.integers(0, distinct, 3 * distinct))
+    expected = values.nunique()
+    sketches = [HyperLogLog().update(chunk) for chunk in _chunks(values, 50_000)]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    # Four standard errors
+    assert abs(merged.estimate() - expected) <= 4 * merged.relative_error * expected
+
+
+def test_kll_quantile_ranks_within_error_bound():
+    rng = np.random.default_rng(9)
+    values = rng.normal(size=400_000)
+    sketches = [KLLSketch(seed=index).update(chunk) for index, chunk in enumerate(_chunks(values, 60_000))]
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+
+    qs = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+    ranks = np.searchsorted(np.sort(values), merged.quantiles(qs)) / len(values)
+
+    assert len(merged) < 5000  # Bounded size
+    np.testing.assert_array_less(np.abs(ranks - qs), 2 * merged.rank_error)
+
+
+def test_space_saving_counts_bound_the_true_counts(values):
+    sketch = SpaceSaving(capacity=50)
+    for chunk in _chunks(values, 40_000):
+        sketch.update(chunk)
+    true_counts = values.value_counts()
+
+    top = sketch.top(10)
+    for value, count, error in top:
+        assert true_counts[value] <= count <= true_counts[value] + error
+    assert [value for value, _, _ in top] == true_counts.index[:10].tolist()
+    # Anything left out of the summary occurred at most floor times
+    missing = true_counts.drop(sketch.counts.index, errors="ignore")
+    assert missing.max() <= sketch.floor
+
+
+def test_approximate_profile_close_to_exact(values):
+    frame = pd.DataFrame({"v": values.astype("float64")})
+    profile = profile_chunks(_chunks(frame, 70_000))["v"]
+    exact = frame["v"].describe()
+
+    assert profile["count"] == exact["count"]
+    assert profile["mean"] == pytest.approx(exact["mean"], rel=1e-9)
+    assert profile["std"] == pytest.approx(exact["std"], rel=1e-9)
+    assert (profile["min"], profile["max"]) == (exact["min"], exact["max"])
+    assert abs(profile["distinct"] - values.nunique()) <= 4 * profile["error_bounds"]["distinct"] * values.nunique()
+    error = 2 * profile["error_bounds"]["quantiles"]
+    for q in (0.25, 0.5, 0.75):
+        # Heavy ties: q must fall within the rank range the estimate covers
+        estimate = profile["quantiles"][q]
+        assert (frame["v"] < estimate).mean() - error <= q <= (frame["v"] <= estimate).mean() + error
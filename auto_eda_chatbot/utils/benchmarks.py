@@ -0,0 +1,151 @@
+"""
+Benchmarks Module
+=================
+Micro-benchmarks comparing optimized data paths against the code they replaced.
+
+Run from the auto_eda_chatbot directory:
+    python -m utils.benchmarks
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import normalize_strings
+from eda.profiler import profile_columns
+
+
+def _best_of(func, repeat):
+    """Best wall-clock time of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def _legacy_normalize_strings(series):
+    """The per-row normalization load_dataset used before normalize_strings"""
+    return series.astype(str).str.strip().str.lower()
+
+
+def make_repetitive_strings(n_rows=1_000_000, n_unique=50, null_fraction=0.05, seed=0):
+    """Department/city-like column: few distinct values with messy case and padding"""
+    rng = np.random.default_rng(seed)
+    vocabulary = np.array([f"  Value {i} " if i % 2 else f"VALUE {i}" for i in range(n_unique)], dtype=object)
+    values = vocabulary[rng.integers(0, n_unique, n_rows)]
+    values[rng.random(n_rows) < null_fraction] = None
+    return pd.Series(values, name="department")
+
+
+def benchmark_normalization(n_rows=1_000_000, n_unique=50, repeat=3):
+    """
+    Compare normalize_strings against the legacy astype(str).str.strip().str.lower() path.
+
+    Returns a dict with both timings (seconds), the speedup, and whether the
+    outputs agree on every non-null row.
+    """
+    series = make_repetitive_strings(n_rows, n_unique)
+
+    legacy_time = _best_of(lambda: _legacy_normalize_strings(series), repeat)
+    new_time = _best_of(lambda: normalize_strings(series), repeat)
+
+    legacy = _legacy_normalize_strings(series)
+    optimized = normalize_strings(series)
+    present = series.notna()
+
+    return {
+        "rows": n_rows,
+        "unique_values": n_unique,
+        "legacy_seconds": legacy_time,
+        "optimized_seconds": new_time,
+        "speedup": legacy_time / new_time if new_time else float("inf"),
+        "outputs_match": bool(legacy[present].equals(optimized[present])),
+        "nulls_preserved": bool(optimized[~present].isna().all()),
+    }
+
+
+def _legacy_profile(df, top_k=10):
+    """Per-column statistics as the app computed them before: one pandas call (full pass) each"""
+    profiles = {}
+    numeric_cols = df.select_dtypes(include=['number']).columns
+    for col in df.columns:
+        col_data = df[col]
+        profile = {
+            "nulls": col_data.isnull().sum(),
+            "distinct": col_data.nunique(),
+            "top_values": col_data.value_counts().head(top_k),
+        }
+        if col in numeric_cols:
+            profile.update({
+                "min": col_data.min(),
+                "max": col_data.max(),
+                "mean": col_data.mean(),
+                "std": col_data.std(),
+                "quantiles": col_data.quantile([0.25, 0.5, 0.75]),
+            })
+        profiles[col] = profile
+    return profiles
+
+
+def make_mixed_frame(n_rows=1_000_000, n_numeric=8, n_categorical=4, seed=0):
+    """Mixed frame: integer/float measures with some nulls plus low-cardinality categories"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(n_numeric):
+        if i % 2:
+            data[f"amount_{i}"] = np.round(rng.gamma(2.0, 500.0, n_rows), 2)
+            data[f"amount_{i}"][rng.random(n_rows) < 0.02] = np.nan
+        else:
+            data[f"count_{i}"] = rng.integers(0, 1_000, n_rows)
+    for i in range(n_categorical):
+        data[f"category_{i}"] = pd.Categorical.from_codes(rng.integers(0, 20, n_rows),
+                                                          [f"group {j}" for j in range(20)]).astype(object)
+    return pd.DataFrame(data)
+
+
+def benchmark_profiler(n_rows=1_000_000, repeat=3):
+    """
+    Compare the fused single-pass profiler against separate pandas calls per statistic.
+
+    Returns a dict with both timings (seconds), the speedup, and whether the
+    means and quartiles agree.
+    """
+    df = make_mixed_frame(n_rows)
+
+    legacy_time = _best_of(lambda: _legacy_profile(df), repeat)
+    single_thread_time = _best_of(lambda: profile_columns(df, max_workers=1), repeat)
+    fused_time = _best_of(lambda: profile_columns(df), repeat)
+
+    legacy = _legacy_profile(df)
+    fused = profile_columns(df)
+    numeric_cols = df.select_dtypes(include=['number']).columns
+    outputs_match = all(
+        np.isclose(legacy[col]["mean"], fused[col]["mean"])
+        and np.allclose(legacy[col]["quantiles"].values, list(fused[col]["quantiles"].values()))
+        and legacy[col]["distinct"] == fused[col]["distinct"]
+        for col in numeric_cols
+    )
+
+    return {
+        "rows": n_rows,
+        "columns": df.shape[1],
+        "legacy_seconds": legacy_time,
+        "fused_single_thread_seconds": single_thread_time,
+        "fused_seconds": fused_time,
+        "speedup": legacy_time / fused_time if fused_time else float("inf"),
+        "outputs_match": bool(outputs_match),
+    }
+
+
+def _print_result(title, result):
+    print(f"\n{title}")
+    for key, value in result.items():
+        print(f"  {key:>28}: {value:.4f}" if isinstance(value, float) else f"  {key:>28}: {value}")
+
+
+if __name__ == "__main__":
+    _print_result("String normalization", benchmark_normalization())
+    _print_result("Column profiling", benchmark_profiler())
@@ -0,0 +1,232 @@
+"""
+Chart Cache Module
+==================
+Cache of rendered charts keyed by dataset, chart type and chart parameters.
+
+Streamlit re-executes every chart function on each rerun, so switching a
+selectbox back to a column already shown rebuilds and re-rasterizes the same
+figure. Charts are stored in their final form instead: PNG bytes for
+matplotlib figures and JSON for Plotly figures. Keys combine the dataset
+fingerprint, the chart type, the selected columns, any other parameters, the
+output size and the active matplotlib theme.
+
+Entries are evicted least-recently-used once the in-memory cache exceeds its
+byte budget. Setting EDA_CHART_CACHE_DIR adds an on-disk tier that survives
+restarts and is shared between worker processes.
+"""
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from .dataset_cache import dataset_fingerprint
+
+# Default memory budget for rendered charts (override with EDA_CHART_CACHE_MB)
+DEFAULT_CHART_CACHE_MB = 128
+
+# Default on-disk budget when EDA_CHART_CACHE_DIR is set (override with EDA_CHART_CACHE_DISK_MB)
+DEFAULT_CHART_DISK_MB = 512
+
+# Raster settings matching st.pyplot, so cached images look the same as direct ones
+PNG_DPI = 200
+
+# rcParams that change how a chart looks; part of every key
+THEME_PARAMS = ('figure.facecolor', 'axes.facecolor', 'axes.edgecolor', 'axes.labelcolor', 'axes.prop_cycle',
+                'text.color', 'xtick.color', 'ytick.color', 'grid.color', 'font.family', 'font.size')
+
+
+def theme_token() -> str:
+    """Short hash of the active matplotlib theme"""
+    rc = matplotlib.rcParams
+    return hashlib.blake2b(repr([rc[name] for name in THEME_PARAMS]).encode("utf-8"), digest_size=6).hexdigest()
+
+
+def chart_key(df, chart_type: str, columns=(), **params) -> str:
+    """Cache key of one chart of a dataset version"""
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(dataset_fingerprint(df).encode("utf-8"))
+    hasher.update(f"|{chart_type}|{[str(col) for col in columns]!r}|{theme_token()}".encode("utf-8"))
+    for key in sorted(params):
+        hasher.update(f"|{key}={params[key]!r}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def png_chart_key(df, chart_type: str, columns=(), width: float = 5, height: float = 3, **params) -> str:
+    """Cache key of a matplotlib chart rendered to PNG at the given size"""
+    return chart_key(df, chart_type, columns, kind="png", width=width, height=height, **params)
+
+
+def figure_png(fig, width: Optional[float] = None, height: Optional[float] = None, **savefig) -> bytes:
+    """Rasterize a matplotlib figure like st.pyplot does (savefig options override), then close it"""
+    try:
+        if width is not None and height is not None:
+            fig.set_size_inches(width, height)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **{"format": "png", "dpi": PNG_DPI, "bbox_inches": "tight", **savefig})
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+class ChartCache:
+    """Thread-safe LRU cache of rendered charts bounded by total size in bytes"""
+
+    def __init__(self, max_bytes: Optional[int] = None, disk_dir: Optional[str] = None):
+        if max_bytes is None:
+            max_bytes = int(os.getenv("EDA_CHART_CACHE_MB", DEFAULT_CHART_CACHE_MB)) * 1024 ** 2
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir if disk_dir is not None else os.getenv("EDA_CHART_CACHE_DIR") or None
+        self._entries = OrderedDict()  # key -> bytes
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached payload for key from memory or disk, or None"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+
+        payload = self._read_disk(key)
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._put_memory(key, payload)
+        return payload
+
+    def put(self, key: str, payload: bytes):
+        self._put_memory(key, payload)
+        self._write_disk(key, payload)
+
+    def _put_memory(self, key: str, payload: bytes):
+        size = len(payload)
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= len(self._entries.pop(key))
+            if size > self.max_bytes:
+                return
+            self._entries[key] = payload
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.chart")
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                payload = f.read()
+            os.utime(path)  # Mark as recently used for pruning
+            return payload
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, payload: bytes):
+        """Best-effort write; a full or read-only disk only disables the tier"""
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Delete least-recently-used chart files beyond the on-disk budget"""
+        max_bytes = int(os.getenv("EDA_CHART_CACHE_DISK_MB", DEFAULT_CHART_DISK_MB)) * 1024 ** 2
+        entries = []
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(".chart"):
+                path = os.path.join(self.disk_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+# Process-wide cache shared by every Streamlit session
+_chart_cache = ChartCache()
+
+
+def get_chart_cache() -> ChartCache:
+    return _chart_cache
+
+
+def cached_figure_png(df, chart_type: str, build: Callable, columns=(), width: float = 5, height: float = 3,
+                      **params) -> Optional[bytes]:
+    """
+    PNG bytes of a matplotlib chart, rendered at most once per key.
+
+    build() returns the figure (or None when the chart cannot be drawn, which
+    is not cached). params are any further chart options that change the
+    picture, e.g. ``top_n=10``.
+    """
+    key = png_chart_key(df, chart_type, columns, width, height, **params)
+    payload = _chart_cache.get(key)
+    if payload is None:
+        fig = build()
+        if fig is None:
+            return None
+        payload = figure_png(fig, width, height)
+        _chart_cache.put(key, payload)
+    return payload
+
+
+def cached_plotly_json(df, chart_type: str, build: Callable, columns=(), **params) -> Optional[str]:
+    """Serialized JSON of a Plotly chart, built at most once per key"""
+    key = chart_key(df, chart_type, columns, kind="plotly", **params)
+    payload = _chart_cache.get(key)
+    if payload is None:
+        fig = build()
+        if fig is None:
+            return None
+        payload = fig.to_json().encode("utf-8")
+        _chart_cache.put(key, payload)
+    return payload.decode("utf-8")
@@ -1,3 +1,6 @@
+import re
+
+import numpy as np
 import pandas as pd
 
 def load_data(file_path):
@@ -23,3 +26,149 @@ def preprocess_data(df):
                 df[col] = df[col].map({"Yes": 1, "No": 0})
     return df
 
+
+def normalize_strings(series):
+    """
+    Strip and lowercase a string column once per unique value.
+
+    The column is factorized into integer codes, only the distinct values are
+    normalized, and the result is rebuilt with a single take. Real nulls stay
+    null (the old ``astype(str)`` path turned them into the string "nan").
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    normalized = pd.Index(uniques.astype(str)).str.strip().str.lower()
+    # Values that differ only by case/whitespace collapse onto one category
+    merged_codes, categories = pd.factorize(normalized)
+
+    normalized_uniques = np.asarray(categories, dtype=object).take(merged_codes)
+    values = np.full(len(codes), np.nan, dtype=object)
+    present = codes >= 0
+    values[present] = normalized_uniques.take(codes[present])
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
+# Value pairs recognised as boolean columns (after lowercase normalization)
+BOOLEAN_VALUE_SETS = [
+    {"true", "false"},
+    {"yes", "no"},
+    {"y", "n"},
+    {"t", "f"},
+]
+
+TRUTHY_VALUES = {"true", "yes", "y", "t"}
+
+# Strings treated as missing when a column becomes bool or datetime (e.g. literal "nan" text in
+# exports); a category column keeps them as levels, since "None" can be a real answer
+NULL_TOKENS = {"", "nan", "none", "null", "nat"}
+
+# Strings shaped like ISO or day/month dates, optionally with a time part
+DATE_PATTERN = re.compile(
+    r"^\d{4}[-/.]\d{1,2}[-/.]\d{1,2}([ t]\d{1,2}:\d{2}(:\d{2}(\.\d+)?)?)?"
+    r"|^\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}$"
+)
+
+# Fraction of parseable non-null values required to convert a column to datetime
+DATE_PARSE_THRESHOLD = 0.95
+
+# Max ratio of unique values to rows for a string column to become category;
+# only clearly low-cardinality columns, since categories reject unseen values
+DEFAULT_CATEGORY_THRESHOLD = 0.05
+
+
+def optimize_dtypes(df, category_threshold=DEFAULT_CATEGORY_THRESHOLD, detect_dates=True, detect_booleans=True):
+    """
+    Infer compact dtypes for every column.
+
+    - Integers are downcast to the smallest signed type that holds them
+    - Floats become float32 when that round-trips without precision loss
+    - String columns become bool, datetime64 or category where the values allow it.
+      In bool and datetime columns the NULL_TOKENS strings ("", "nan", "none",
+      "null", "nat") become missing values; category columns and columns left
+      as strings keep them as they are
+
+    Converted columns no longer accept arbitrary writes: a category column
+    rejects values outside its categories (``fillna("new")`` raises TypeError)
+    and a bool column upcasts on NaN. Code that edits the frame afterwards
+    should load it with optimization off or convert the column back first
+    (e.g. ``df[col] = df[col].astype(object)``).
+
+    Args:
+        df: DataFrame to optimize (converted columns are replaced in place)
+        category_threshold: max ratio of unique values to rows for a category column
+        detect_dates: try parsing string columns as dates
+        detect_booleans: convert yes/no, true/false, y/n, t/f columns to bool
+
+    Returns:
+        (df, report) where report holds memory before/after in bytes and the
+        per-column dtype conversions
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    conversions = {}
+
+    for col in df.columns:
+        series = df[col]
+        converted = None
+
+        if pd.api.types.is_bool_dtype(series):
+            continue
+        elif pd.api.types.is_integer_dtype(series):
+            converted = pd.to_numeric(series, downcast="integer")
+        elif pd.api.types.is_float_dtype(series):
+            as_float32 = series.astype("float32")
+            if np.array_equal(as_float32.to_numpy(dtype="float64"), series.to_numpy(), equal_nan=True):
+                converted = as_float32
+        elif series.dtype == object:
+            converted = _infer_object_column(series, category_threshold, detect_dates, detect_booleans)
+
+        if converted is not None and converted.dtype != series.dtype:
+            df[col] = converted
+            conversions[col] = (str(series.dtype), str(converted.dtype))
+
+    after = int(df.memory_usage(deep=True).sum())
+    report = {
+        "before_bytes": before,
+        "after_bytes": after,
+        "saved_bytes": before - after,
+        "saved_pct": (before - after) / before * 100 if before else 0.0,
+        "conversions": conversions,
+    }
+    return df, report
+
+
+def _infer_object_column(series, category_threshold, detect_dates, detect_booleans):
+    """Pick bool, datetime or category for a string column, or None to keep it"""
+    # Null tokens only count as missing for the non-string conversions below
+    missing = series.isna() | series.isin(NULL_TOKENS)
+    values = series[~missing]
+    if values.empty:
+        return None
+
+    uniques = pd.unique(values)
+    if detect_booleans and len(uniques) <= 2:
+        unique_set = {str(v) for v in uniques}
+        for value_set in BOOLEAN_VALUE_SETS:
+            if unique_set <= value_set:
+                mapped = values.astype(str).isin(TRUTHY_VALUES)
+                if missing.any():
+                    result = pd.Series(pd.NA, index=series.index, dtype="boolean")
+                    result[~missing] = mapped.astype(bool)
+                    return result
+                return mapped.astype(bool)
+
+    if detect_dates and _looks_like_dates(uniques):
+        parsed = pd.to_datetime(values, errors="coerce", format="mixed")
+        if parsed.notna().mean() >= DATE_PARSE_THRESHOLD:
+            result = pd.Series(pd.NaT, index=series.index, dtype=parsed.dtype)
+            result[~missing] = parsed
+            return result
+
+    if series.nunique(dropna=True) / len(series) <= category_threshold:
+        return series.astype("category")
+
+    return None
+
+
+def _looks_like_dates(uniques, sample_size=50):
+    """Cheap pre-check so only date-shaped strings pay for pd.to_datetime"""
+    sample = [str(v) for v in uniques[:sample_size]]
+    return all(DATE_PATTERN.match(v) for v in sample)
@@ -0,0 +1,330 @@
+"""
+Dataset Cache Module
+====================
+Content-addressed cache for loaded and normalized DataFrames.
+
+Streamlit re-executes app.py on every widget interaction, so without a cache
+each slider move or tab click re-parses and re-normalizes the uploaded file.
+Datasets are keyed by a hash of the raw file bytes plus the loader options
+and LOADER_VERSION, and evicted least-recently-used once the cache exceeds its memory budget.
+
+Normalized frames are also persisted as uncompressed Arrow IPC (Feather v2)
+snapshots, so a returning session re-opens them through a memory map instead
+of re-parsing the source file.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import pandas as pd
+
+# Default memory budget for cached DataFrames (override with EDA_DATASET_CACHE_MB)
+DEFAULT_CACHE_MB = 1024
+
+# Default on-disk budget for Arrow snapshots (override with EDA_SNAPSHOT_MAX_MB)
+DEFAULT_SNAPSHOT_MB = 4096
+
+# Bump when loading or normalization changes its output, so cached and persisted parses are not reused
+LOADER_VERSION = 3
+
+
+def fingerprint_bytes(data, **options) -> str:
+    """Return a stable content hash of raw file bytes, loader options and LOADER_VERSION"""
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(memoryview(data))
+    hasher.update(f"|loader=v{LOADER_VERSION}".encode("utf-8"))
+    for key in sorted(options):
+        hasher.update(f"|{key}={options[key]!r}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def frame_memory_bytes(df: pd.DataFrame) -> int:
+    """Deep memory footprint of a DataFrame in bytes"""
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+# Fingerprints of live frames: id(df) -> (weak reference, fingerprint, signature)
+_fingerprints = {}
+_fingerprints_lock = threading.Lock()
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Return the fingerprint identifying this dataset version.
+
+    Frames produced by the cached loader are registered with the content hash
+    of the source file. A stored fingerprint is only trusted for the exact
+    object it was computed on (derived frames such as ``df.assign(...)`` are
+    other objects) and while its shape, columns and dtypes still match;
+    otherwise the frame content is hashed once and the result registered.
+    """
+    signature = _frame_signature(df)
+    with _fingerprints_lock:
+        entry = _fingerprints.get(id(df))
+    if entry is not None and entry[0]() is df and entry[2] == signature:
+        return entry[1]
+
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(signature.encode("utf-8"))
+    hasher.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    fingerprint = hasher.hexdigest()
+    _tag_frame(df, fingerprint)
+    return fingerprint
+
+
+def _frame_signature(df: pd.DataFrame) -> str:
+    # str(dtype) is slow, so render each distinct dtype once (matters for wide tables)
+    dtypes = df.dtypes.tolist()
+    names = {dtype: str(dtype) for dtype in set(dtypes)}
+    return repr((df.shape, tuple(map(str, df.columns)), tuple(names[dtype] for dtype in dtypes)))
+
+
+def _tag_frame(df: pd.DataFrame, fingerprint: str):
+    key = id(df)
+
+    def forget(ref):
+        with _fingerprints_lock:
+            if _fingerprints.get(key, (None,))[0] is ref:
+                del _fingerprints[key]
+
+    with _fingerprints_lock:
+        _fingerprints[key] = (weakref.ref(df, forget), fingerprint, _frame_signature(df))
+
+
+class DatasetCache:
+    """Thread-safe LRU cache of DataFrames bounded by total memory footprint"""
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        if max_bytes is None:
+            max_bytes = int(os.getenv("EDA_DATASET_CACHE_MB", DEFAULT_CACHE_MB)) * 1024 ** 2
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (DataFrame, size in bytes)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the cached frame for key (marking it recently used) or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, df: pd.DataFrame):
+        """Insert a frame and evict least-recently-used entries over budget"""
+        size = frame_memory_bytes(df)
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            # A single frame larger than the whole budget is not worth caching
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (df, size)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+# Process-wide cache shared by every Streamlit session
+_dataset_cache = DatasetCache()
+
+
+def get_dataset_cache() -> DatasetCache:
+    return _dataset_cache
+
+
+# Derived per-dataset structures (indexes, statistics, ...) kept per process
+DEFAULT_MEMO_ENTRIES = 64
+
+_memo_entries = OrderedDict()  # (fingerprint, name) -> value
+_memo_lock = threading.Lock()
+
+
+def dataset_memo(df: pd.DataFrame, name: str, builder: Callable):
+    """
+    Return a structure derived from df, building it once per dataset version.
+
+    Entries are keyed by the dataset fingerprint and a name, so every rerun or
+    session working on the same data shares one instance. The least recently
+    used entries are dropped beyond DEFAULT_MEMO_ENTRIES.
+    """
+    key = (dataset_fingerprint(df), name)
+    with _memo_lock:
+        if key in _memo_entries:
+            _memo_entries.move_to_end(key)
+            return _memo_entries[key]
+
+    value = builder()
+    with _memo_lock:
+        _memo_entries[key] = value
+        while len(_memo_entries) > DEFAULT_MEMO_ENTRIES:
+            _memo_entries.popitem(last=False)
+    return value
+
+
+def snapshot_dir() -> str:
+    """Directory holding Arrow snapshots (EDA_SNAPSHOT_DIR, default: system temp dir)"""
+    return os.getenv("EDA_SNAPSHOT_DIR", os.path.join(tempfile.gettempdir(), "auto_eda_snapshots"))
+
+
+def snapshot_path(key: str) -> str:
+    return os.path.join(snapshot_dir(), f"{key}.arrow")
+
+
+def save_snapshot(key: str, df: pd.DataFrame) -> Optional[str]:
+    """
+    Persist a normalized frame as an uncompressed Arrow IPC file.
+
+    Snapshots are best-effort: frames Arrow cannot represent (e.g. mixed-type
+    object columns) or a missing pyarrow install simply skip persistence.
+    """
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return None
+
+    directory = snapshot_dir()
+    path = snapshot_path(key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        feather.write_feather(df.reset_index(drop=True), tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return None
+
+    _prune_snapshots(directory)
+    return path
+
+
+def share_snapshot(df: pd.DataFrame) -> Optional[str]:
+    """Snapshot key other processes can load df from (saved on first use), or None"""
+    key = dataset_fingerprint(df)
+    if os.path.exists(snapshot_path(key)):
+        return key
+    return key if save_snapshot(key, df) else None
+
+
+def load_snapshot(key: str) -> Optional[pd.DataFrame]:
+    """Re-open a snapshot through a memory map, or return None if absent"""
+    path = snapshot_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        from pyarrow import feather
+        table = feather.read_table(path, memory_map=True)
+        df = table.to_pandas(split_blocks=True)
+    except Exception:
+        return None
+    os.utime(path)  # Mark as recently used for pruning
+    return df
+
+
+def _prune_snapshots(directory: str):
+    """Delete least-recently-used snapshots beyond the on-disk budget"""
+    max_bytes = int(os.getenv("EDA_SNAPSHOT_MAX_MB", DEFAULT_SNAPSHOT_MB)) * 1024 ** 2
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(".arrow"):
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def _load_through_cache(key: str, load: Callable) -> pd.DataFrame:
+    """Resolve key from memory, then the snapshot tier, then the loader"""
+    df = _dataset_cache.get(key)
+    if df is not None:
+        return df
+
+    df = load_snapshot(key)
+    if df is None:
+        df = load()
+        save_snapshot(key, df)
+
+    _tag_frame(df, key)
+    _dataset_cache.put(key, df)
+    return df
+
+
+def load_bytes_cached(data, file_name: str, loader: Callable, progress_callback: Optional[Callable] = None,
+                      **options) -> pd.DataFrame:
+    """
+    Load a dataset from raw file bytes through the process-wide cache.
+
+    Args:
+        data: raw file contents (bytes, bytearray or memoryview)
+        file_name: original file name, used for the extension dispatch
+        loader: callable ``loader(path, **options)`` returning a DataFrame
+        progress_callback: forwarded to the loader on a cache miss (not part of the key)
+        **options: loader options; part of the cache key
+
+    Returns:
+        The normalized DataFrame. Cached frames are shared between reruns and
+        sessions, so callers must copy before mutating.
+    """
+    suffix = os.path.splitext(file_name)[1].lower()
+    key = fingerprint_bytes(data, suffix=suffix, **options)
+    if progress_callback is not None:
+        options = dict(options, progress_callback=progress_callback)
+
+    def load():
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            tmp.write(data)
+            tmp_path = tmp.name
+        try:
+            return loader(tmp_path, **options)
+        finally:
+            os.unlink(tmp_path)
+
+    return _load_through_cache(key, load)
+
+
+def load_path_cached(path: str, loader: Callable, progress_callback: Optional[Callable] = None,
+                     **options) -> pd.DataFrame:
+    """Load a dataset from disk through the cache, keyed by file content"""
+    with open(path, "rb") as f:
+        data = f.read()
+    key = fingerprint_bytes(data, suffix=os.path.splitext(path)[1].lower(), **options)
+    if progress_callback is not None:
+        options = dict(options, progress_callback=progress_callback)
+
+    return _load_through_cache(key, lambda: loader(path, **options))
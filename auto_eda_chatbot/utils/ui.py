@@ -3,11 +3,16 @@ UI Helper Module
 ================
 Centralized chart display function to enforce consistent sizing and prevent
 visualization layout bugs. All charts MUST use this function.
+
+Charts that are redrawn on every rerun can go through the render cache with
+``show_cached_chart`` (matplotlib) and ``show_cached_plotly`` (Plotly).
 """
 
 import streamlit as st
 import matplotlib.pyplot as plt
 
+from .chart_cache import cached_figure_png, cached_plotly_json
+
 
 def show_chart(fig, width=5, height=3):
     """
@@ -45,3 +50,35 @@ def show_chart_square(fig, size=5):
     fig.set_size_inches(size, size)
     st.pyplot(fig, width="content")
     plt.close(fig)
+
+
+def show_cached_chart(df, chart_type, build, columns=(), width=5, height=3, **params):
+    """
+    Display a matplotlib chart through the render cache.
+    
+    Args:
+        df: dataset the chart is drawn from (its fingerprint is part of the key)
+        chart_type: name of the chart, e.g. "column_chart"
+        build: callable returning the figure, or None if it cannot be drawn
+        columns: selected columns
+        width, height: chart size in inches, as in show_chart
+        **params: other options that change the chart
+    
+    Returns:
+        True if a chart was displayed
+    """
+    png = cached_figure_png(df, chart_type, build, columns=columns, width=width, height=height, **params)
+    if png is None:
+        return False
+    st.image(png, output_format="PNG")
+    return True
+
+
+def show_cached_plotly(df, chart_type, build, columns=(), **params):
+    """Display a Plotly chart through the render cache (see show_cached_chart)"""
+    payload = cached_plotly_json(df, chart_type, build, columns=columns, **params)
+    if payload is None:
+        return False
+    import plotly.io as pio
+    st.plotly_chart(pio.from_json(payload, skip_invalid=True), use_container_width=True)
+    return True